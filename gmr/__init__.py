@@ -1,4 +1,13 @@
 from . import utils
 from ._version import __version__
+from .utils._checks import trusted_input
 from .utils.config import sys_info
-from .utils.logs import add_file_handler, set_log_level
+from .utils.logs import (
+    add_file_handler,
+    set_log_level,
+    start_log_listener,
+    stop_log_listener,
+    use_log_queue,
+)
+from .utils.profiling import MemoryProfiler
+from .utils.tracing import TraceRecorder, merge_traces
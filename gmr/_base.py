@@ -1,8 +1,34 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from io import BytesIO
+from typing import TYPE_CHECKING
 
-from .utils._checks import check_type
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from .utils._checks import check_type, check_value
+from .utils.profiling import memory_phase
+from .utils.tracing import span
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    from typing import IO
+
+    from numpy.typing import NDArray
+
+_FORMATS: tuple[str, ...] = ("png", "svg", "pdf")
+# metadata and salt of the SVG identifiers pinned in deterministic mode, the creation
+# dates are removed and the identifiers derived from a fixed salt instead of a random
+# one
+_DETERMINISTIC_METADATA: dict[str, dict[str, None]] = {
+    "png": {},
+    "svg": {"Date": None},
+    "pdf": {"CreationDate": None},
+}
+_SVG_HASHSALT: str = "gmr"
 
 
 class BaseElement(ABC):
@@ -48,3 +74,151 @@ class BaseElement(ABC):
     @abstractmethod
     def height(self) -> float:
         """The height of the element."""
+
+
+class BaseFigure(ABC):
+    """A base class for all figures, providing the in-memory outputs.
+
+    Subclasses create the matplotlib figure and axes as ``self._fig`` and ``self._ax``
+    in their :meth:`draw` method.
+    """
+
+    @abstractmethod
+    def __init__(self) -> None:
+        self._buffer = None
+
+    @abstractmethod
+    def draw(self, *args, **kwargs) -> None:
+        pass
+
+    def to_array(self) -> NDArray[np.uint8]:
+        """Render the figure and return the RGBA pixels of the Agg canvas.
+
+        The pixels are not encoded and decoded through an image format: the returned
+        array is a zero-copy view on the buffer of the Agg renderer.
+
+        Returns
+        -------
+        array : array of shape (height, width, 4)
+            Read-only view on the RGBA buffer of the canvas, in ``uint8``.
+
+        Notes
+        -----
+        The view shares its memory with the renderer. It is valid until the figure is
+        rendered again, as a new rendering overwrites the same buffer in place, or until
+        the figure is resized, its DPI changed or closed, after which the view holds the
+        stale pixels of the previous rendering. Copy the array to keep the pixels of a
+        given rendering.
+
+        If the canvas of the figure is not based on Agg, e.g. with a vector backend, it
+        is replaced by an Agg canvas.
+        """
+        self._check_drawn()
+        canvas = self._fig.canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            canvas = FigureCanvasAgg(self._fig)
+        with self._phase("save"), span("render"):
+            canvas.draw()
+        array = np.asarray(canvas.buffer_rgba())
+        array.flags.writeable = False
+        return array
+
+    def to_bytes(
+        self,
+        format: str = "png",  # noqa: A002
+        *,
+        dpi: float | None = None,
+        deterministic: bool = False,
+    ) -> bytes:
+        """Render the figure in memory and return the encoded bytes.
+
+        The figure is rendered into an in-memory buffer reused across calls, without
+        touching the disk.
+
+        Parameters
+        ----------
+        format : str
+            The output format, one of ``'png'``, ``'svg'`` or ``'pdf'``.
+        dpi : float | None
+            The resolution in dots per inch. If None, the DPI of the figure is used.
+        deterministic : bool
+            If True, the output is deterministic, see :meth:`write_to`.
+
+        Returns
+        -------
+        data : bytes
+            The encoded figure.
+        """
+        if self._buffer is None:
+            self._buffer = BytesIO()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        with span("encode", format=format):
+            self.write_to(self._buffer, format, dpi=dpi, deterministic=deterministic)
+        return self._buffer.getvalue()
+
+    def write_to(
+        self,
+        fileobj: IO[bytes],
+        format: str = "png",  # noqa: A002
+        *,
+        dpi: float | None = None,
+        deterministic: bool = False,
+    ) -> None:
+        """Render the figure and stream the encoded bytes to a binary file-like object.
+
+        Parameters
+        ----------
+        fileobj : file-like
+            The binary file-like object to write to, e.g. an open file, a socket file or
+            a :class:`~io.BytesIO`.
+        format : str
+            The output format, one of ``'png'``, ``'svg'`` or ``'pdf'``.
+        dpi : float | None
+            The resolution in dots per inch. If None, the DPI of the figure is used.
+        deterministic : bool
+            If True, the creation date is omitted from the metadata and the identifiers
+            of the SVG elements are derived from a fixed salt, such that an identical
+            figure is always encoded into identical bytes, e.g. for caching or
+            content-addressed storage.
+        """
+        self._check_drawn()
+        check_type(format, (str,), "format")
+        check_value(format, _FORMATS, "format")
+        check_type(dpi, ("numeric", None), "dpi")
+        if dpi is not None and dpi <= 0:
+            raise ValueError(f"The DPI must be strictly positive, got {dpi}.")
+        check_type(deterministic, (bool,), "deterministic")
+        with (
+            self._phase("save"),
+            span("save", format=format),
+            plt.rc_context({"svg.hashsalt": _SVG_HASHSALT})
+            if deterministic
+            else nullcontext(),
+        ):
+            self._fig.savefig(
+                fileobj,
+                format=format,
+                dpi="figure" if dpi is None else dpi,
+                metadata=_DETERMINISTIC_METADATA[format] if deterministic else None,
+            )
+
+    def _phase(self, phase: str) -> AbstractContextManager[None]:
+        """Record the memory of a render phase, see :class:`~gmr.MemoryProfiler`."""
+        return memory_phase(
+            self._fig, getattr(self, "_name", type(self).__name__), phase
+        )
+
+    def _check_drawn(self) -> None:
+        """Check that the figure was drawn."""
+        if not hasattr(self, "_fig"):
+            raise RuntimeError("The figure must be drawn first.")
+
+    def close(self) -> None:
+        """Close the matplotlib figure and release its memory."""
+        self._buffer = None  # the last encoded output
+        if not hasattr(self, "_fig"):
+            return None
+        plt.close(self._fig)
+        del self._fig
+        del self._ax
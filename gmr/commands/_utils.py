@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def expand_sources(sources: tuple[Path, ...]) -> list[Path]:
+    """Expand the directories of game specifications into their specification files.
+
+    Parameters
+    ----------
+    sources : tuple of Path
+        Game specification files, or directories of which the ``'.json'`` and
+        ``'.toml'`` files are selected.
+
+    Returns
+    -------
+    fnames : list of Path
+        The game specification files.
+    """
+    fnames = []
+    for source in sources:
+        if source.is_dir():
+            fnames.extend(
+                sorted(
+                    fname
+                    for fname in source.iterdir()
+                    if fname.suffix in (".json", ".toml")
+                )
+            )
+        else:
+            fnames.append(source)
+    return fnames
+
+
+def write_if_changed(fname: Path, data: bytes) -> bool:
+    """Write the data to a file, unless the file already holds identical data.
+
+    Parameters
+    ----------
+    fname : Path
+        The file to write.
+    data : bytes
+        The content of the file.
+
+    Returns
+    -------
+    written : bool
+        True if the file was written, False if its content was unchanged.
+    """
+    if fname.is_file() and fname.stat().st_size == len(data):
+        if fname.read_bytes() == data:
+            return False
+    fname.write_bytes(data)
+    return True
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import click
 
+from .pack import run as pack
+from .render import run as render
 from .sys_info import run as sys_info
 
 
@@ -10,4 +12,6 @@ def run() -> None:
     """Main package entry-point."""  # noqa: D401
 
 
+run.add_command(pack)
+run.add_command(render)
 run.add_command(sys_info)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from ..corpus import Corpus
+from ._utils import expand_sources
+
+
+@click.command(name="pack")
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "-o",
+    "--output",
+    help="Path to the packed '.gmrc' corpus file.",
+    required=True,
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--overwrite",
+    help="Overwrite an existing packed corpus file.",
+    is_flag=True,
+)
+def run(sources: tuple[Path, ...], output: Path, overwrite: bool) -> None:
+    """Pack JSON or TOML game specifications into a binary corpus file.
+
+    SOURCES are game specification files, or directories of which the '.json' and
+    '.toml' files are packed.
+    """
+    corpus = Corpus.from_files(expand_sources(sources))
+    corpus.save(output, overwrite=overwrite)
+    click.echo(f"Packed {len(corpus)} game(s) into '{output}'.")
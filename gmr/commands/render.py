@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, wait
+from pathlib import Path
+
+import click
+
+from .._base import _FORMATS
+from ..pool import RenderPool
+from ..render import render
+from ..utils.logs import start_log_listener, stop_log_listener
+from ._utils import expand_sources, write_if_changed
+
+
+@click.command(name="render")
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "-o",
+    "--output",
+    help="Directory in which the figures are written.",
+    required=True,
+    type=click.Path(file_okay=False, path_type=Path),
+)
+@click.option(
+    "-f",
+    "--format",
+    "format_",
+    help="Format of the figures.",
+    type=click.Choice(_FORMATS),
+    default="png",
+    show_default=True,
+)
+@click.option(
+    "--layout",
+    help="Layout of the design principles.",
+    type=click.Choice(("tree", "graph")),
+    default="tree",
+    show_default=True,
+)
+@click.option("--draft", help="Render the figures in draft mode.", is_flag=True)
+@click.option(
+    "--deterministic",
+    help="Encode identical games into identical files, without creation dates.",
+    is_flag=True,
+)
+@click.option(
+    "-j",
+    "--n-workers",
+    help="Number of worker processes, the number of CPUs by default.",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--max-tasks",
+    help="Number of figures rendered by a worker before it is recycled.",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+)
+@click.option(
+    "--max-rss",
+    help="Resident memory in MiB above which a worker is recycled.",
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--timeout",
+    help="Wall time in seconds allowed to render a figure.",
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--max-memory",
+    help=(
+        "Memory in MiB a figure can allocate while it renders, as the growth of the "
+        "resident memory of its worker sampled every 50 ms."
+    ),
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--retry-draft/--no-retry-draft",
+    help="Retry in draft mode the figures exceeding their time or memory budget.",
+    default=True,
+    show_default=True,
+)
+@click.option(
+    "--failures",
+    help="JSON file reporting the failures, in the output directory by default.",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--overwrite",
+    help="Overwrite the existing figures.",
+    is_flag=True,
+)
+def run(
+    sources: tuple[Path, ...],
+    output: Path,
+    format_: str,
+    layout: str,
+    draft: bool,
+    deterministic: bool,
+    n_workers: int | None,
+    max_tasks: int,
+    max_rss: float | None,
+    timeout: float | None,
+    max_memory: float | None,
+    retry_draft: bool,
+    failures: Path | None,
+    overwrite: bool,
+) -> None:
+    """Render game specifications to figures on a pool of worker processes.
+
+    SOURCES are game specification files, or directories of which the '.json' and
+    '.toml' files are rendered. Each figure is written to the output directory under
+    the name of its specification file. A figure is not rewritten if its file already
+    holds identical bytes, e.g. with --deterministic and an unchanged specification.
+
+    A figure exceeding its budget in time or in memory is killed with its worker, while
+    the other workers keep going, and is retried once in draft mode. The figures which
+    fail are reported in a JSON failures file.
+    """
+    fnames = {
+        fname: output / f"{fname.stem}.{format_}" for fname in expand_sources(sources)
+    }
+    targets = dict()
+    for fname, target in fnames.items():
+        targets.setdefault(target, []).append(str(fname))
+    duplicates = [names for names in targets.values() if 1 < len(names)]
+    if len(duplicates) != 0:
+        raise click.ClickException(
+            "The specifications "
+            + "; ".join(", ".join(names) for names in duplicates)
+            + " would be rendered to the same figure. Rename them to distinct names."
+        )
+    existing = [str(fname) for fname in fnames.values() if fname.exists()]
+    if len(existing) != 0 and not overwrite:
+        raise click.ClickException(
+            "The figure(s) " + ", ".join(existing) + " already exist. Use "
+            "--overwrite to replace them."
+        )
+    output.mkdir(parents=True, exist_ok=True)
+    queue = start_log_listener(multiprocessing.get_context("spawn").Queue(-1))
+    failed = []
+    n_unchanged = 0
+    try:
+        with RenderPool(
+            n_workers,
+            max_tasks=max_tasks,
+            max_rss=max_rss,
+            timeout=timeout,
+            max_memory=max_memory,
+            log_queue=queue,
+        ) as pool:
+            kwargs = dict(layout=layout, deterministic=deterministic)
+            futures = {
+                pool.submit(render, fname, format_, draft=draft, **kwargs): (
+                    fname,
+                    draft,
+                )
+                for fname in fnames
+            }
+            while len(futures) != 0:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fname, drafted = futures.pop(future)
+                    try:
+                        data = future.result()
+                    except (TimeoutError, MemoryError) as error:
+                        if retry_draft and not drafted:
+                            click.echo(
+                                f"Retrying '{fname}' in draft mode: {error}", err=True
+                            )
+                            retry = pool.submit(
+                                render, fname, format_, draft=True, **kwargs
+                            )
+                            futures[retry] = (fname, True)
+                            continue
+                        failed.append((fname, drafted, error))
+                        continue
+                    except Exception as error:
+                        failed.append((fname, drafted, error))
+                        continue
+                    n_unchanged += not write_if_changed(fnames[fname], data)
+    finally:
+        stop_log_listener()
+    # the completion order varies across runs, while the report is deterministic
+    failed.sort(key=lambda failure: failure[0])
+    for fname, _, error in failed:
+        click.echo(f"Failed to render '{fname}': {error}", err=True)
+    click.echo(
+        f"Rendered {len(fnames) - len(failed)} game(s) into '{output}', "
+        f"{n_unchanged} unchanged."
+    )
+    if len(failed) != 0:
+        failures = output / "failures.json" if failures is None else failures
+        with open(failures, "w", encoding="utf-8") as file:
+            json.dump(
+                [
+                    {
+                        "source": str(fname),
+                        "draft": drafted,
+                        "error": type(error).__name__,
+                        "message": str(error),
+                    }
+                    for fname, drafted, error in failed
+                ],
+                file,
+                indent=2,
+            )
+        raise click.ClickException(
+            f"{len(failed)} game(s) failed to render, see '{failures}'."
+        )
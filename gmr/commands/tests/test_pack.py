@@ -0,0 +1,30 @@
+import json
+
+from click.testing import CliRunner
+
+from ...corpus import Corpus
+from ..pack import run
+
+
+def test_pack(tmp_path, games):
+    """Test the packing entry-point."""
+    directory = tmp_path / "games"
+    directory.mkdir()
+    for k, game in enumerate(games):
+        with open(directory / f"game{k}.json", "w") as file:
+            json.dump(game, file)
+    (directory / "README.md").write_text("Not a game.")
+    output = tmp_path / "corpus.gmrc"
+    runner = CliRunner()
+    result = runner.invoke(run, [str(directory), "-o", str(output)])
+    assert result.exit_code == 0
+    assert "Packed 3 game(s)" in result.output
+    assert list(Corpus.load(output)) == games
+    # existing output
+    result = runner.invoke(run, [str(directory / "game0.json"), "-o", str(output)])
+    assert result.exit_code != 0
+    result = runner.invoke(
+        run, [str(directory / "game0.json"), "-o", str(output), "--overwrite"]
+    )
+    assert result.exit_code == 0
+    assert list(Corpus.load(output)) == games[:1]
@@ -0,0 +1,94 @@
+import json
+
+from click.testing import CliRunner
+
+from .._utils import write_if_changed
+from ..render import run
+
+
+def test_render(tmp_path, games):
+    """Test the rendering entry-point."""
+    directory = tmp_path / "games"
+    directory.mkdir()
+    for game in games:
+        with open(directory / f"{game['name']}.json", "w") as file:
+            json.dump(game, file)
+    (directory / "Broken.json").write_text("{}")
+    output = tmp_path / "figures"
+    runner = CliRunner()
+    args = [str(directory), "-o", str(output), "-j", "2", "--max-tasks", "2", "--draft"]
+    result = runner.invoke(run, args)
+    assert result.exit_code != 0
+    assert "Failed to render" in result.output
+    assert "Rendered 3 game(s)" in result.output
+    fnames = sorted(output.glob("*.png"))
+    assert [fname.name for fname in fnames] == [
+        f"{game['name']}.png" for game in sorted(games, key=lambda game: game["name"])
+    ]
+    assert all(fname.read_bytes().startswith(b"\x89PNG") for fname in fnames)
+    with open(output / "failures.json") as file:
+        failures = json.load(file)
+    assert len(failures) == 1
+    assert failures[0]["source"] == str(directory / "Broken.json")
+    # existing figures
+    args = [str(directory / f"{games[0]['name']}.json"), "-o", str(output), "-j", "1"]
+    result = runner.invoke(run, args)
+    assert result.exit_code != 0
+    assert "already exist" in result.output
+    result = runner.invoke(run, [*args, "--overwrite", "--draft"])
+    assert result.exit_code == 0
+    assert "Rendered 1 game(s)" in result.output
+    # the figures are not rewritten if unchanged
+    result = runner.invoke(run, [*args, "--overwrite", "--draft", "--deterministic"])
+    assert result.exit_code == 0
+    assert "1 unchanged" in result.output
+
+
+def test_render_budgets(tmp_path, game):
+    """Test the figures exceeding their budget, retried in draft mode."""
+    fname = tmp_path / "game.json"
+    with open(fname, "w") as file:
+        json.dump(game, file)
+    output = tmp_path / "figures"
+    failures = tmp_path / "failures.json"
+    args = [str(fname), "-o", str(output), "-j", "1", "--timeout", "0.001"]
+    result = CliRunner().invoke(run, [*args, "--failures", str(failures)])
+    assert result.exit_code != 0
+    assert "Retrying" in result.output
+    assert "Rendered 0 game(s)" in result.output
+    with open(failures) as file:
+        failures = json.load(file)
+    assert len(failures) == 1
+    assert failures[0]["draft"]
+    assert failures[0]["error"] == "TimeoutError"
+    # without retry, the failure is reported in the output directory
+    result = CliRunner().invoke(run, [*args, "--no-retry-draft"])
+    assert result.exit_code != 0
+    assert "Retrying" not in result.output
+    with open(output / "failures.json") as file:
+        assert not json.load(file)[0]["draft"]
+
+
+def test_write_if_changed(tmp_path):
+    """Test skipping the writes of unchanged files."""
+    fname = tmp_path / "figure.png"
+    assert write_if_changed(fname, b"101")
+    mtime = fname.stat().st_mtime_ns
+    assert not write_if_changed(fname, b"101")
+    assert fname.stat().st_mtime_ns == mtime
+    assert write_if_changed(fname, b"102")
+    assert fname.read_bytes() == b"102"
+
+
+def test_render_duplicates(tmp_path, game):
+    """Test the specifications rendered to the same figure."""
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        with open(tmp_path / directory / "game.json", "w") as file:
+            json.dump(game, file)
+    output = tmp_path / "figures"
+    args = [str(tmp_path / "a"), str(tmp_path / "b"), "-o", str(output)]
+    result = CliRunner().invoke(run, args)
+    assert result.exit_code != 0
+    assert "would be rendered to the same figure" in result.output
+    assert not output.exists()
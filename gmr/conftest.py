@@ -1,11 +1,37 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import matplotlib
+import pytest
+from matplotlib import font_manager
+
+from .pool import _FONTS
+from .utils._testing import (
+    compare_images,
+    read_image,
+    write_diff_images,
+    write_image,
+)
 from .utils.logs import logger
 
 if TYPE_CHECKING:
-    import pytest
+    from collections.abc import Callable
+    from typing import Any
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add custom command-line options."""
+    parser.addoption(
+        "--regenerate-baselines",
+        action="store_true",
+        default=False,
+        help="Regenerate the baseline images of the rendered figures.",
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -19,3 +45,123 @@ def pytest_configure(config: pytest.Config) -> None:
             config.addinivalue_line("filterwarnings", warning_line)
     # setup logging
     logger.propagate = True
+    # use a non-interactive backend
+    matplotlib.use("agg")
+
+
+@pytest.fixture
+def game() -> dict[str, Any]:
+    """Return a small game specification."""
+    return {
+        "name": "Tetris",
+        "intervention_types": ["Cognitive training", "Distraction"],
+        "engagements": {
+            "Cognitive": {
+                "Falling blocks": ["Immediate feedback", "Progressive difficulty"],
+                "Score": ["Rewards"],
+            },
+            "Affective": {"Music": ["Immersion"]},
+        },
+    }
+
+
+@pytest.fixture
+def games(game: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return a small corpus of games."""
+    return [
+        game,
+        {
+            "name": "Pong",
+            "intervention_types": ["Physical game"],
+            "engagements": {
+                "Behavioral": {"Paddle": ["Immediate feedback"], "Ball": []},
+                "Cognitive": {"Score": ["Rewards", "Immediate feedback"]},
+            },
+        },
+        {
+            "name": "Chess",
+            "intervention_types": ["Cognitive training"],
+            "engagements": {"Socio-cultural": {"Opponent": ["Competition"]}},
+        },
+    ]
+
+
+@pytest.fixture
+def image_baseline(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Callable[[str, NDArray[np.uint8]], None]:
+    """Return a function comparing a rendered image to its baseline.
+
+    The baselines are committed in the folder ``tests/baselines`` and rendered with the
+    DejaVu fonts bundled with matplotlib, used as fallback for the fonts of the
+    figures. The comparison is skipped on a machine on which the fonts of the figures
+    are installed, as they change the rendering. A missing baseline fails the test, and
+    the baselines are only written with the option ``--regenerate-baselines``. On
+    failure, the rendered image, the baseline and their difference are written in the
+    temporary folder of the test.
+    """
+    directory = Path(__file__).parent / "tests" / "baselines"
+    regenerate = request.config.getoption("--regenerate-baselines")
+    bundled = Path(matplotlib.get_data_path()) / "fonts" / "ttf"
+    pinned = all(
+        Path(font_manager.findfont(font_manager.FontProperties(family=family))).parent
+        == bundled
+        for family in _FONTS
+    )
+
+    def check(name: str, array: NDArray[np.uint8], tol: float = 1.0) -> None:
+        """Compare the image to the baseline, with a tolerance on the RMS difference."""
+        if not pinned:
+            pytest.skip(
+                "The baselines are rendered with the fonts bundled with matplotlib, "
+                f"while some of the fonts {_FONTS} are installed."
+            )
+        fname = directory / f"{name}.png"
+        if regenerate:
+            directory.mkdir(exist_ok=True)
+            write_image(fname, array)
+            return None
+        if not fname.exists():
+            pytest.fail(
+                f"The baseline image '{fname}' is missing. Run the tests with "
+                "--regenerate-baselines to create it, and commit it."
+            )
+        expected = read_image(fname)
+        if array.shape != expected.shape:
+            write_diff_images(tmp_path, name, array, expected)
+            pytest.fail(
+                f"The image '{name}' has the shape {array.shape} instead of "
+                f"{expected.shape}, see {tmp_path}."
+            )
+        diff = compare_images(array, expected)
+        if tol < diff.rms:
+            fname = write_diff_images(tmp_path, name, array, expected)
+            channel_rms = ", ".join(f"{elt:.2f}" for elt in diff.channel_rms)
+            pytest.fail(
+                f"The image '{name}' differs from its baseline: RMS {diff.rms:.3f} > "
+                f"{tol}, RMS per channel ({channel_rms}), maximum difference per "
+                f"channel {diff.channel_max}, {diff.n_pixels} differing pixels. See "
+                f"{fname}."
+            )
+
+    return check
+
+
+@pytest.fixture
+def tall_game() -> dict[str, Any]:
+    """Return a game taller than a page, with 3 engagements of 4 features."""
+    principle = (
+        "The difficulty of the exercises increases progressively with the performance "
+        "of the patient, so that the challenge remains adapted"
+    )
+    return {
+        "name": "Tall",
+        "intervention_types": ["CBT"],
+        "engagements": {
+            engagement: {
+                f"{engagement} feature {k}": [f"{principle} {k}.{j}." for j in range(3)]
+                for k in range(4)
+            }
+            for engagement in ("Cognitive", "Affective", "Behavioral")
+        },
+    }
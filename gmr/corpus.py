@@ -0,0 +1,533 @@
+from __future__ import annotations
+
+import os
+from array import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._constants import ENGAGEMENT_TYPE_ORDER, INTERVENTION_TYPE_ORDER
+from .index import CorpusIndex
+from .spec import read_game, validate_game
+from .utils._checks import check_type, check_value, ensure_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from typing import Any
+
+    from numpy.typing import NDArray
+
+
+_KEYS: tuple[str, ...] = ("intervention", "engagement", "what", "how")
+# typecode of the buffer of each column
+_TYPECODES: dict[str, str] = {
+    "intervention_code": "b",
+    "intervention_offsets": "q",
+    "engagement_code": "b",
+    "engagement_offsets": "q",
+    "what_string": "i",
+    "what_offsets": "q",
+    "how_string": "i",
+    "how_offsets": "q",
+}
+# binary format: magic, version, number of items of each section, then each section
+# aligned on 8 bytes, in little-endian.
+_MAGIC: bytes = b"GMRC"
+_PACK_VERSION: int = 1
+_SECTIONS: tuple[tuple[str, str], ...] = (
+    ("intervention_code", "<i1"),
+    ("intervention_offsets", "<i8"),
+    ("engagement_code", "<i1"),
+    ("engagement_offsets", "<i8"),
+    ("what_string", "<i4"),
+    ("what_offsets", "<i8"),
+    ("how_string", "<i4"),
+    ("how_offsets", "<i8"),
+    ("name_data", "u1"),
+    ("name_offsets", "<i8"),
+    ("what_data", "u1"),
+    ("what_data_offsets", "<i8"),
+    ("how_data", "u1"),
+    ("how_data_offsets", "<i8"),
+)
+_HEADER_SIZE: int = 8 + 8 * len(_SECTIONS)
+
+
+class Corpus:
+    """In-memory columnar store of a corpus of games.
+
+    The games are stored in compact columnar arrays. The intervention and engagement
+    types are integer-coded in the order of ``INTERVENTION_TYPE_ORDER`` and
+    ``ENGAGEMENT_TYPE_ORDER``, and the features ("what") and design principles ("how")
+    are interned in de-duplicated string tables. The nesting of the specifications is
+    encoded with offset arrays: the engagements of the game ``k`` are the rows
+    ``engagement_offsets[k]:engagement_offsets[k + 1]``, the features of the engagement
+    row ``j`` are the rows ``what_offsets[j]:what_offsets[j + 1]`` and so on.
+
+    The corpus can be packed in a single binary file with :meth:`~Corpus.save`, and
+    loaded back with :meth:`~Corpus.load` by memory-mapping the file.
+
+    Parameters
+    ----------
+    games : iterable of dict | None
+        The games to add to the corpus. Each game is a dictionary with the keys
+        ``"name"``, ``"intervention_types"`` and ``"engagements"``.
+    """
+
+    def __init__(self, games: Iterable[dict[str, Any]] | None = None) -> None:
+        self._names = _StringTable()
+        self._whats = _StringTable()
+        self._hows = _StringTable()
+        # typed buffers grown while games are added, None if the columns are mapped
+        # from a packed file until a game is added
+        self._buffers: dict[str, array] | None = {
+            key: array(code, [0]) if key.endswith("_offsets") else array(code)
+            for key, code in _TYPECODES.items()
+        }
+        self._columns: dict[str, NDArray] | None = None
+        self._index: CorpusIndex | None = None
+        # packed file memory-mapped by a loaded corpus
+        self._mapped: Path | None = None
+        if games is not None:
+            for game in games:
+                self.add(game)
+
+    @classmethod
+    def from_files(cls, fnames: Iterable[str | Path]) -> Corpus:
+        """Load a corpus from JSON or TOML game specifications.
+
+        Parameters
+        ----------
+        fnames : iterable of str | Path
+            Paths to the game specifications, see :func:`~gmr.spec.read_game`.
+
+        Returns
+        -------
+        corpus : Corpus
+            The loaded corpus.
+        """
+        return cls(read_game(fname) for fname in fnames)
+
+    def add(self, game: dict[str, Any]) -> int:
+        """Add a game to the corpus.
+
+        Parameters
+        ----------
+        game : dict
+            The game to add, with the keys ``"name"``, ``"intervention_types"`` and
+            ``"engagements"``. The game is validated before being added.
+
+        Returns
+        -------
+        idx : int
+            The index of the game in the corpus.
+        """
+        check_type(game, (dict,), "game")
+        check_type(game.get("name"), (str,), "name")
+        validate_game(game.get("intervention_types"), game.get("engagements"))
+        if self._buffers is None:  # copy the mapped columns in growable buffers
+            self._buffers = dict()
+            for key, code in _TYPECODES.items():
+                self._buffers[key] = array(code)
+                self._buffers[key].frombytes(self._columns[key].astype(code).tobytes())
+        buffers = self._buffers
+        for inter in game["intervention_types"]:
+            buffers["intervention_code"].append(
+                INTERVENTION_TYPE_ORDER.index(inter.strip())
+            )
+        buffers["intervention_offsets"].append(len(buffers["intervention_code"]))
+        for name, whats in game["engagements"].items():
+            buffers["engagement_code"].append(ENGAGEMENT_TYPE_ORDER.index(name.strip()))
+            for what, hows in whats.items():
+                buffers["what_string"].append(self._whats.intern(what))
+                for how in hows:
+                    buffers["how_string"].append(self._hows.intern(how))
+                buffers["how_offsets"].append(len(buffers["how_string"]))
+            buffers["what_offsets"].append(len(buffers["what_string"]))
+        buffers["engagement_offsets"].append(len(buffers["engagement_code"]))
+        self._names.append(game["name"])
+        self._columns = None  # invalidate the arrays and the index
+        self._index = None
+        return len(self._names) - 1
+
+    def save(self, fname: str | Path, *, overwrite: bool = False) -> None:
+        """Pack the corpus in a binary file.
+
+        The file contains the columnar arrays and the string tables, stored as the
+        concatenated UTF-8 bytes of the strings and their offsets.
+
+        Parameters
+        ----------
+        fname : str | Path
+            Path to the ``.gmrc`` file.
+        overwrite : bool
+            If True, overwrite an existing file. A loaded corpus can not overwrite the
+            file it is memory-mapped on, as a mapped file can not be replaced on every
+            platform.
+        """
+        fname = ensure_path(fname, must_exist=False)
+        check_type(overwrite, (bool,), "overwrite")
+        if fname.suffix != ".gmrc":
+            raise ValueError(
+                f"The corpus must be packed in a '.gmrc' file, got '{fname.suffix}'."
+            )
+        if fname.exists() and not overwrite:
+            raise FileExistsError(
+                f"The file '{fname}' already exists. Set 'overwrite' to True to "
+                "replace it."
+            )
+        if self._mapped is not None and fname.resolve() == self._mapped:
+            raise ValueError(
+                f"The corpus is memory-mapped on the file '{fname}', which can not be "
+                "replaced while mapped. Save the corpus to another file."
+            )
+        sections = dict(self.columns)
+        sections["name_data"], sections["name_offsets"] = self._names.pack()
+        sections["what_data"], sections["what_data_offsets"] = self._whats.pack()
+        sections["how_data"], sections["how_data_offsets"] = self._hows.pack()
+        # write to a temporary file replaced atomically, as truncating a file which is
+        # memory-mapped, e.g. by another loaded corpus, invalidates the mapping
+        tmp = fname.with_name(f".{fname.name}.tmp")
+        with open(tmp, "wb") as file:
+            file.write(_MAGIC)
+            file.write(np.array(_PACK_VERSION, dtype="<u4").tobytes())
+            file.write(
+                np.array(
+                    [sections[key].size for key, _ in _SECTIONS], dtype="<u8"
+                ).tobytes()
+            )
+            for key, dtype in _SECTIONS:
+                data = np.ascontiguousarray(sections[key], dtype=dtype).tobytes()
+                file.write(data)
+                file.write(bytes(_padding(len(data))))
+        os.replace(tmp, fname)
+
+    @classmethod
+    def load(cls, fname: str | Path) -> Corpus:
+        """Load a corpus packed with :meth:`~Corpus.save`.
+
+        The file is memory-mapped: loading does not depend on the size of the corpus,
+        and the specification of each game is only reconstructed when accessed, e.g.
+        with :meth:`~Corpus.game`.
+
+        Parameters
+        ----------
+        fname : str | Path
+            Path to the ``.gmrc`` file.
+
+        Returns
+        -------
+        corpus : Corpus
+            The loaded corpus, to which more games can be added.
+        """
+        fname = ensure_path(fname, must_exist=True)
+        raw = np.memmap(fname, dtype=np.uint8, mode="r")
+        if raw.size < _HEADER_SIZE or bytes(raw[:4]) != _MAGIC:
+            raise ValueError(f"The file '{fname.name}' is not a packed corpus.")
+        version = int(raw[4:8].view("<u4")[0])
+        if version != _PACK_VERSION:
+            raise ValueError(
+                f"The corpus in '{fname.name}' uses an unsupported format version "
+                f"{version}."
+            )
+        sizes = raw[8:_HEADER_SIZE].view("<u8")
+        sections = dict()
+        position = _HEADER_SIZE
+        for (key, dtype), size in zip(_SECTIONS, sizes, strict=True):
+            n_bytes = int(size) * np.dtype(dtype).itemsize
+            if raw.size < position + n_bytes:
+                raise ValueError(f"The packed corpus '{fname.name}' is truncated.")
+            sections[key] = raw[position : position + n_bytes].view(dtype)
+            position += n_bytes + _padding(n_bytes)
+        corpus = cls()
+        corpus._buffers = None
+        corpus._mapped = fname.resolve()
+        corpus._columns = {key: sections[key] for key in _TYPECODES}
+        corpus._names = _StringTable(sections["name_data"], sections["name_offsets"])
+        corpus._whats = _StringTable(
+            sections["what_data"], sections["what_data_offsets"]
+        )
+        corpus._hows = _StringTable(sections["how_data"], sections["how_data_offsets"])
+        return corpus
+
+    @property
+    def columns(self) -> dict[str, NDArray]:
+        """The columnar arrays of the corpus.
+
+        The arrays are ``intervention_code``, ``intervention_offsets``,
+        ``engagement_code``, ``engagement_offsets``, ``what_string``, ``what_offsets``,
+        ``how_string`` and ``how_offsets``. They are read-only and rebuilt after games
+        are added. For a loaded corpus, they are memory-mapped on the packed file until
+        a game is added.
+        """
+        if self._columns is None:
+            self._columns = dict()
+            for key, buffer in self._buffers.items():
+                column = np.array(buffer)
+                column.flags.writeable = False
+                self._columns[key] = column
+        return self._columns
+
+    @property
+    def index(self) -> CorpusIndex:
+        """The inverted index of the corpus, rebuilt after games are added."""
+        if self._index is None:
+            self._index = CorpusIndex(self)
+        return self._index
+
+    def game(self, idx: int) -> dict[str, Any]:
+        """Reconstruct the specification of a game.
+
+        Parameters
+        ----------
+        idx : int
+            The index of the game in the corpus.
+
+        Returns
+        -------
+        game : dict
+            The specification of the game, with the keys ``"name"``,
+            ``"intervention_types"`` and ``"engagements"``.
+        """
+        check_type(idx, ("int-like",), "idx")
+        if not -len(self) <= idx < len(self):
+            raise IndexError(
+                f"The game index {idx} is out of range for a corpus of {len(self)} "
+                "games."
+            )
+        idx = idx % len(self)
+        col = self.columns
+        interventions = col["intervention_code"][
+            col["intervention_offsets"][idx] : col["intervention_offsets"][idx + 1]
+        ]
+        engagements = dict()
+        for j in range(
+            col["engagement_offsets"][idx], col["engagement_offsets"][idx + 1]
+        ):
+            whats = dict()
+            for i in range(col["what_offsets"][j], col["what_offsets"][j + 1]):
+                whats[self._whats[col["what_string"][i]]] = [
+                    self._hows[h]
+                    for h in col["how_string"][
+                        col["how_offsets"][i] : col["how_offsets"][i + 1]
+                    ]
+                ]
+            engagements[ENGAGEMENT_TYPE_ORDER[col["engagement_code"][j]]] = whats
+        return {
+            "name": self._names[idx],
+            "intervention_types": [INTERVENTION_TYPE_ORDER[k] for k in interventions],
+            "engagements": engagements,
+        }
+
+    def labels(self, key: str) -> tuple[str, ...]:
+        """Get the labels of the integer codes of a grouping key.
+
+        Parameters
+        ----------
+        key : str
+            The grouping key, one of ``'intervention'``, ``'engagement'``, ``'what'``
+            or ``'how'``.
+
+        Returns
+        -------
+        labels : tuple of str
+            The label of each integer code.
+        """
+        check_type(key, (str,), "key")
+        check_value(key, _KEYS, "key")
+        if key == "intervention":
+            return INTERVENTION_TYPE_ORDER
+        elif key == "engagement":
+            return ENGAGEMENT_TYPE_ORDER
+        elif key == "what":
+            return tuple(self._whats)
+        return tuple(self._hows)
+
+    def rows(self, *keys: str) -> NDArray[np.int64]:
+        """Flatten the corpus into one row per combination of the grouping keys.
+
+        Parameters
+        ----------
+        *keys : str
+            The grouping keys, among ``'intervention'``, ``'engagement'``, ``'what'``
+            and ``'how'``. The keys of the engagement hierarchy (engagement, what, how)
+            are combined within the same branch, e.g. a design principle is only
+            combined with the engagement type under which it is listed, while the
+            intervention types are combined with every branch of the game.
+
+        Returns
+        -------
+        rows : array of shape (n_rows, 1 + n_keys)
+            The game index followed by the integer code of each key, for each row.
+        """
+        for key in keys:
+            check_type(key, (str,), "key")
+            check_value(key, _KEYS, "key")
+        col = self.columns
+        n_games = len(self)
+        # rows at the finest level of the engagement hierarchy required
+        if "how" in keys:
+            level = "how"
+        elif "what" in keys:
+            level = "what"
+        elif "engagement" in keys:
+            level = "engagement"
+        else:
+            level = "game"
+        codes = dict()
+        game = np.arange(n_games)
+        if level != "game":
+            game = np.repeat(game, np.diff(col["engagement_offsets"]))
+            codes["engagement"] = col["engagement_code"]
+        if level in ("what", "how"):
+            sizes = np.diff(col["what_offsets"])
+            game = np.repeat(game, sizes)
+            codes["engagement"] = np.repeat(codes["engagement"], sizes)
+            codes["what"] = col["what_string"]
+        if level == "how":
+            sizes = np.diff(col["how_offsets"])
+            game = np.repeat(game, sizes)
+            codes["engagement"] = np.repeat(codes["engagement"], sizes)
+            codes["what"] = np.repeat(codes["what"], sizes)
+            codes["how"] = col["how_string"]
+        if "intervention" in keys:
+            # combine each row with every intervention type of its game
+            n_interventions = np.diff(col["intervention_offsets"])
+            sizes = n_interventions[game]
+            starts = col["intervention_offsets"][:-1][game]
+            rows = np.repeat(np.arange(game.size), sizes)
+            # position of each repeated row within the interventions of its game
+            position = np.arange(rows.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            codes["intervention"] = col["intervention_code"][
+                np.repeat(starts, sizes) + position
+            ]
+            game = game[rows]
+            for key in ("engagement", "what", "how"):
+                if key in codes:
+                    codes[key] = codes[key][rows]
+        # the dtype argument of np.stack requires numpy 1.24
+        return np.stack([game] + [codes[key] for key in keys], axis=1).astype(
+            np.int64, copy=False
+        )
+
+    def count(self, *keys: str) -> NDArray[np.int64]:
+        """Count the games for each combination of the grouping keys.
+
+        Parameters
+        ----------
+        *keys : str
+            The grouping keys, among ``'intervention'``, ``'engagement'``, ``'what'``
+            and ``'how'``. See :meth:`~Corpus.rows` for how the keys are combined.
+
+        Returns
+        -------
+        counts : array of int
+            The number of games for each combination, with one dimension per key
+            indexed by the integer codes of the key, see :meth:`~Corpus.labels`.
+
+        Examples
+        --------
+        The number of games with a cognitive training intervention and a behavioral
+        engagement:
+
+        >>> counts = corpus.count("intervention", "engagement")  # doctest: +SKIP
+        >>> counts[
+        ...     INTERVENTION_TYPE_ORDER.index("Cognitive training"),
+        ...     ENGAGEMENT_TYPE_ORDER.index("Behavioral"),
+        ... ]  # doctest: +SKIP
+        """
+        if len(keys) == 0:
+            raise ValueError("At least one grouping key must be provided.")
+        shape = tuple(len(self.labels(key)) for key in keys)
+        rows = self.rows(*keys)
+        # count each game once per combination
+        rows = np.unique(rows, axis=0)
+        flat = np.ravel_multi_index(tuple(rows[:, 1:].T), shape)
+        return np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the reconstructed specifications of the games."""
+        for idx in range(len(self)):
+            yield self.game(idx)
+
+    def __len__(self) -> int:
+        """Return the number of games in the corpus."""
+        return len(self._names)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """The names of the games."""
+        return tuple(self._names)
+
+
+class _StringTable:
+    """Table of strings, decoded lazily from packed UTF-8 bytes.
+
+    The strings loaded from a packed corpus are kept as the concatenated UTF-8 bytes and
+    their offsets, and decoded on access. The strings appended afterwards are stored in
+    a list.
+    """
+
+    def __init__(
+        self,
+        data: NDArray[np.uint8] | None = None,
+        offsets: NDArray[np.int64] | None = None,
+    ) -> None:
+        self._data = np.empty(0, dtype=np.uint8) if data is None else data
+        self._offsets = np.zeros(1, dtype=np.int64) if offsets is None else offsets
+        self._n_packed = self._offsets.size - 1
+        self._decoded: dict[int, str] = dict()
+        self._strings: list[str] = []
+        self._ids: dict[str, int] | None = None  # built on the first lookup
+
+    def __getitem__(self, idx: int) -> str:
+        idx = int(idx)
+        if self._n_packed <= idx:
+            return self._strings[idx - self._n_packed]
+        string = self._decoded.get(idx)
+        if string is None:
+            string = self._decoded[idx] = bytes(
+                self._data[self._offsets[idx] : self._offsets[idx + 1]]
+            ).decode("utf-8")
+        return string
+
+    def __iter__(self) -> Iterator[str]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __len__(self) -> int:
+        return self._n_packed + len(self._strings)
+
+    def append(self, string: str) -> int:
+        """Append a string, duplicated or not, and return its index."""
+        idx = len(self)
+        self._strings.append(string)
+        if self._ids is not None:
+            self._ids.setdefault(string, idx)
+        return idx
+
+    def get_id(self, string: str) -> int | None:
+        """Get the index of the first occurrence of a string, None if absent."""
+        if self._ids is None:
+            self._ids = dict()
+            for idx, elt in enumerate(self):
+                self._ids.setdefault(elt, idx)
+        return self._ids.get(string)
+
+    def intern(self, string: str) -> int:
+        """Intern a string and return its index."""
+        idx = self.get_id(string)
+        return self.append(string) if idx is None else idx
+
+    def pack(self) -> tuple[NDArray[np.uint8], NDArray[np.int64]]:
+        """Pack the strings as their concatenated UTF-8 bytes and their offsets."""
+        encoded = [string.encode("utf-8") for string in self]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(elt) for elt in encoded], dtype=np.int64)
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _padding(n_bytes: int) -> int:
+    """Get the number of bytes padding a section to a multiple of 8 bytes."""
+    return -n_bytes % 8
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import threading
+from functools import cache, lru_cache
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+
+from .utils._checks import check_type
+
+# text used to calibrate the estimators, representative of the features and design
+# principles of a game.
+_CALIBRATION_TEXT: str = (
+    "Immediate feedback on the performance of the player, with progressive difficulty "
+    "adapted to the abilities of each patient. Rewards and badges are unlocked after "
+    "completing a level, while a narrative connects the sessions together and the "
+    "avatar can be customized. Social features let players compare their scores and "
+    "cooperate with friends or family members during the therapy."
+)
+_CALIBRATION_LENGTHS: tuple[int, ...] = (12, 40, 80, 140, 220, 320)
+_CALIBRATION_WIDTHS: tuple[float, ...] = (60.0, 120.0, 200.0, 320.0, 480.0)
+# the canvas of measure_text_height is shared by the threads of the process
+_CANVAS_LOCK = threading.Lock()
+
+
+class TextHeightEstimator:
+    """Estimate the height of wrapped text without measuring it with a renderer.
+
+    The estimator converts the number of characters per line into a number of wrapped
+    lines, and the number of lines into a height. The average character width and the
+    linear relation between the number of lines and the height are calibrated for a
+    given font and size against exact measurements with the Agg renderer.
+
+    Parameters
+    ----------
+    font : str
+        The font family.
+    fontsize : float
+        The font size, in points.
+
+    Notes
+    -----
+    The widths and heights are expressed in points, and thus do not depend on the DPI.
+    """
+
+    def __init__(self, font: str = "DejaVu Sans", fontsize: float = 12) -> None:
+        check_type(font, (str,), "font")
+        check_type(fontsize, ("numeric",), "fontsize")
+        if fontsize <= 0:
+            raise ValueError(f"The fontsize must be strictly positive, got {fontsize}.")
+        self._font = font
+        self._fontsize = fontsize
+        self._calibrate()
+
+    def _calibrate(self) -> None:
+        """Calibrate the estimator against exact measurements."""
+        fig = Figure(dpi=72)
+        canvas = FigureCanvasAgg(fig)
+        renderer = canvas.get_renderer()
+        text = Text(0, 0, _CALIBRATION_TEXT, font=self._font, fontsize=self._fontsize)
+        text.set_figure(fig)
+        self._char_width = text.get_window_extent(renderer).width / len(
+            _CALIBRATION_TEXT
+        )
+        n_lines, heights = [], []
+        for length in _CALIBRATION_LENGTHS:
+            sample = _CALIBRATION_TEXT[:length].strip()
+            for width in _CALIBRATION_WIDTHS:
+                heights.append(
+                    _measure_text_height(
+                        sample,
+                        width,
+                        renderer,
+                        fig,
+                        dict(font=self._font, fontsize=self._fontsize),
+                    )
+                )
+                n_lines.append(self._n_lines(sample, width))
+        n_lines = np.array(n_lines, dtype=float)
+        heights = np.array(heights, dtype=float)
+        # the line spacing only applies from the second line onwards
+        single = n_lines == 1
+        self._single_line_height = float(np.mean(heights[single]))
+        self._coeffs = np.polyfit(n_lines[~single], heights[~single], deg=1)
+        estimates = np.where(
+            single, self._single_line_height, np.polyval(self._coeffs, n_lines)
+        )
+        self._errors = np.abs(estimates - heights) / heights
+
+    def _n_lines(self, text: str, width: float) -> int:
+        """Estimate the number of lines once wrapped, with a greedy word-wrap."""
+        chars_per_line = max(1, int(width / self._char_width))
+        n_lines = 0
+        for paragraph in text.split("\n"):
+            n_lines += 1
+            current = 0
+            for word in paragraph.split(" "):
+                length = len(word) + (1 if current != 0 else 0)
+                if current != 0 and chars_per_line < current + length:
+                    n_lines += 1
+                    current = len(word)
+                else:
+                    current += length
+        return n_lines
+
+    def estimate(self, text: str, width: float) -> float:
+        """Estimate the height of a text wrapped at a given width.
+
+        Parameters
+        ----------
+        text : str
+            The text content.
+        width : float
+            The wrapping width, in points.
+
+        Returns
+        -------
+        height : float
+            The estimated height, in points.
+        """
+        n_lines = self._n_lines(text, width)
+        if n_lines == 1:
+            return self._single_line_height
+        return float(np.polyval(self._coeffs, n_lines))
+
+    @property
+    def font(self) -> str:
+        """The font family."""
+        return self._font
+
+    @property
+    def fontsize(self) -> float:
+        """The font size, in points."""
+        return self._fontsize
+
+    @property
+    def max_error(self) -> float:
+        """Maximum relative deviation from the exact heights on the calibration set."""
+        return float(np.max(self._errors))
+
+    @property
+    def rms_error(self) -> float:
+        """RMS relative deviation from the exact heights on the calibration set."""
+        return float(np.sqrt(np.mean(self._errors**2)))
+
+
+@cache
+def get_estimator(
+    font: str = "DejaVu Sans", fontsize: float = 12
+) -> TextHeightEstimator:
+    """Get the calibrated estimator of a font and size, calibrated once per process.
+
+    Parameters
+    ----------
+    font : str
+        The font family.
+    fontsize : float
+        The font size, in points.
+
+    Returns
+    -------
+    estimator : TextHeightEstimator
+        The calibrated estimator.
+    """
+    return TextHeightEstimator(font, fontsize)
+
+
+@lru_cache(maxsize=65536)
+def measure_text_height(
+    text: str, width: float, font: str = "DejaVu Sans", fontsize: float = 12
+) -> float:
+    """Measure the exact height of a text wrapped at a given width.
+
+    The measurements are cached per text, width and font, and are thus cheap to repeat,
+    e.g. when evaluating several candidate layouts. The measurements are made on a
+    canvas shared by the process and serialized by a lock, thus this function can be
+    called from several threads.
+
+    Parameters
+    ----------
+    text : str
+        The text content.
+    width : float
+        The wrapping width, in points.
+    font : str
+        The font family.
+    fontsize : float
+        The font size, in points.
+
+    Returns
+    -------
+    height : float
+        The height, in points.
+    """
+    with _CANVAS_LOCK:
+        fig, renderer = _get_canvas()
+        return _measure_text_height(
+            text, width, renderer, fig, dict(font=font, fontsize=fontsize)
+        )
+
+
+@cache
+def _get_canvas() -> tuple[Figure, RendererAgg]:
+    """Get a figure and its renderer at 72 DPI, on which a pixel is a point."""
+    fig = Figure(dpi=72)
+    return fig, FigureCanvasAgg(fig).get_renderer()
+
+
+def _measure_text_height(
+    text: str, width: float, renderer, fig: Figure, text_kwargs: dict
+) -> float:
+    """Measure the exact height of a text wrapped at a given width, in pixels."""
+    temp_text = Text(0, 0, text, wrap=True, **text_kwargs)
+    temp_text.set_figure(fig)
+    temp_text._get_wrap_line_width = lambda: width * fig.dpi / 72
+    temp_text._renderer = renderer
+    with temp_text._cm_set(text=temp_text._get_wrapped_text()):
+        return temp_text.get_window_extent(renderer).height
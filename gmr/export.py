@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from matplotlib.backends.backend_pdf import PdfPages
+
+from ._base import _DETERMINISTIC_METADATA
+from .figure import FigureGame
+from .utils._checks import check_type, ensure_path
+from .utils.logs import logger
+from .utils.tracing import span
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    from pathlib import Path
+
+
+def export_pdf(
+    games: Iterable[dict],
+    fname: str | Path,
+    *,
+    figsize: tuple[int, int] = (15, 10),
+    max_height: float | None = None,
+    deterministic: bool = False,
+    overwrite: bool = False,
+) -> int:
+    """Export a corpus of games to a single multi-page PDF.
+
+    The games are rendered one at a time: each figure is written to its page and
+    closed before the next game is drawn. The peak memory usage is thus bounded by a
+    single figure, independently of the size of the corpus.
+
+    Parameters
+    ----------
+    games : iterable of dict
+        The games to export, one page per game. Each game is a dictionary with the
+        keys ``"name"``, ``"intervention_types"`` and ``"engagements"``, matching the
+        arguments of :class:`~gmr.figure.FigureGame` and
+        :meth:`~gmr.figure.FigureGame.draw`. A generator can be provided to also
+        stream the loading of the games.
+    fname : str | Path
+        Path to the output PDF file.
+    figsize : tuple of int
+        The figure size used for every game.
+    max_height : float | None
+        If provided, the games taller than this height are split across several pages,
+        see :meth:`~gmr.figure.FigureGame.iter_pages`. If None, each game is drawn on a
+        single page.
+    deterministic : bool
+        If True, the creation date is omitted from the metadata, such that an identical
+        corpus is always exported to an identical file.
+    overwrite : bool
+        If True, overwrite an existing file.
+
+    Returns
+    -------
+    n_pages : int
+        The number of pages written.
+    """
+    fname = ensure_path(fname, must_exist=False)
+    check_type(overwrite, (bool,), "overwrite")
+    if fname.suffix != ".pdf":
+        raise ValueError(f"The output file must be a PDF, got '{fname.suffix}'.")
+    if fname.exists() and not overwrite:
+        raise FileExistsError(
+            f"The file '{fname}' already exists. Set 'overwrite' to True to replace it."
+        )
+    check_type(max_height, ("numeric", None), "max_height")
+    check_type(deterministic, (bool,), "deterministic")
+    metadata = _DETERMINISTIC_METADATA["pdf"] if deterministic else None
+    n_pages = 0
+    with PdfPages(fname, metadata=metadata) as pdf:
+        for game in games:
+            check_type(game, (dict,), "game")
+            figure = FigureGame(game["name"], figsize=figsize)
+            if max_height is None:
+                pages = _single_page(figure, game)
+            else:
+                pages = figure.iter_pages(
+                    game["intervention_types"],
+                    game["engagements"],
+                    max_height=max_height,
+                )
+            for page in pages:
+                with span("save", format="pdf"):
+                    pdf.savefig(page._fig)
+                n_pages += 1
+                logger.info("Game '%s' exported to page %i.", page.name, n_pages)
+    return n_pages
+
+
+def _single_page(figure: FigureGame, game: dict) -> Generator[FigureGame, None, None]:
+    """Draw a game on a single page, closed once the page is written."""
+    try:
+        figure.draw(game["intervention_types"], game["engagements"])
+        yield figure
+    finally:
+        figure.close()
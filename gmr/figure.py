@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
 import numpy as np
 from matplotlib import pyplot as plt
-from matplotlib.patches import FancyBboxPatch
+from matplotlib import rc_context
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import BoxStyle, FancyBboxPatch
 
+from ._base import BaseFigure
 from ._constants import (
     COLUMN_WIDTHS,
     COLUMNS_HEIGHTS,
@@ -15,12 +22,53 @@ from ._constants import (
     VPAD_EXTRA_BELOW_HEADER,
     VPAD_EXTRA_BELOW_TITLE,
 )
+from .estimator import get_estimator
+from .layout import check_layout, optimize_column_widths, paginate
 from .link import link
+from .spec import validate_game
 from .text import TextBox
-from .utils._checks import check_type, check_value
+from .utils._checks import check_type, check_value, trusted_input
+from .utils.logs import logger
+from .utils.tracing import span
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from .estimator import TextHeightEstimator
+    from .layout import LayoutIssues
+
+# text properties of the features ("what") and design principles ("how")
+_BOX_TEXT_KWARGS: dict[str, str | int] = dict(
+    color="black", font="DejaVu Sans", fontsize=12
+)
+_DRAFT_DPI: int = 50
+_TITLE_HEIGHT: float = 0.05
+_HEADER_HEIGHT: float = 0.07
+_DRAFT_RC: dict[str, bool] = {
+    "lines.antialiased": False,
+    "patch.antialiased": False,
+    "text.antialiased": False,
+}
+
+
+_HEADERS: tuple[str, ...] = (
+    "Primary type of intervention",
+    "Type of engagement",
+    "What game design features support this engagement?",
+    "Which design principles support this features?",
+)
+_INTERVENTION_BOXSTYLE: BoxStyle = BoxStyle("round", pad=0, rounding_size=0.005)
+
+
+class _Scaffold(NamedTuple):
+    """The static headers and intervention boxes, shared by the figures."""
+
+    headers: tuple[TextBox, ...]
+    interventions: dict[str, tuple[TextBox, TextBox]]  # (inactive, active) boxes
+    boundary: tuple[float, float, float, float]  # (x, y, width, height)
 
 
-class FigureGame:
+class FigureGame(BaseFigure):
     """A figure object for a given game.
 
     A figure object has 4 columns and is organized as:
@@ -33,39 +81,227 @@ class FigureGame:
     |                   |                    |      |                 |
     |                   |                    |      |                 |
     +-----------------------------------------------------------------+
+
+    Parameters
+    ----------
+    name : str
+        The name of the game.
+    figsize : tuple of int
+        The size of the figure.
+    layout : str
+        The layout of the design principles. If ``'tree'``, each design principle is
+        drawn next to every feature it supports. If ``'graph'``, each distinct design
+        principle is drawn once in the fourth column and linked to every feature it
+        supports.
+    draft : bool
+        If True, the figure is drawn in draft mode: the automatic heights are estimated
+        with a :class:`~gmr.estimator.TextHeightEstimator` instead of being measured
+        with the renderer, antialiasing is disabled and the resolution is low. The
+        calibration error of the estimators is available in
+        :attr:`~FigureGame.estimator_calibration_error`.
+    widths : str | tuple of float
+        The widths of the columns. If ``'fixed'``, the widths are ``COLUMN_WIDTHS``.
+        If ``'optimize'``, the widths of the "what" and "how" columns are searched to
+        minimize the height of the figure, within bounds and with a fixed total width,
+        see :func:`~gmr.layout.optimize_column_widths`. A tuple sets the widths of the
+        4 columns. The widths used are available in :attr:`~FigureGame.column_widths`.
     """
 
-    def __init__(self, name: str, *, figsize: tuple[int, int] = (15, 10)) -> None:
+    def __init__(
+        self,
+        name: str,
+        *,
+        figsize: tuple[int, int] = (15, 10),
+        layout: str = "tree",
+        draft: bool = False,
+        widths: str | tuple[float, float, float, float] = "fixed",
+    ) -> None:
         check_type(name, (str,), "name")
         check_type(figsize, (tuple,), "figsize")
         if len(figsize) != 2:
             raise ValueError("figsize must be a tuple of 2 integers.")
         check_type(figsize[0], ("int-like",), "figsize[0]")
         check_type(figsize[1], ("int-like",), "figsize[1]")
+        check_type(layout, (str,), "layout")
+        check_value(layout, ("tree", "graph"), "layout")
+        check_type(draft, (bool,), "draft")
+        check_type(widths, (str, tuple), "widths")
+        if isinstance(widths, str):
+            check_value(widths, ("fixed", "optimize"), "widths")
+        elif len(widths) != 4 or not all(
+            isinstance(width, float | int) and 0 < width for width in widths
+        ):
+            raise ValueError(
+                "The widths must be a tuple of 4 strictly positive numbers, got "
+                f"{widths}."
+            )
         self._name = name
         self._figsize = figsize
+        self._layout = layout
+        self._draft = draft
+        self._widths = widths
+        self._column_widths = COLUMN_WIDTHS if isinstance(widths, str) else widths
+        self._estimators = set()
         self._y_pos_engagement_init = None
+        super().__init__()
 
     def draw(
         self,
         intervention_types: list[str] | tuple[str],
         engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
     ) -> None:
-        """Draw the figure on a matplotlib axes."""
-        self._fig, self._ax = plt.subplots(
-            1, 1, figsize=self._figsize, layout="constrained", facecolor="white"
-        )
-        self._ax.invert_yaxis()
-        self._ax.axis("off")
+        """Draw the figure on a matplotlib axes.
 
-        self._draw_title()
-        self._draw_header()
-        self._draw_intervention_type(intervention_types)
-        for name, whats in engagements.items():
-            self._draw_engagement(name, whats)
-        # now resize based on the update `self._y_pos_engagement_init` value
-        self._ax.set_ylim(self._y_pos_engagement_init + VPAD, -VPAD)
-        self._ax.set_xlim(-HPAD, np.sum(COLUMN_WIDTHS) + 4 * HPAD)
+        The full specification is validated before the figure is created.
+        """
+        validate_game(intervention_types, engagements)
+        engagements = {name.strip(): whats for name, whats in engagements.items()}
+        self._y_pos_engagement_init = None
+        self._elements = []
+        with rc_context(_DRAFT_RC if self._draft else {}):
+            self._fig, self._ax = plt.subplots(
+                1,
+                1,
+                figsize=self._figsize,
+                dpi=_DRAFT_DPI if self._draft else None,
+                layout="constrained",
+                facecolor="white",
+            )
+            self._ax.invert_yaxis()
+            self._ax.axis("off")
+            if self._widths == "optimize":
+                # measure with the geometry of the axes once laid out
+                self._fig.get_layout_engine().execute(self._fig)
+                self._column_widths = optimize_column_widths(
+                    engagements,
+                    self._ax,
+                    layout=self._layout,
+                    font=_BOX_TEXT_KWARGS["font"],
+                    fontsize=_BOX_TEXT_KWARGS["fontsize"],
+                    estimator=self._get_estimator(_BOX_TEXT_KWARGS),
+                )
+
+            with trusted_input():
+                with self._phase("title"):
+                    self._draw_title()
+                with self._phase("headers"):
+                    self._draw_header()
+                with self._phase("intervention"):
+                    self._draw_intervention_type(intervention_types)
+                if self._layout == "tree":
+                    for name, whats in engagements.items():
+                        with (
+                            self._phase(f"engagement '{name}'"),
+                            span("draw engagement", engagement=name),
+                        ):
+                            self._draw_engagement(name, whats)
+                else:
+                    with span("draw engagements"):
+                        self._draw_engagements_graph(engagements)
+        if self._draft:
+            logger.info(
+                "Draft heights of '%s' estimated with a calibration error of %.1f%% "
+                "on the calibration texts of the estimators.",
+                self._name,
+                100 * self.estimator_calibration_error,
+            )
+        # now resize based on the update `self._y_pos_engagement_init` value, without
+        # cropping the intervention column of the games with few engagements
+        _, y, _, height = _get_scaffold(self._column_widths).boundary
+        self._ax.set_ylim(max(self._y_pos_engagement_init, y + height) + VPAD, -VPAD)
+        self._ax.set_xlim(-HPAD, np.sum(self._column_widths) + 4 * HPAD)
+
+    def iter_pages(
+        self,
+        intervention_types: list[str] | tuple[str],
+        engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
+        *,
+        max_height: float = 1.0,
+    ) -> Generator[FigureGame, None, None]:
+        """Draw the game split across pages, one page at a time.
+
+        The engagements are split across pages at the boundaries between engagements
+        or between features ("what"), using the measured heights of the texts, see
+        :func:`~gmr.layout.paginate`. The title, the headers and the intervention
+        column are repeated on each page, and the page number is appended to the title.
+
+        Parameters
+        ----------
+        intervention_types : list of str
+            The intervention types of the game.
+        engagements : dict
+            The engagements of the game.
+        max_height : float
+            The maximum height of a page, in the data coordinates of the axes. The
+            default ``1.0`` fits the page in the axes without shrinking it.
+
+        Yields
+        ------
+        page : FigureGame
+            The drawn figure of each page. A page is closed when the next one is
+            requested, thus only one page is in memory at a time.
+        """
+        validate_game(intervention_types, engagements)
+        check_type(max_height, ("numeric",), "max_height")
+        engagements = {name.strip(): whats for name, whats in engagements.items()}
+        # the engagements are drawn below the title and the headers
+        available = max_height - (
+            _TITLE_HEIGHT
+            + _HEADER_HEIGHT
+            + 4 * VPAD
+            + VPAD_EXTRA_BELOW_TITLE
+            + VPAD_EXTRA_BELOW_HEADER
+        )
+        if available <= 0:
+            raise ValueError(
+                f"The maximum height {max_height} of a page is smaller than the title "
+                "and the headers."
+            )
+        # axes with the geometry of the pages, to measure the texts
+        fig = Figure(
+            figsize=self._figsize,
+            dpi=_DRAFT_DPI if self._draft else None,
+            layout="constrained",
+        )
+        ax = fig.add_subplot()
+        ax.axis("off")
+        FigureCanvasAgg(fig)
+        fig.get_layout_engine().execute(fig)
+        estimator = self._get_estimator(_BOX_TEXT_KWARGS)
+        widths = self._column_widths
+        if self._widths == "optimize":
+            widths = optimize_column_widths(
+                engagements,
+                ax,
+                layout=self._layout,
+                font=_BOX_TEXT_KWARGS["font"],
+                fontsize=_BOX_TEXT_KWARGS["fontsize"],
+                estimator=estimator,
+            )
+        pages = paginate(
+            engagements,
+            ax,
+            available,
+            layout=self._layout,
+            widths=widths,
+            font=_BOX_TEXT_KWARGS["font"],
+            fontsize=_BOX_TEXT_KWARGS["fontsize"],
+            estimator=estimator,
+        )
+        del fig, ax
+        for k, page in enumerate(pages, start=1):
+            figure = FigureGame(
+                self._name if len(pages) == 1 else f"{self._name} ({k}/{len(pages)})",
+                figsize=self._figsize,
+                layout=self._layout,
+                draft=self._draft,
+                widths=widths,
+            )
+            try:
+                figure.draw(intervention_types, page)
+                yield figure
+            finally:
+                figure.close()
 
     def _draw_title(self) -> None:
         """Draw the title at the top of the first column."""
@@ -73,8 +309,8 @@ class FigureGame:
             text=self._name,
             x=0,
             y=0,
-            width=COLUMN_WIDTHS[0],
-            height=0.05,
+            width=self._column_widths[0],
+            height=_TITLE_HEIGHT,
             hpad=0.5,
             text_alignment="center",
             bbox_kwargs=dict(
@@ -83,46 +319,16 @@ class FigureGame:
             text_kwargs=dict(color="black", font="Consolas", fontsize=24),
         )
         self._bbox_title.draw(self._ax)
+        self._elements.append(self._bbox_title)
 
     def _draw_header(self) -> None:
         """Draw the headers."""
         if not hasattr(self, "_bbox_title"):
             raise RuntimeError("The title must be drawn first.")
-        # properties
-        headers = (
-            "Primary type of intervention",
-            "Type of engagement",
-            "What game design features support this engagement?",
-            "Which design principles support this features?",
-        )
-        # draw the headers
-        x_pos = 0
-        self._bbox_headers = []
-        for k, header in enumerate(headers):
-            text = TextBox(
-                text=header,
-                x=x_pos,
-                y=self._bbox_title._height + VPAD + VPAD_EXTRA_BELOW_TITLE,
-                width=COLUMN_WIDTHS[k],
-                height=0.07,
-                hpad=0.01,
-                text_alignment="center",
-                bbox_kwargs=dict(
-                    facecolor="#eeeeee",
-                    edgecolor="black",
-                    boxstyle="square,pad=0"
-                    if k == 2
-                    else "round,pad=0,rounding_size=0.01",
-                ),
-                text_kwargs=dict(
-                    color="black",
-                    font="Corbel",
-                    fontsize=18,
-                ),
-            )
-            text.draw(self._ax)
-            x_pos += COLUMN_WIDTHS[k] + HPAD
-            self._bbox_headers.append(text)
+        self._bbox_headers = list(_get_scaffold(self._column_widths).headers)
+        for header in self._bbox_headers:
+            header.draw(self._ax)
+        self._elements.extend(self._bbox_headers)
 
     def _draw_intervention_type(
         self,
@@ -135,64 +341,20 @@ class FigureGame:
             check_value(inter.strip(), INTERVENTION_TYPE_COLORS, "intervention_type")
         if not hasattr(self, "_bbox_title") or not hasattr(self, "_bbox_headers"):
             raise RuntimeError("The title and headers must be drawn first.")
-        header_heights = [header._height for header in self._bbox_headers]
-        assert all(elt == header_heights[0] for elt in header_heights)  # sanity-check
         # sanitize
         intervention_types = [inter.strip() for inter in intervention_types]
-        # properties
-        # draw the boxes
-        y_pos = (
-            self._bbox_title._height
-            + self._bbox_headers[0]._height
-            + 2 * VPAD
-            + VPAD_EXTRA_BELOW_TITLE
-            + VPAD_EXTRA_BELOW_HEADER
-        )
+        # stamp the active or inactive box of each intervention type
+        scaffold = _get_scaffold(self._column_widths)
         for inter in INTERVENTION_TYPE_ORDER:
-            if inter not in intervention_types:
-                facecolor = INTERVENTION_TYPE_COLORS[inter] + "10"
-                edgecolor = "lightgray"
-                textcolor = "lightgray"
-            else:
-                facecolor = INTERVENTION_TYPE_COLORS[inter] + "ff"
-                edgecolor = "black"
-                textcolor = "black"
-            TextBox(
-                text=inter,
-                x=0,
-                y=y_pos,
-                width=COLUMN_WIDTHS[0],
-                height=COLUMNS_HEIGHTS[0],
-                hpad=0.01,
-                text_alignment="center",
-                bbox_kwargs=dict(
-                    facecolor=facecolor,
-                    boxstyle="round,pad=0,rounding_size=0.005",
-                    edgecolor=edgecolor,
-                ),
-                text_kwargs=dict(
-                    color=textcolor,
-                    font="DejaVu Sans",
-                    fontsize=14,
-                ),
-            ).draw(self._ax)
-            y_pos += COLUMNS_HEIGHTS[0] + VPAD
+            inactive, active = scaffold.interventions[inter]
+            box = active if inter in intervention_types else inactive
+            box.draw(self._ax)
+            self._elements.append(box)
         # add a boundary box around
-        x = -HPAD / 4
-        y = (
-            self._bbox_title._height
-            + self._bbox_headers[0]._height
-            + 1.25 * VPAD
-            + VPAD_EXTRA_BELOW_TITLE
-            + VPAD_EXTRA_BELOW_HEADER
-        )
-        width = COLUMN_WIDTHS[0] + HPAD / 2
-        height = (COLUMNS_HEIGHTS[0] + VPAD) * len(INTERVENTION_TYPE_COLORS) + VPAD / 2
         boundary_patch = FancyBboxPatch(
-            (x, y),
-            width,
-            height,
-            boxstyle="round,pad=0,rounding_size=0.005",
+            scaffold.boundary[:2],
+            *scaffold.boundary[2:],
+            boxstyle=_INTERVENTION_BOXSTYLE,
             linewidth=1.5,
             edgecolor="black",
             facecolor="none",
@@ -204,6 +366,74 @@ class FigureGame:
         self, name: str, whats: dict[str, tuple[str, ...] | list[str]]
     ) -> None:
         """Draw the engagement type."""
+        text_engagement = self._draw_engagement_name(name)
+        # then we iterate on the whats and hows
+        y_pos_what = self._y_pos_engagement_init
+        for what, hows in whats.items():
+            # draw the what
+            text_what = self._draw_what(what, y_pos_what, name)
+            self._link(text_engagement, text_what, ENGAGEMENT_TYPE_COLORS[name])
+            # draw the hows
+            y_pos_how = y_pos_what
+            for how in hows:
+                text_how = self._draw_how(how, y_pos_how, ENGAGEMENT_TYPE_COLORS[name])
+                self._link(text_what, text_how, ENGAGEMENT_TYPE_COLORS[name])
+                y_pos_how += text_how._height + VPAD
+            # the next feature starts below this feature and its design principles
+            y_pos_what = max(y_pos_how, y_pos_what + text_what._height + VPAD)
+        self._y_pos_engagement_init = max(
+            self._y_pos_engagement_init + text_engagement._height + VPAD, y_pos_what
+        )
+
+    def _draw_engagements_graph(
+        self, engagements: dict[str, dict[str, tuple[str, ...] | list[str]]]
+    ) -> None:
+        """Draw the engagement types with a single box per distinct design principle.
+
+        The features ("what") are stacked in the third column. Each distinct design
+        principle ("how") is drawn once in the fourth column, at the height of the first
+        feature it supports if possible, and linked to every feature it supports.
+        """
+        # draw the engagements and the whats, and collect the links to the hows
+        links: dict[str, list[tuple[TextBox, str]]] = dict()
+        for name, whats in engagements.items():
+            with (
+                self._phase(f"engagement '{name}'"),
+                span("draw engagement", engagement=name),
+            ):
+                text_engagement = self._draw_engagement_name(name)
+                y_pos_what = self._y_pos_engagement_init
+                for what, hows in whats.items():
+                    text_what = self._draw_what(what, y_pos_what, name)
+                    self._link(text_engagement, text_what, ENGAGEMENT_TYPE_COLORS[name])
+                    for how in hows:
+                        links.setdefault(how, []).append((text_what, name))
+                    y_pos_what += text_what._height + VPAD
+                self._y_pos_engagement_init = max(
+                    self._y_pos_engagement_init + text_engagement._height + VPAD,
+                    y_pos_what,
+                )
+        if len(links) == 0:
+            return None
+        # draw each distinct how once, in order of first appearance
+        with self._phase("design principles"):
+            y_pos_how = self._y_pos_engagement_init_first
+            for how, whats in links.items():
+                y_pos_how = max(y_pos_how, whats[0][0].y)
+                names = {name for _, name in whats}
+                edgecolor = (
+                    ENGAGEMENT_TYPE_COLORS[next(iter(names))]
+                    if len(names) == 1
+                    else "black"
+                )
+                text_how = self._draw_how(how, y_pos_how, edgecolor)
+                for text_what, name in whats:
+                    self._link(text_what, text_how, ENGAGEMENT_TYPE_COLORS[name])
+                y_pos_how += text_how._height + VPAD
+            self._y_pos_engagement_init = max(self._y_pos_engagement_init, y_pos_how)
+
+    def _draw_engagement_name(self, name: str) -> TextBox:
+        """Draw the engagement name in the second column."""
         check_type(name, (str,), "name")
         check_value(name.strip(), ENGAGEMENT_TYPE_COLORS, "name")
         if self._y_pos_engagement_init is None:
@@ -216,12 +446,12 @@ class FigureGame:
                 + VPAD_EXTRA_BELOW_TITLE
                 + VPAD_EXTRA_BELOW_HEADER
             )
-        # first, we can draw the engagement name in the second column
+            self._y_pos_engagement_init_first = self._y_pos_engagement_init
         text_engagement = TextBox(
             text=name,
-            x=COLUMN_WIDTHS[0] + HPAD,
+            x=self._column_widths[0] + HPAD,
             y=self._y_pos_engagement_init,
-            width=COLUMN_WIDTHS[1],
+            width=self._column_widths[1],
             height=COLUMNS_HEIGHTS[1],
             hpad=0.01,
             text_alignment="center",
@@ -236,82 +466,200 @@ class FigureGame:
             ),
         )
         text_engagement.draw(self._ax)
-        # then we iterate on the whats and hows
-        y_pos_what = self._y_pos_engagement_init
-        for what, hows in whats.items():
-            # draw the what
-            text_what = TextBox(
-                text=what,
-                x=np.sum(COLUMN_WIDTHS[:2]) + 2 * HPAD,
-                y=y_pos_what,
-                width=COLUMN_WIDTHS[2],
-                height="auto",
-                hpad=0.01,
-                text_alignment="left",
-                bbox_kwargs=dict(
-                    facecolor="#ffffff",
-                    boxstyle="square,pad=0",
-                    edgecolor=ENGAGEMENT_TYPE_COLORS[name],
-                    linewidth=1.5,
-                ),
-                text_kwargs=dict(
-                    color="black",
-                    font="DejaVu Sans",
-                    fontsize=12,
-                ),
+        self._elements.append(text_engagement)
+        return text_engagement
+
+    def _draw_what(self, what: str, y: float, name: str) -> TextBox:
+        """Draw a game design feature in the third column."""
+        text_kwargs = dict(_BOX_TEXT_KWARGS)
+        text_what = TextBox(
+            text=what,
+            x=np.sum(self._column_widths[:2]) + 2 * HPAD,
+            y=y,
+            width=self._column_widths[2],
+            height="auto",
+            hpad=0.01,
+            text_alignment="left",
+            bbox_kwargs=dict(
+                facecolor="#ffffff",
+                boxstyle="square,pad=0",
+                edgecolor=ENGAGEMENT_TYPE_COLORS[name],
+                linewidth=1.5,
+            ),
+            text_kwargs=text_kwargs,
+        )
+        text_what.draw(self._ax, estimator=self._get_estimator(text_kwargs))
+        self._elements.append(text_what)
+        return text_what
+
+    def _draw_how(self, how: str, y: float, edgecolor: str) -> TextBox:
+        """Draw a design principle in the fourth column."""
+        text_kwargs = dict(_BOX_TEXT_KWARGS)
+        text_how = TextBox(
+            text=how,
+            x=np.sum(self._column_widths[:3]) + 3 * HPAD,
+            y=y,
+            width=self._column_widths[3],
+            height="auto",
+            hpad=0.01,
+            text_alignment="left",
+            bbox_kwargs=dict(
+                facecolor="#ffffff",
+                boxstyle="round,pad=0,rounding_size=0.005",
+                edgecolor=edgecolor,
+                linewidth=1.5,
+            ),
+            text_kwargs=text_kwargs,
+        )
+        text_how.draw(self._ax, estimator=self._get_estimator(text_kwargs))
+        self._elements.append(text_how)
+        return text_how
+
+    def check_layout(self) -> LayoutIssues:
+        """Check that the boxes of the figure do not overlap and fit in the axes.
+
+        The check runs in O(n log n) on the n boxes, see
+        :func:`~gmr.layout.check_layout`, and is cheap compared to the rendering.
+
+        Returns
+        -------
+        issues : LayoutIssues
+            The pairs of overlapping boxes and the boxes outside the axes.
+        """
+        self._check_drawn()
+        xlim = self._ax.get_xlim()
+        ylim = self._ax.get_ylim()
+        issues = check_layout(
+            self._elements, (min(xlim), max(xlim), min(ylim), max(ylim))
+        )
+        for elt1, elt2 in issues.overlaps:
+            logger.debug(
+                "The boxes '%s' and '%s' of '%s' overlap.",
+                elt1._text,
+                elt2._text,
+                self._name,
             )
-            text_what.draw(self._ax)
-            link(
-                self._ax,
-                text_engagement,
-                text_what,
-                kwargs=dict(
-                    facecolor="none",
-                    edgecolor=ENGAGEMENT_TYPE_COLORS[name],
-                    linewidth=1.5,
-                ),
+        for elt in issues.out_of_bounds:
+            logger.debug(
+                "The box '%s' of '%s' is out of bounds.", elt._text, self._name
             )
-            # draw the hows
-            y_pos_how = y_pos_what
-            for how in hows:
-                text_how = TextBox(
-                    text=how,
-                    x=np.sum(COLUMN_WIDTHS[:3]) + 3 * HPAD,
-                    y=y_pos_how,
-                    width=COLUMN_WIDTHS[3],
-                    height="auto",
-                    hpad=0.01,
-                    text_alignment="left",
-                    bbox_kwargs=dict(
-                        facecolor="#ffffff",
-                        boxstyle="round,pad=0,rounding_size=0.005",
-                        edgecolor=ENGAGEMENT_TYPE_COLORS[name],
-                        linewidth=1.5,
-                    ),
-                    text_kwargs=dict(
-                        color="black",
-                        font="DejaVu Sans",
-                        fontsize=12,
-                    ),
-                )
-                text_how.draw(self._ax)
-                link(
-                    self._ax,
-                    text_what,
-                    text_how,
-                    kwargs=dict(
-                        facecolor="none",
-                        edgecolor=ENGAGEMENT_TYPE_COLORS[name],
-                        linewidth=1.5,
-                    ),
-                )
-                y_pos_how += text_how._height + VPAD
-                y_pos_what += text_how._height + VPAD
-        self._y_pos_engagement_init = max(
-            self._y_pos_engagement_init + text_engagement._height + VPAD, y_pos_what
+        return issues
+
+    def _get_estimator(self, text_kwargs: dict) -> TextHeightEstimator | None:
+        """Get the height estimator of the text properties in draft mode."""
+        if not self._draft:
+            return None
+        estimator = get_estimator(text_kwargs["font"], text_kwargs["fontsize"])
+        self._estimators.add(estimator)
+        return estimator
+
+    def _link(self, eltA: TextBox, eltB: TextBox, color: str) -> None:
+        """Link two boxes with a line of the given color."""
+        link(
+            self._ax,
+            eltA,
+            eltB,
+            kwargs=dict(facecolor="none", edgecolor=color, linewidth=1.5),
         )
 
+    @property
+    def column_widths(self) -> tuple[float, float, float, float]:
+        """The widths of the 4 columns, optimized when the figure is drawn."""
+        return self._column_widths
+
+    @property
+    def draft(self) -> bool:
+        """Whether the figure is drawn in draft mode."""
+        return self._draft
+
+    @property
+    def estimator_calibration_error(self) -> float | None:
+        """Calibration error of the height estimators used in draft mode.
+
+        This is the maximum relative deviation between the estimated and the measured
+        heights on the calibration texts of the estimators, i.e. a calibration bound.
+        It is not the deviation of the boxes drawn in this figure, which are never
+        measured in draft mode. None if the figure is not drawn in draft mode.
+        """
+        if not self._draft:
+            return None
+        return max((est.max_error for est in self._estimators), default=0.0)
+
+    @property
+    def layout(self) -> str:
+        """The layout of the design principles."""
+        return self._layout
+
     @property
     def name(self) -> str:
         """The name of the game."""
         return self._name
+
+
+@lru_cache(maxsize=16)
+def _get_scaffold(column_widths: tuple[float, float, float, float]) -> _Scaffold:
+    """Get the static parts of the figures, built once per process and column widths.
+
+    The boxes have fixed heights and static texts: they are stamped on each figure by
+    drawing them, and their wrapped texts are cached, see :class:`~gmr.text.TextBox`.
+    """
+    y_header = _TITLE_HEIGHT + VPAD + VPAD_EXTRA_BELOW_TITLE
+    headers = []
+    x_pos = 0
+    for k, header in enumerate(_HEADERS):
+        headers.append(
+            TextBox(
+                text=header,
+                x=x_pos,
+                y=y_header,
+                width=column_widths[k],
+                height=_HEADER_HEIGHT,
+                hpad=0.01,
+                text_alignment="center",
+                bbox_kwargs=dict(
+                    facecolor="#eeeeee",
+                    edgecolor="black",
+                    boxstyle=BoxStyle("square", pad=0)
+                    if k == 2
+                    else BoxStyle("round", pad=0, rounding_size=0.01),
+                ),
+                text_kwargs=dict(color="black", font="Corbel", fontsize=18),
+                static=True,
+            )
+        )
+        x_pos += column_widths[k] + HPAD
+    y_pos = y_header + _HEADER_HEIGHT + VPAD + VPAD_EXTRA_BELOW_HEADER
+    interventions = dict()
+    for inter in INTERVENTION_TYPE_ORDER:
+        interventions[inter] = tuple(
+            TextBox(
+                text=inter,
+                x=0,
+                y=y_pos,
+                width=column_widths[0],
+                height=COLUMNS_HEIGHTS[0],
+                hpad=0.01,
+                text_alignment="center",
+                bbox_kwargs=dict(
+                    facecolor=INTERVENTION_TYPE_COLORS[inter]
+                    + ("ff" if active else "10"),
+                    boxstyle=_INTERVENTION_BOXSTYLE,
+                    edgecolor="black" if active else "lightgray",
+                ),
+                text_kwargs=dict(
+                    color="black" if active else "lightgray",
+                    font="DejaVu Sans",
+                    fontsize=14,
+                ),
+                static=True,
+            )
+            for active in (False, True)
+        )
+        y_pos += COLUMNS_HEIGHTS[0] + VPAD
+    boundary = (
+        -HPAD / 4,
+        y_header + _HEADER_HEIGHT + 0.25 * VPAD + VPAD_EXTRA_BELOW_HEADER,
+        column_widths[0] + HPAD / 2,
+        (COLUMNS_HEIGHTS[0] + VPAD) * len(INTERVENTION_TYPE_COLORS) + VPAD / 2,
+    )
+    return _Scaffold(tuple(headers), interventions, boundary)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from ._base import BaseFigure
+from ._constants import (
+    ENGAGEMENT_TYPE_COLORS,
+    ENGAGEMENT_TYPE_ORDER,
+    INTERVENTION_TYPE_COLORS,
+    INTERVENTION_TYPE_ORDER,
+)
+from .corpus import Corpus
+from .utils._checks import check_type
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from numpy.typing import NDArray
+
+
+class FigureCooccurrence(BaseFigure):
+    """A figure of the co-occurrences across a corpus of games.
+
+    The figure has 2 annotated heatmaps:
+
+    - the number of games combining each intervention type with each type of
+      engagement.
+    - the number of games in which each design principle supports each type of
+      engagement, for the most frequent design principles.
+
+    The matrices are computed with vectorized group-by operations on the columnar
+    arrays of the corpus, see :meth:`~gmr.corpus.Corpus.count`.
+
+    Parameters
+    ----------
+    corpus : Corpus
+        The corpus of games.
+    figsize : tuple of int
+        The size of the figure.
+    n_principles : int
+        The number of design principles displayed, selected by decreasing number of
+        games.
+    """
+
+    def __init__(
+        self,
+        corpus: Corpus,
+        *,
+        figsize: tuple[int, int] = (15, 10),
+        n_principles: int = 20,
+    ) -> None:
+        check_type(corpus, (Corpus,), "corpus")
+        check_type(figsize, (tuple,), "figsize")
+        if len(figsize) != 2:
+            raise ValueError("figsize must be a tuple of 2 integers.")
+        check_type(figsize[0], ("int-like",), "figsize[0]")
+        check_type(figsize[1], ("int-like",), "figsize[1]")
+        check_type(n_principles, ("int-like",), "n_principles")
+        if n_principles <= 0:
+            raise ValueError(
+                "The number of design principles must be strictly positive, got "
+                f"{n_principles}."
+            )
+        self._corpus = corpus
+        self._figsize = figsize
+        self._n_principles = n_principles
+        super().__init__()
+
+    def draw(self) -> None:
+        """Draw the heatmaps on matplotlib axes."""
+        if len(self._corpus) == 0:
+            raise ValueError("The corpus does not contain any game.")
+        interventions, principles, labels = self.matrices()
+        self._fig, self._ax = plt.subplots(
+            1,
+            2,
+            figsize=self._figsize,
+            layout="constrained",
+            facecolor="white",
+            gridspec_kw=dict(width_ratios=(1, 2)),
+        )
+        try:
+            self._draw(interventions, principles, labels)
+        except BaseException:
+            self.close()
+            raise
+
+    def _draw(
+        self,
+        interventions: NDArray[np.int64],
+        principles: NDArray[np.int64],
+        labels: tuple[str, ...],
+    ) -> None:
+        """Draw the heatmaps on the created axes."""
+        self._fig.suptitle(
+            f"Co-occurrences across {len(self._corpus)} games", fontsize=18
+        )
+        _draw_heatmap(self._ax[0], interventions, "Blues")
+        _set_ticklabels(
+            self._ax[0],
+            ENGAGEMENT_TYPE_ORDER,
+            INTERVENTION_TYPE_ORDER,
+            ENGAGEMENT_TYPE_COLORS,
+            INTERVENTION_TYPE_COLORS,
+        )
+        self._ax[0].set_title("Intervention type × type of engagement")
+        self._ax[1].set_title("Type of engagement × design principle")
+        if len(labels) == 0:  # no game lists a design principle
+            self._ax[1].text(
+                0.5,
+                0.5,
+                "No design principle in the corpus.",
+                ha="center",
+                va="center",
+                transform=self._ax[1].transAxes,
+            )
+            self._ax[1].set_axis_off()
+            return
+        _draw_heatmap(self._ax[1], principles, "Greens")
+        _set_ticklabels(
+            self._ax[1], labels, ENGAGEMENT_TYPE_ORDER, None, ENGAGEMENT_TYPE_COLORS
+        )
+
+    def matrices(self) -> tuple[NDArray[np.int64], NDArray[np.int64], tuple[str, ...]]:
+        """Compute the co-occurrence matrices.
+
+        Returns
+        -------
+        interventions : array of shape (n_intervention_types, n_engagement_types)
+            The number of games combining each intervention type with each type of
+            engagement, in the order of ``INTERVENTION_TYPE_ORDER`` and
+            ``ENGAGEMENT_TYPE_ORDER``.
+        principles : array of shape (n_engagement_types, n_principles)
+            The number of games in which each design principle supports each type of
+            engagement, for the most frequent design principles.
+        labels : tuple of str
+            The displayed design principles, by decreasing number of games.
+        """
+        interventions = self._corpus.count("intervention", "engagement")
+        principles = self._corpus.count("engagement", "how")
+        # select the most frequent design principles, number of games as tie-breaker
+        total = self._corpus.count("how")
+        order = np.argsort(-total, kind="stable")[: self._n_principles]
+        labels = self._corpus.labels("how")
+        return interventions, principles[:, order], tuple(labels[k] for k in order)
+
+
+def _draw_heatmap(ax: Axes, matrix: NDArray[np.int64], cmap: str) -> None:
+    """Draw an annotated heatmap of a co-occurrence matrix."""
+    image = ax.imshow(matrix, cmap=cmap, vmin=0, aspect="auto")
+    # white annotations on the dark cells
+    threshold = matrix.max(initial=0) / 2
+    for (row, col), value in np.ndenumerate(matrix):
+        ax.text(
+            col,
+            row,
+            str(value),
+            ha="center",
+            va="center",
+            color="white" if threshold < value else "black",
+        )
+    ax.figure.colorbar(image, ax=ax, label="Number of games", shrink=0.8)
+    ax.tick_params(length=0)
+    ax.spines[:].set_visible(False)
+
+
+def _set_ticklabels(
+    ax: Axes,
+    xlabels: tuple[str, ...],
+    ylabels: tuple[str, ...],
+    xcolors: dict[str, str] | None,
+    ycolors: dict[str, str] | None,
+) -> None:
+    """Set the tick labels, on the background color of their type if available."""
+    ax.set_xticks(np.arange(len(xlabels)), xlabels, rotation=45, ha="right")
+    ax.set_yticks(np.arange(len(ylabels)), ylabels)
+    for ticklabels, colors in (
+        (ax.get_xticklabels(), xcolors),
+        (ax.get_yticklabels(), ycolors),
+    ):
+        if colors is None:
+            continue
+        for ticklabel in ticklabels:
+            ticklabel.set_bbox(
+                dict(
+                    facecolor=colors[ticklabel.get_text()],
+                    edgecolor="none",
+                    boxstyle="round,pad=0.2",
+                )
+            )
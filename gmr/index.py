@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._constants import ENGAGEMENT_TYPE_ORDER, INTERVENTION_TYPE_ORDER
+from .utils._checks import check_type, check_value
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from numpy.typing import NDArray
+
+    from .corpus import Corpus
+
+
+_FIELDS: tuple[str, ...] = ("intervention", "engagement", "what", "how", "link")
+
+
+class CorpusIndex:
+    """Inverted index of a corpus, mapping each term to the games it appears in.
+
+    The terms are the intervention types, the engagement types, the features ("what"),
+    the design principles ("how") and the links between a feature and a design
+    principle. The posting list of each term is the sorted array of the indices of the
+    games in which it appears. Boolean queries are answered by combining the posting
+    lists as bitmaps over the games.
+
+    Parameters
+    ----------
+    corpus : Corpus
+        The indexed corpus. The index is a snapshot and does not reflect the games added
+        afterwards, see :attr:`~gmr.corpus.Corpus.index` for an index kept up to date.
+    """
+
+    def __init__(self, corpus: Corpus) -> None:
+        self._corpus = corpus
+        self._n_games = len(corpus)
+        self._postings: dict[str, tuple[NDArray, NDArray, NDArray]] = dict()
+        for field in ("intervention", "engagement", "what", "how"):
+            rows = corpus.rows(field)
+            self._postings[field] = _build_postings(rows[:, 1], rows[:, 0])
+        rows = corpus.rows("what", "how")
+        self._n_hows = len(corpus.labels("how"))
+        self._postings["link"] = _build_postings(
+            rows[:, 1] * self._n_hows + rows[:, 2], rows[:, 0]
+        )
+
+    def postings(self, field: str, value: Any) -> NDArray[np.int64]:
+        """Get the posting list of a term.
+
+        Parameters
+        ----------
+        field : str
+            The field of the term, one of ``'intervention'``, ``'engagement'``,
+            ``'what'``, ``'how'`` or ``'link'``.
+        value : str | tuple of str
+            The value of the term. For the field ``'link'``, the value is a tuple
+            ``(what, how)``.
+
+        Returns
+        -------
+        games : array of int
+            The sorted indices of the games in which the term appears. Unknown values
+            yield an empty array.
+        """
+        check_type(field, (str,), "field")
+        check_value(field, _FIELDS, "field")
+        key = self._key(field, value)
+        keys, offsets, games = self._postings[field]
+        idx = np.searchsorted(keys, key) if key is not None else keys.size
+        if idx == keys.size or keys[idx] != key:
+            return np.empty(0, dtype=np.int64)
+        return games[offsets[idx] : offsets[idx + 1]]
+
+    def query(
+        self,
+        all_of: list[tuple[str, Any]] | tuple[tuple[str, Any], ...] | None = None,
+        any_of: list[tuple[str, Any]] | tuple[tuple[str, Any], ...] | None = None,
+    ) -> NDArray[np.int64]:
+        """Select the games matching a boolean query.
+
+        Parameters
+        ----------
+        all_of : list of tuple | None
+            The terms which must all appear in a game (AND), as ``(field, value)``
+            tuples, see :meth:`~CorpusIndex.postings`.
+        any_of : list of tuple | None
+            The terms of which at least one must appear in a game (OR), as
+            ``(field, value)`` tuples.
+
+        Returns
+        -------
+        games : array of int
+            The sorted indices of the matching games.
+
+        Examples
+        --------
+        The games with a behavioral engagement which link the feature "Score" to the
+        design principle "Rewards" or "Immediate feedback":
+
+        >>> corpus.index.query(
+        ...     all_of=[("engagement", "Behavioral")],
+        ...     any_of=[
+        ...         ("link", ("Score", "Rewards")),
+        ...         ("link", ("Score", "Immediate feedback")),
+        ...     ],
+        ... )  # doctest: +SKIP
+        """
+        check_type(all_of, (list, tuple, None), "all_of")
+        check_type(any_of, (list, tuple, None), "any_of")
+        if not all_of and not any_of:
+            raise ValueError("At least one term must be provided.")
+        mask = np.ones(self._n_games, dtype=bool)
+        for field, value in all_of or ():
+            mask &= self._bitmap(field, value)
+        if any_of:
+            mask_any = np.zeros(self._n_games, dtype=bool)
+            for field, value in any_of:
+                mask_any |= self._bitmap(field, value)
+            mask &= mask_any
+        return np.flatnonzero(mask)
+
+    def _bitmap(self, field: str, value: Any) -> NDArray[np.bool_]:
+        """Get the posting list of a term as a bitmap over the games."""
+        bitmap = np.zeros(self._n_games, dtype=bool)
+        bitmap[self.postings(field, value)] = True
+        return bitmap
+
+    def _key(self, field: str, value: Any) -> int | None:
+        """Get the integer key of a term, None if the value is unknown."""
+        if field == "intervention":
+            order = INTERVENTION_TYPE_ORDER
+            return order.index(value) if value in order else None
+        elif field == "engagement":
+            order = ENGAGEMENT_TYPE_ORDER
+            return order.index(value) if value in order else None
+        elif field == "what":
+            return self._corpus._whats.get_id(value)
+        elif field == "how":
+            return self._corpus._hows.get_id(value)
+        check_type(value, (tuple, list), "value")
+        if len(value) != 2:
+            raise ValueError(
+                "The value of a link must be a tuple (what, how), got "
+                f"{len(value)} element(s)."
+            )
+        what = self._corpus._whats.get_id(value[0])
+        how = self._corpus._hows.get_id(value[1])
+        if what is None or how is None or self._n_hows <= how:
+            return None
+        return what * self._n_hows + how
+
+    @property
+    def n_games(self) -> int:
+        """The number of indexed games."""
+        return self._n_games
+
+
+def _build_postings(
+    keys: NDArray[np.int64], games: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """Build the posting lists from the (key, game) pairs.
+
+    Returns the sorted unique keys, the offsets of the posting list of each key and the
+    concatenated posting lists.
+    """
+    pairs = np.unique(np.stack([keys, games], axis=1).reshape(-1, 2), axis=0)
+    unique_keys, starts = np.unique(pairs[:, 0], return_index=True)
+    offsets = np.append(starts, pairs.shape[0])
+    return unique_keys, offsets, np.ascontiguousarray(pairs[:, 1])
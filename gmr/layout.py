@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from ._constants import COLUMN_WIDTHS, COLUMNS_HEIGHTS, VPAD
+from .estimator import measure_text_height
+from .utils._checks import check_type, check_value
+from .utils.logs import warn
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from matplotlib.axes import Axes
+
+    from ._base import BaseElement
+    from .estimator import TextHeightEstimator
+
+
+# bounds on the widths of the "what" and "how" columns, in fraction of the axes
+WIDTH_BOUNDS: tuple[float, float] = (0.15, 0.45)
+WIDTH_STEP: float = 0.01
+
+
+def optimize_column_widths(
+    engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
+    ax: Axes,
+    *,
+    layout: str = "tree",
+    font: str = "DejaVu Sans",
+    fontsize: float = 12,
+    hpad: float = 0.01,
+    estimator: TextHeightEstimator | None = None,
+    bounds: tuple[float, float] = WIDTH_BOUNDS,
+    step: float = WIDTH_STEP,
+) -> tuple[float, float, float, float]:
+    """Search the widths of the "what" and "how" columns minimizing the height.
+
+    The total width of the "what" and "how" columns is fixed to the sum of their
+    default widths in ``COLUMN_WIDTHS``, and the width of the "what" column is searched
+    on a grid within the bounds. The height of each text is measured once per text and
+    width, see :func:`~gmr.estimator.measure_text_height`, so evaluating each
+    candidate only sums cached measurements.
+
+    Parameters
+    ----------
+    engagements : dict
+        The engagements of the game, see :meth:`~gmr.figure.FigureGame.draw`.
+    ax : Axes
+        The axes on which the game is drawn, used to convert the widths to points and
+        the heights to data coordinates.
+    layout : str
+        The layout of the design principles, ``'tree'`` or ``'graph'``, see
+        :class:`~gmr.figure.FigureGame`.
+    font : str
+        The font family of the features and design principles.
+    fontsize : float
+        The font size of the features and design principles, in points.
+    hpad : float
+        The horizontal padding of the text within the boxes, in data coordinates.
+    estimator : TextHeightEstimator | None
+        If provided, the heights are estimated with this estimator instead of being
+        measured with the renderer.
+    bounds : tuple of float
+        The minimum and maximum widths of the "what" and "how" columns, in data
+        coordinates.
+    step : float
+        The step of the grid of candidate widths, in data coordinates.
+
+    Returns
+    -------
+    widths : tuple of float
+        The widths of the 4 columns.
+    """
+    check_type(layout, (str,), "layout")
+    check_value(layout, ("tree", "graph"), "layout")
+    check_type(bounds, (tuple,), "bounds")
+    if len(bounds) != 2 or not 2 * hpad < bounds[0] <= bounds[1]:
+        raise ValueError(
+            "The bounds must be a tuple (min, max) with min larger than the padding, "
+            f"got {bounds}."
+        )
+    check_type(step, ("numeric",), "step")
+    if step <= 0:
+        raise ValueError(f"The step must be strictly positive, got {step}.")
+    total = COLUMN_WIDTHS[2] + COLUMN_WIDTHS[3]
+    low = max(bounds[0], total - bounds[1])
+    high = min(bounds[1], total - bounds[0])
+    if high < low:
+        raise ValueError(
+            f"The bounds {bounds} are incompatible with the total width {total:.2f} "
+            "of the 'what' and 'how' columns."
+        )
+    model = _HeightModel(ax, layout, font, fontsize, hpad, estimator)
+    candidates = np.round(np.arange(low, high + step / 2, step), 6)
+    # prefer the default widths between candidates of equal height
+    candidates = candidates[
+        np.argsort(np.abs(candidates - COLUMN_WIDTHS[2]), kind="stable")
+    ]
+    best, best_height = COLUMN_WIDTHS[2], np.inf
+    for width_what in candidates:
+        candidate_height = model.height(engagements, (width_what, total - width_what))
+        if candidate_height < best_height - 1e-9:
+            best, best_height = float(width_what), candidate_height
+    return COLUMN_WIDTHS[0], COLUMN_WIDTHS[1], best, round(total - best, 6)
+
+
+def paginate(
+    engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
+    ax: Axes,
+    max_height: float,
+    *,
+    layout: str = "tree",
+    widths: tuple[float, float, float, float] = COLUMN_WIDTHS,
+    font: str = "DejaVu Sans",
+    fontsize: float = 12,
+    hpad: float = 0.01,
+    estimator: TextHeightEstimator | None = None,
+) -> list[dict[str, dict[str, tuple[str, ...] | list[str]]]]:
+    """Split the engagements of a game across pages of a maximum height.
+
+    The engagements are packed greedily on each page, in order, and an engagement
+    which does not fit on the current page starts a new page. An engagement taller than
+    a page is split at the boundaries between its features ("what"), filling the
+    current page first, and the engagement type is repeated with each part. A single
+    feature taller than a page is kept whole on its page.
+
+    Parameters
+    ----------
+    engagements : dict
+        The engagements of the game, see :meth:`~gmr.figure.FigureGame.draw`.
+    ax : Axes
+        The axes on which the pages are drawn, used to convert the widths to points and
+        the heights to data coordinates.
+    max_height : float
+        The maximum height of the engagements on a page, in data coordinates.
+    layout : str
+        The layout of the design principles, ``'tree'`` or ``'graph'``, see
+        :class:`~gmr.figure.FigureGame`.
+    widths : tuple of float
+        The widths of the 4 columns.
+    font : str
+        The font family of the features and design principles.
+    fontsize : float
+        The font size of the features and design principles, in points.
+    hpad : float
+        The horizontal padding of the text within the boxes, in data coordinates.
+    estimator : TextHeightEstimator | None
+        If provided, the heights are estimated with this estimator instead of being
+        measured with the renderer.
+
+    Returns
+    -------
+    pages : list of dict
+        The engagements of each page.
+    """
+    check_type(layout, (str,), "layout")
+    check_value(layout, ("tree", "graph"), "layout")
+    check_type(max_height, ("numeric",), "max_height")
+    if max_height <= 0:
+        raise ValueError(
+            f"The maximum height must be strictly positive, got {max_height}."
+        )
+    model = _HeightModel(ax, layout, font, fontsize, hpad, estimator)
+
+    def fits(page: dict[str, dict[str, tuple[str, ...] | list[str]]]) -> bool:
+        return model.height(page, widths[2:]) <= max_height
+
+    pages = []
+    page = dict()
+    for name, whats in engagements.items():
+        if fits({**page, name: whats}):
+            page[name] = whats
+            continue
+        if fits({name: whats}):
+            pages.append(page)
+            page = {name: whats}
+            continue
+        # split the engagement between its features, starting on the current page
+        part = dict()
+        for what, hows in whats.items():
+            if not fits({**page, name: {**part, what: hows}}) and (page or part):
+                pages.append({**page, name: part} if len(part) != 0 else page)
+                page, part = dict(), dict()
+            if len(page) == 0 and len(part) == 0 and not fits({name: {what: hows}}):
+                warn(
+                    f"The feature '{what}' of the engagement '{name}' is taller than "
+                    "a page and can not be split."
+                )
+            part[what] = hows
+        page[name] = part
+    if len(page) != 0 or len(pages) == 0:
+        pages.append(page)
+    return pages
+
+
+class LayoutIssues(NamedTuple):
+    """The problems found in the layout of a figure, see :func:`check_layout`."""
+
+    overlaps: list[tuple[BaseElement, BaseElement]]
+    out_of_bounds: list[BaseElement]
+
+
+def check_layout(
+    elements: list[BaseElement],
+    bounds: tuple[float, float, float, float],
+    *,
+    tol: float = 1e-6,
+) -> LayoutIssues:
+    """Find the overlapping elements and the elements outside the bounds.
+
+    The overlaps are found with a sweep-line along the y-axis: the elements are sorted
+    by their top edge, and each element is only compared to the elements crossing its
+    top edge. The check runs in O(n log n + k), with k the number of reported pairs.
+    In the column layout of the figures, at most one element per column crosses a
+    horizontal line unless elements overlap, thus k is small on a valid layout. In the
+    worst case, e.g. when all the elements overlap, k and the check are O(n²).
+
+    Parameters
+    ----------
+    elements : list of BaseElement
+        The drawn elements, with their extents in data coordinates.
+    bounds : tuple of float
+        The bounds ``(xmin, xmax, ymin, ymax)`` of the axes, in data coordinates.
+    tol : float
+        The tolerance on the extents, in data coordinates. Elements which only touch
+        do not overlap.
+
+    Returns
+    -------
+    issues : LayoutIssues
+        The pairs of overlapping elements, in order of their top edges, and the
+        elements outside the bounds.
+    """
+    check_type(elements, (list, tuple), "elements")
+    check_type(bounds, (tuple,), "bounds")
+    if len(bounds) != 4 or not (bounds[0] <= bounds[1] and bounds[2] <= bounds[3]):
+        raise ValueError(
+            f"The bounds must be a tuple (xmin, xmax, ymin, ymax), got {bounds}."
+        )
+    check_type(tol, ("numeric",), "tol")
+    extents = [
+        (elt.x, elt.x + elt.width, elt.y, elt.y + elt.height) for elt in elements
+    ]
+    xmin, xmax, ymin, ymax = bounds
+    out_of_bounds = [
+        elt
+        for elt, (x0, x1, y0, y1) in zip(elements, extents, strict=True)
+        if x0 < xmin - tol or xmax + tol < x1 or y0 < ymin - tol or ymax + tol < y1
+    ]
+    overlaps = []
+    active = []  # heap of (bottom edge, index) of the elements crossing the line
+    for k in sorted(range(len(elements)), key=lambda k: extents[k][2]):
+        x0, x1, y0, y1 = extents[k]
+        while len(active) != 0 and active[0][0] <= y0 + tol:
+            heapq.heappop(active)
+        for _, j in active:
+            if tol < min(x1, extents[j][1]) - max(x0, extents[j][0]):
+                overlaps.append((elements[j], elements[k]))
+        if tol < y1 - y0:
+            heapq.heappush(active, (y1, k))
+    return LayoutIssues(overlaps, out_of_bounds)
+
+
+class _HeightModel:
+    """Model of the height of the engagements, from cached text measurements."""
+
+    def __init__(
+        self,
+        ax: Axes,
+        layout: str,
+        font: str,
+        fontsize: float,
+        hpad: float,
+        estimator: TextHeightEstimator | None,
+    ) -> None:
+        # conversion from data coordinates to points, with the transform of the axes
+        x0, y0 = ax.transData.transform((0, 0))
+        x1, y1 = ax.transData.transform((1, 1))
+        self._pt_per_x = abs(x1 - x0) * 72 / ax.figure.dpi
+        self._y_per_pt = ax.figure.dpi / 72 / abs(y1 - y0)
+        self._layout = layout
+        self._font = font
+        self._fontsize = fontsize
+        self._hpad = hpad
+        self._estimator = estimator
+
+    def _text_height(self, text: str, width: float) -> float:
+        """Get the height of a text in data coordinates, for a width in points."""
+        if self._estimator is not None:
+            height = self._estimator.estimate(text, width)
+        else:
+            height = measure_text_height(text, width, self._font, self._fontsize)
+        return height * self._y_per_pt
+
+    def height(
+        self,
+        engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
+        widths: tuple[float, float],
+    ) -> float:
+        """Get the height of the engagements, for the widths of the last 2 columns."""
+        # widths in points, rounded to share the cached measurements
+        widths = tuple(
+            round((width - 2 * self._hpad) * self._pt_per_x, 1) for width in widths
+        )
+        cost = _tree_height if self._layout == "tree" else _graph_height
+        return cost(engagements, widths, self._text_height)
+
+
+def _tree_height(
+    engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
+    widths: tuple[float, float],
+    height: Callable[[str, float], float],
+) -> float:
+    """Get the height of the engagements with the design principles in a tree.
+
+    The feature ("what") boxes are accounted for, to avoid a feature overflowing its
+    design principles.
+    """
+    total = 0
+    for whats in engagements.values():
+        rows = sum(
+            max(
+                height(what, widths[0]) + VPAD,
+                sum(height(how, widths[1]) + VPAD for how in hows),
+            )
+            for what, hows in whats.items()
+        )
+        total += max(COLUMNS_HEIGHTS[1] + VPAD, rows)
+    return total
+
+
+def _graph_height(
+    engagements: dict[str, dict[str, tuple[str, ...] | list[str]]],
+    widths: tuple[float, float],
+    height: Callable[[str, float], float],
+) -> float:
+    """Get the height of the engagements with each design principle drawn once."""
+    whats = sum(
+        max(
+            COLUMNS_HEIGHTS[1] + VPAD,
+            sum(height(what, widths[0]) + VPAD for what in engagement),
+        )
+        for engagement in engagements.values()
+    )
+    hows = {
+        how
+        for engagement in engagements.values()
+        for hows in engagement.values()
+        for how in hows
+    }
+    return max(whats, sum(height(how, widths[1]) + VPAD for how in hows))
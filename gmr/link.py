@@ -5,10 +5,13 @@ from typing import TYPE_CHECKING
 from matplotlib.patches import PathPatch
 from matplotlib.path import Path
 
+from .utils.tracing import traced
+
 if TYPE_CHECKING:
     from ._base import BaseElement
 
 
+@traced("link")
 def link(ax, eltA: BaseElement, eltB: BaseElement, kwargs: dict | None = None) -> None:
     """Draw a link between the right side of box A and the left side of box B.
 
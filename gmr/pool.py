@@ -0,0 +1,585 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, Future
+from contextlib import nullcontext
+from multiprocessing.connection import wait
+from typing import TYPE_CHECKING
+
+import psutil
+
+from .utils._checks import check_type, ensure_int
+from .utils.logs import logger, use_log_queue
+from .utils.tracing import _TRACER, TraceRecorder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from queue import Queue
+    from typing import Any
+
+# font families of the figures, resolved once per worker
+_FONTS: tuple[str, ...] = ("Consolas", "Corbel", "DejaVu Sans")
+# interval in seconds at which the memory of the running tasks is checked
+_BUDGET_INTERVAL: float = 0.05
+
+
+class _Task:
+    """A task submitted to the pool."""
+
+    __slots__ = ("args", "fn", "future", "kwargs", "recorder")
+
+    def __init__(
+        self,
+        future: Future,
+        fn: Callable,
+        args: tuple,
+        kwargs: dict[str, Any],
+        recorder: TraceRecorder | None,
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.recorder = recorder
+
+
+class _Worker:
+    """The parent side of a worker process."""
+
+    __slots__ = ("conn", "process", "ps", "ready", "rss", "started", "task")
+
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.ps = psutil.Process(process.pid)
+        self.conn = conn
+        self.ready = False  # True once warmed up
+        self.task: _Task | None = None
+        # start time and resident memory of the worker when the task was dispatched
+        self.started = 0.0
+        self.rss = 0
+
+
+class RenderPool(Executor):
+    """Pool of pre-warmed worker processes rendering the figures.
+
+    Each worker is spawned and warmed up once: matplotlib and the figures are imported,
+    the fonts of the figures are resolved, and a game is drawn and rendered to load the
+    font files and warm the renderer and the text measurement caches. A worker is
+    recycled, i.e. replaced by a new warm worker, after a number of tasks or once its
+    resident memory exceeds a ceiling, to bound the memory slowly leaked by long-lived
+    processes.
+
+    A task can be given a budget in wall time and in memory, so that a pathological
+    input does not stall the pool: the worker running a task which exceeds its budget
+    is killed and replaced, and the future of the task fails with a
+    :class:`TimeoutError` or a :class:`MemoryError`, while the other workers keep
+    going.
+
+    The pool is a :class:`~concurrent.futures.Executor`: the tasks are submitted with
+    :meth:`submit` or :meth:`map`, and the pool can be used as the executor of an
+    :class:`~gmr.render.AsyncRenderer`.
+
+    Parameters
+    ----------
+    n_workers : int | None
+        The number of worker processes. If None, the number of CPUs.
+    max_tasks : int | None
+        The number of tasks after which a worker is recycled. If None, the workers are
+        not recycled after a number of tasks.
+    max_rss : float | None
+        The resident memory in MiB above which a worker is recycled, checked after each
+        task. If None, the workers are not recycled on their memory.
+    timeout : float | None
+        The wall time in seconds allowed to a task. If None, the tasks are not limited
+        in time.
+    max_memory : float | None
+        The memory in MiB a task can allocate, measured as the growth of the resident
+        memory of its worker since the start of the task. The resident memory is
+        sampled every 50 ms, see the notes. If None, the tasks are not limited in
+        memory.
+    log_queue : Queue | None
+        If provided, the queue returned by :func:`~gmr.start_log_listener` to which the
+        workers send their logs. The queue must be created from the ``'spawn'``
+        context.
+
+    Notes
+    -----
+    The tasks must be picklable, e.g. functions defined at the top level of a module.
+    If the submitting code runs within a :class:`~gmr.TraceRecorder`, the spans
+    recorded by the worker are added to the recorder of the caller.
+
+    The memory budget is a sampled difference of resident memory, not a hard limit: an
+    allocation spike shorter than the sampling interval of 50 ms can go unnoticed, and
+    the memory retained by the previous tasks of a worker is part of the resident
+    memory at the start of a task, thus not charged to the task. The memory retained
+    across tasks is bounded by ``max_rss`` instead.
+
+    The budgets are enforced by killing the worker, which can not clean up: a worker
+    killed while writing to the ``log_queue`` can leave the queue unusable for the
+    other workers. The budgets are meant as a safeguard against the rare pathological
+    input, not as a regular control flow.
+    """
+
+    def __init__(
+        self,
+        n_workers: int | None = None,
+        *,
+        max_tasks: int | None = 100,
+        max_rss: float | None = None,
+        timeout: float | None = None,
+        max_memory: float | None = None,
+        log_queue: Queue | None = None,
+    ) -> None:
+        n_workers = os.cpu_count() if n_workers is None else n_workers
+        n_workers = ensure_int(n_workers, "n_workers")
+        if n_workers <= 0:
+            raise ValueError(
+                f"The number of workers must be strictly positive, got {n_workers}."
+            )
+        if max_tasks is not None:
+            max_tasks = ensure_int(max_tasks, "max_tasks")
+            if max_tasks <= 0:
+                raise ValueError(
+                    "The number of tasks per worker must be strictly positive, got "
+                    f"{max_tasks}."
+                )
+        check_type(max_rss, ("numeric", None), "max_rss")
+        if max_rss is not None and max_rss <= 0:
+            raise ValueError(
+                f"The memory ceiling must be strictly positive, got {max_rss} MiB."
+            )
+        check_type(timeout, ("numeric", None), "timeout")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"The timeout must be strictly positive, got {timeout}.")
+        check_type(max_memory, ("numeric", None), "max_memory")
+        if max_memory is not None and max_memory <= 0:
+            raise ValueError(
+                f"The memory budget must be strictly positive, got {max_memory} MiB."
+            )
+        self._n_workers = n_workers
+        self._max_tasks = max_tasks
+        self._max_rss = max_rss
+        self._timeout = timeout
+        self._max_memory = max_memory
+        self._log_queue = log_queue
+        self._verbose = logger.getEffectiveLevel()
+        self._ctx = multiprocessing.get_context("spawn")
+        self._pending: deque[_Task] = deque()
+        self._workers: dict[Connection, _Worker] = dict()
+        self._n_recycled = 0
+        self._shutdown = False
+        self._broken = False
+        self._lock = threading.Lock()
+        # pipe waking up the manager thread, written once until the manager reads it
+        self._wakeup_reader, self._wakeup_writer = self._ctx.Pipe(duplex=False)
+        self._woken = False
+        for _ in range(n_workers):
+            self._spawn()
+        self._manager = threading.Thread(
+            target=self._manage, name="gmr-render-pool", daemon=True
+        )
+        self._manager.start()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Submit a task to the pool.
+
+        Parameters
+        ----------
+        fn : callable
+            The picklable function to run in a worker.
+        *args : tuple
+            The positional arguments of the function.
+        **kwargs : dict
+            The keyword arguments of the function.
+
+        Returns
+        -------
+        future : Future
+            The future of the result of the task.
+        """
+        with self._lock:
+            if self._broken:
+                raise BrokenExecutor(
+                    "Can not submit a task to the pool, broken by an unexpected error."
+                )
+            if self._shutdown:
+                raise RuntimeError("Can not submit a task after the pool shut down.")
+            future = Future()
+            self._pending.append(_Task(future, fn, args, kwargs, _TRACER.get()))
+            self._wake_up()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut down the pool once the submitted tasks complete.
+
+        Parameters
+        ----------
+        wait : bool
+            If True, block until the tasks complete and the workers exit.
+        cancel_futures : bool
+            If True, cancel the tasks which did not start yet.
+        """
+        with self._lock:
+            if cancel_futures:
+                while len(self._pending) != 0:
+                    self._pending.popleft().future.cancel()
+            if not self._shutdown:
+                self._shutdown = True
+                self._wake_up()
+        if wait:
+            self._manager.join()
+
+    def _wake_up(self) -> None:
+        """Wake up the manager thread, with the lock held."""
+        if not self._woken:
+            self._wakeup_writer.send(None)
+            self._woken = True
+
+    def _spawn(self) -> None:
+        """Spawn a worker process."""
+        conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_work,
+            args=(
+                child_conn,
+                self._max_tasks,
+                self._max_rss,
+                self._log_queue,
+                self._verbose,
+            ),
+            name="gmr-render-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._workers[conn] = _Worker(process, conn)
+
+    def _manage(self) -> None:
+        """Run the manager loop, breaking the pool on an unexpected error."""
+        try:
+            self._run()
+        except BaseException as error:
+            self._break(error)
+
+    def _run(self) -> None:
+        """Dispatch the tasks to the workers and collect the results, in a thread."""
+        while True:
+            with self._lock:
+                self._dispatch()
+                done = self._shutdown and len(self._pending) == 0
+            if done and all(worker.task is None for worker in self._workers.values()):
+                break
+            sentinels = {
+                worker.process.sentinel: worker for worker in self._workers.values()
+            }
+            ready = wait(
+                [self._wakeup_reader, *self._workers, *sentinels],
+                self._budget_timeout(),
+            )
+            for conn in ready:
+                if conn is self._wakeup_reader:
+                    with self._lock:
+                        self._wakeup_reader.recv()
+                        self._woken = False
+                elif conn in self._workers:
+                    self._receive(self._workers[conn])
+            for sentinel in ready:
+                worker = sentinels.get(sentinel)
+                if worker is None:
+                    continue
+                # handle the messages sent before the worker exited
+                while worker.conn in self._workers and worker.conn.poll():
+                    self._receive(worker)
+                if worker.conn in self._workers:
+                    self._exited(worker)
+            self._check_budgets()
+        for worker in self._workers.values():
+            if worker.ready:
+                worker.conn.send(None)
+            else:  # still warming up
+                worker.process.terminate()
+        for worker in self._workers.values():
+            worker.process.join()
+            worker.conn.close()
+        self._workers.clear()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+    def _break(self, error: BaseException) -> None:
+        """Fail the pending and running tasks and stop the workers."""
+        logger.error("The render pool is broken by an unexpected error: %r", error)
+        with self._lock:
+            self._broken = True
+            self._shutdown = True
+            futures = [task.future for task in self._pending]
+            self._pending.clear()
+            self._wakeup_reader.close()
+            self._wakeup_writer.close()
+        futures.extend(
+            worker.task.future
+            for worker in self._workers.values()
+            if worker.task is not None
+        )
+        for future in futures:
+            if future.done():
+                continue
+            if not future.running() and not future.set_running_or_notify_cancel():
+                continue  # cancelled
+            broken = BrokenExecutor(f"The render pool is broken: {error!r}")
+            broken.__cause__ = error
+            future.set_exception(broken)
+        for worker in self._workers.values():
+            worker.process.kill()
+            worker.process.join()
+            worker.conn.close()
+        self._workers.clear()
+
+    def _dispatch(self) -> None:
+        """Send the pending tasks to the idle workers."""
+        for worker in self._workers.values():
+            while worker.ready and worker.task is None and len(self._pending) != 0:
+                task = self._pending.popleft()
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    worker.conn.send(
+                        (task.fn, task.args, task.kwargs, task.recorder is not None)
+                    )
+                except (pickle.PicklingError, AttributeError, TypeError) as error:
+                    task.future.set_exception(error)
+                    continue
+                worker.task = task
+                worker.started = time.monotonic()
+                if self._max_memory is not None:
+                    worker.rss = worker.ps.memory_info().rss
+
+    def _receive(self, worker: _Worker) -> None:
+        """Receive a message from a worker."""
+        try:
+            message = worker.conn.recv()
+        except EOFError:
+            self._exited(worker)
+            return
+        except Exception as error:  # the message could not be unpickled
+            task, worker.task = worker.task, None
+            if task is not None:
+                task.future.set_exception(
+                    RuntimeError(f"The result of the task can not be received: {error}")
+                )
+            # the worker is retired as its state is unknown
+            try:
+                worker.conn.send(None)
+            except OSError:  # the worker exited
+                pass
+            worker.process.join()
+            self._remove(worker)
+            return
+        if message is None:  # warmed up
+            worker.ready = True
+            return
+        ok, value, events, n_tasks, rss = message
+        task, worker.task = worker.task, None
+        recycled = _needs_recycling(n_tasks, rss, self._max_tasks, self._max_rss)
+        self._n_recycled += recycled
+        if task.recorder is not None:
+            task.recorder.add_events(events)
+        if ok:
+            task.future.set_result(value)
+        else:
+            task.future.set_exception(value)
+        if recycled:
+            logger.info(
+                "Worker %i recycled after %i task(s), with %.1f MiB resident.",
+                worker.process.pid,
+                n_tasks,
+                rss / 2**20,
+            )
+            worker.process.join()
+            self._remove(worker)
+
+    def _exited(self, worker: _Worker) -> None:
+        """Handle a worker which exited unexpectedly."""
+        worker.process.join()
+        if not worker.ready:
+            # a worker failing to warm up would fail again once replaced
+            with self._lock:
+                self._shutdown = True
+                while len(self._pending) != 0:
+                    future = self._pending.popleft().future
+                    if future.set_running_or_notify_cancel():
+                        future.set_exception(
+                            RuntimeError(
+                                f"The worker process {worker.process.pid} exited "
+                                f"with code {worker.process.exitcode} while warming up."
+                            )
+                        )
+        elif worker.task is not None:
+            worker.task.future.set_exception(
+                RuntimeError(
+                    f"The worker process {worker.process.pid} exited unexpectedly "
+                    f"with code {worker.process.exitcode} while running the task."
+                )
+            )
+        self._remove(worker)
+
+    def _budget_timeout(self) -> float | None:
+        """Get the time until the budgets of the running tasks are checked."""
+        busy = [worker for worker in self._workers.values() if worker.task is not None]
+        if len(busy) == 0:
+            return None
+        timeouts = []
+        if self._timeout is not None:
+            deadline = min(worker.started for worker in busy) + self._timeout
+            timeouts.append(max(deadline - time.monotonic(), 0))
+        if self._max_memory is not None:
+            timeouts.append(_BUDGET_INTERVAL)
+        return min(timeouts, default=None)
+
+    def _check_budgets(self) -> None:
+        """Kill the workers running a task which exceeded its budget."""
+        if self._timeout is None and self._max_memory is None:
+            return
+        now = time.monotonic()
+        for worker in list(self._workers.values()):
+            if worker.task is None:
+                continue
+            if self._timeout is not None and self._timeout < now - worker.started:
+                self._kill(
+                    worker,
+                    TimeoutError(
+                        f"The task exceeded its time budget of {self._timeout} "
+                        f"seconds, and its worker process {worker.process.pid} was "
+                        "killed."
+                    ),
+                )
+                continue
+            if self._max_memory is None:
+                continue
+            try:
+                rss = worker.ps.memory_info().rss
+            except psutil.NoSuchProcess:  # handled with the sentinel of the worker
+                continue
+            if self._max_memory * 2**20 < rss - worker.rss:
+                self._kill(
+                    worker,
+                    MemoryError(
+                        f"The task exceeded its memory budget of {self._max_memory} "
+                        f"MiB, and its worker process {worker.process.pid} was "
+                        "killed."
+                    ),
+                )
+
+    def _kill(self, worker: _Worker, error: Exception) -> None:
+        """Kill a worker and fail its task."""
+        logger.warning("%s", error)
+        worker.process.kill()
+        worker.process.join()
+        task, worker.task = worker.task, None
+        task.future.set_exception(error)
+        self._remove(worker)
+
+    def _remove(self, worker: _Worker) -> None:
+        """Remove a worker, replaced by a new worker if the pool is running."""
+        worker.conn.close()
+        del self._workers[worker.conn]
+        if not self._shutdown:
+            self._spawn()
+
+    @property
+    def n_workers(self) -> int:
+        """The number of worker processes."""
+        return self._n_workers
+
+    @property
+    def n_recycled(self) -> int:
+        """The number of workers recycled since the pool started."""
+        return self._n_recycled
+
+
+def _warm_up() -> None:
+    """Import and warm up the rendering pipeline in a worker."""
+    from matplotlib import font_manager
+
+    from .estimator import get_estimator
+    from .figure import _BOX_TEXT_KWARGS, FigureGame
+
+    for family in _FONTS:
+        font_manager.findfont(font_manager.FontProperties(family=family))
+    get_estimator(_BOX_TEXT_KWARGS["font"], _BOX_TEXT_KWARGS["fontsize"])
+    figure = FigureGame("Warm-up")
+    try:
+        figure.draw(["CBT"], {"Cognitive": {"Warm-up feature": ["Warm-up principle"]}})
+        figure.to_array()
+    finally:
+        figure.close()
+
+
+def _work(
+    conn: Connection,
+    max_tasks: int | None,
+    max_rss: float | None,
+    log_queue: Queue | None,
+    verbose: int,
+) -> None:
+    """Run the tasks sent by the pool until recycled, in a worker process."""
+    if log_queue is not None:
+        use_log_queue(log_queue, verbose=verbose)
+    _warm_up()
+    conn.send(None)
+    process = psutil.Process()
+    n_tasks = 0
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:  # the pool exited
+            break
+        if task is None:
+            break
+        fn, args, kwargs, traced = task
+        recorder = TraceRecorder() if traced else None
+        try:
+            with recorder if recorder is not None else nullcontext():
+                ok, value = True, fn(*args, **kwargs)
+        except Exception as error:
+            ok, value = False, _picklable_error(error)
+        n_tasks += 1
+        rss = process.memory_info().rss
+        events = [] if recorder is None else recorder.events
+        try:
+            conn.send((ok, value, events, n_tasks, rss))
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            conn.send(
+                (False, RuntimeError(f"The result is not picklable: {error}"), events)
+                + (n_tasks, rss)
+            )
+        if _needs_recycling(n_tasks, rss, max_tasks, max_rss):
+            break
+
+
+def _picklable_error(error: Exception) -> Exception:
+    """Replace an error which can not be sent to the pool by its traceback."""
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(
+            "The task raised an error which can not be sent to the pool:\n"
+            + "".join(traceback.format_exception(error))
+        )
+    return error
+
+
+def _needs_recycling(
+    n_tasks: int, rss: int, max_tasks: int | None, max_rss: float | None
+) -> bool:
+    """Check if a worker is recycled after a task, in the pool and in the worker."""
+    return (max_tasks is not None and max_tasks <= n_tasks) or (
+        max_rss is not None and max_rss * 2**20 < rss
+    )
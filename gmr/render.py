@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import cache, partial
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from ._base import _FORMATS
+from .figure import FigureGame
+from .pool import RenderPool
+from .spec import read_game
+from .utils._checks import check_type, check_value, ensure_int
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from pathlib import Path
+    from typing import Any
+
+
+# the global state of matplotlib, e.g. the rcParams modified in draft mode or the
+# figures registered by pyplot, is not thread-safe: the drawing and the encoding of the
+# figures of a process are serialized, as encoding draws the figure again, while the
+# loading of the specifications remains concurrent.
+_RENDER_LOCK = threading.Lock()
+
+
+def render(
+    game: dict[str, Any] | str | Path,
+    format: str = "png",  # noqa: A002
+    *,
+    figsize: tuple[int, int] = (15, 10),
+    layout: str = "tree",
+    draft: bool = False,
+    dpi: float | None = None,
+    deterministic: bool = False,
+) -> bytes:
+    """Draw a game and return the encoded figure.
+
+    The figure is closed once encoded.
+
+    Parameters
+    ----------
+    game : dict | str | Path
+        The game, as a dictionary with the keys ``"name"``, ``"intervention_types"``
+        and ``"engagements"``, or as the path to its specification, see
+        :func:`~gmr.spec.read_game`.
+    format : str
+        The output format, one of ``'png'``, ``'svg'`` or ``'pdf'``.
+    figsize : tuple of int
+        The size of the figure.
+    layout : str
+        The layout of the design principles, ``'tree'`` or ``'graph'``, see
+        :class:`~gmr.figure.FigureGame`.
+    draft : bool
+        If True, the figure is drawn in draft mode, see
+        :class:`~gmr.figure.FigureGame`.
+    dpi : float | None
+        The resolution in dots per inch. If None, the DPI of the figure is used.
+    deterministic : bool
+        If True, identical games are always encoded into identical bytes, see
+        :meth:`~gmr.figure.FigureGame.write_to`.
+
+    Returns
+    -------
+    data : bytes
+        The encoded figure.
+    """
+    check_type(game, (dict, "path-like"), "game")
+    check_type(format, (str,), "format")
+    check_value(format, _FORMATS, "format")
+    if not isinstance(game, dict):
+        game = read_game(game)
+    figure = FigureGame(game["name"], figsize=figsize, layout=layout, draft=draft)
+    with _RENDER_LOCK:
+        try:
+            figure.draw(game["intervention_types"], game["engagements"])
+            return figure.to_bytes(format, dpi=dpi, deterministic=deterministic)
+        finally:
+            figure.close()
+
+
+class AsyncRenderer:
+    """Render games from asyncio code without blocking the event loop.
+
+    The games are rendered with :func:`render` on an executor, and the number of
+    renders in flight is bounded to limit the memory usage: additional requests wait
+    for a slot without blocking the event loop.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        The maximum number of renders in flight, running or queued on the executor.
+    executor : str | Executor
+        The executor on which the games are rendered. If ``'thread'``, a pool of
+        threads of the current process shares the caches of the synchronous path, e.g.
+        the text measurements, and the tracing and profiling contexts of the caller.
+        Matplotlib is not thread-safe, thus the drawing and the encoding of the figures
+        are serialized across the threads, while the loading of the specifications
+        remains concurrent. If ``'process'``, a :class:`~gmr.pool.RenderPool` of
+        ``max_concurrency`` pre-warmed processes renders in parallel, each with its own
+        caches. An existing :class:`~concurrent.futures.Executor` can also be
+        provided, in which case it is not shut down by :meth:`close`.
+
+    Notes
+    -----
+    A render which did not start yet when its request is cancelled or times out is
+    removed from the executor. A render already running can not be interrupted: it
+    completes in the background and its slot is released once it completes, so that
+    the bound on the renders in flight holds.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 2, *, executor: str | Executor = "thread"
+    ) -> None:
+        max_concurrency = ensure_int(max_concurrency, "max_concurrency")
+        if max_concurrency <= 0:
+            raise ValueError(
+                "The maximum number of concurrent renders must be strictly positive, "
+                f"got {max_concurrency}."
+            )
+        check_type(executor, (str, Executor), "executor")
+        if isinstance(executor, str):
+            check_value(executor, ("thread", "process"), "executor")
+        self._max_concurrency = max_concurrency
+        self._kind = executor if isinstance(executor, str) else None
+        self._executor = None if isinstance(executor, str) else executor
+        # one semaphore per event loop, as asyncio primitives are bound to their loop
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    async def __aenter__(self) -> AsyncRenderer:
+        """Enter the asynchronous context."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Shut down the executor owned by the renderer, without blocking the loop."""
+        await asyncio.to_thread(self.close)
+
+    async def render(
+        self,
+        game: dict[str, Any] | str | Path,
+        format: str = "png",  # noqa: A002
+        *,
+        figsize: tuple[int, int] = (15, 10),
+        layout: str = "tree",
+        draft: bool = False,
+        dpi: float | None = None,
+        deterministic: bool = False,
+        timeout: float | None = None,
+    ) -> bytes:
+        """Render a game on the executor, see :func:`render`.
+
+        Parameters
+        ----------
+        game : dict | str | Path
+            The game, or the path to its specification.
+        format : str
+            The output format, one of ``'png'``, ``'svg'`` or ``'pdf'``.
+        figsize : tuple of int
+            The size of the figure.
+        layout : str
+            The layout of the design principles, ``'tree'`` or ``'graph'``.
+        draft : bool
+            If True, the figure is drawn in draft mode.
+        dpi : float | None
+            The resolution in dots per inch. If None, the DPI of the figure is used.
+        deterministic : bool
+            If True, identical games are always encoded into identical bytes.
+        timeout : float | None
+            The maximum duration of the render in seconds, including the wait for a
+            slot. If None, the render is not limited in time.
+
+        Returns
+        -------
+        data : bytes
+            The encoded figure.
+        """
+        check_type(game, (dict, "path-like"), "game")
+        check_type(format, (str,), "format")
+        check_value(format, _FORMATS, "format")
+        check_type(timeout, ("numeric", None), "timeout")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"The timeout must be strictly positive, got {timeout}.")
+        try:
+            return await asyncio.wait_for(
+                self._render(
+                    partial(
+                        render,
+                        game,
+                        format,
+                        figsize=figsize,
+                        layout=layout,
+                        draft=draft,
+                        dpi=dpi,
+                        deterministic=deterministic,
+                    )
+                ),
+                timeout,
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                f"The render did not complete within {timeout} seconds."
+            ) from None
+
+    async def _render(self, func: partial[bytes]) -> bytes:
+        """Run a render on the executor, within a slot."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphores[loop] = semaphore
+        await semaphore.acquire()
+        try:
+            future = self._submit(func)
+        except BaseException:
+            semaphore.release()
+            raise
+        # release the slot when the render completes, not when the caller stops waiting
+        future.add_done_callback(partial(_release, loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    def _submit(self, func: partial[bytes]) -> Future[bytes]:
+        """Submit a render to the executor, created on first use."""
+        if self._executor is None:
+            if self._kind == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix="gmr-render"
+                )
+            else:
+                self._executor = RenderPool(self._max_concurrency)
+        if isinstance(self._executor, ThreadPoolExecutor):
+            # propagate the context of the caller, e.g. a trace recorder
+            return self._executor.submit(copy_context().run, func)
+        return self._executor.submit(func)
+
+    def close(self) -> None:
+        """Shut down the executor owned by the renderer.
+
+        The renders queued on the executor are cancelled, and the call blocks until the
+        running renders complete.
+        """
+        if self._kind is None or self._executor is None:
+            return None
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of renders in flight."""
+        return self._max_concurrency
+
+
+async def render_async(
+    game: dict[str, Any] | str | Path,
+    format: str = "png",  # noqa: A002
+    *,
+    figsize: tuple[int, int] = (15, 10),
+    layout: str = "tree",
+    draft: bool = False,
+    dpi: float | None = None,
+    deterministic: bool = False,
+    timeout: float | None = None,
+) -> bytes:
+    """Render a game without blocking the event loop.
+
+    The game is rendered on the threads of a default :class:`AsyncRenderer`, shared by
+    the process, with at most 2 renders in flight.
+
+    Parameters
+    ----------
+    game : dict | str | Path
+        The game, as a dictionary with the keys ``"name"``, ``"intervention_types"``
+        and ``"engagements"``, or as the path to its specification, see
+        :func:`~gmr.spec.read_game`.
+    format : str
+        The output format, one of ``'png'``, ``'svg'`` or ``'pdf'``.
+    figsize : tuple of int
+        The size of the figure.
+    layout : str
+        The layout of the design principles, ``'tree'`` or ``'graph'``, see
+        :class:`~gmr.figure.FigureGame`.
+    draft : bool
+        If True, the figure is drawn in draft mode, see
+        :class:`~gmr.figure.FigureGame`.
+    dpi : float | None
+        The resolution in dots per inch. If None, the DPI of the figure is used.
+    deterministic : bool
+        If True, identical games are always encoded into identical bytes, see
+        :meth:`~gmr.figure.FigureGame.write_to`.
+    timeout : float | None
+        The maximum duration of the render in seconds, including the wait for a slot.
+        If None, the render is not limited in time.
+
+    Returns
+    -------
+    data : bytes
+        The encoded figure.
+    """
+    return await _get_default_renderer().render(
+        game,
+        format,
+        figsize=figsize,
+        layout=layout,
+        draft=draft,
+        dpi=dpi,
+        deterministic=deterministic,
+        timeout=timeout,
+    )
+
+
+@cache
+def _get_default_renderer() -> AsyncRenderer:
+    """Get the renderer shared by the process."""
+    return AsyncRenderer()
+
+
+def _release(
+    loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore, future: Future
+) -> None:
+    """Release a slot from the thread completing a render."""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:  # the event loop is closed, and its semaphore with it
+        pass
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, NamedTuple
+
+from .spec import validate_game
+from .utils._checks import check_type, ensure_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from typing import Any
+
+    from .corpus import Corpus
+
+
+_TOKEN: re.Pattern = re.compile(r"\w+")
+_QUERY: re.Pattern = re.compile(r'"([^"]*)"|(\S+)')
+_FORMAT_VERSION: int = 1
+
+
+class Match(NamedTuple):
+    """A location matching a full-text query.
+
+    The design principle is None if the match is in the text of the feature.
+    """
+
+    game: int
+    engagement: str
+    what: str
+    how: str | None
+    score: int
+
+
+class TextIndex:
+    """Full-text index over the features and design principles of games.
+
+    Each feature ("what") and each design principle ("how") of a game is indexed as a
+    separate document, tokenized in lowercase words. The index is built incrementally
+    as games are added, and can be saved to and loaded from disk.
+
+    Parameters
+    ----------
+    games : iterable of dict | None
+        The games to add to the index, see :meth:`~TextIndex.add`.
+    """
+
+    def __init__(self, games: Iterable[dict[str, Any]] | None = None) -> None:
+        self._names: list[str] = []
+        # (game, engagement, what, how) of each document
+        self._docs: list[tuple[int, str, str, str | None]] = []
+        # term -> document -> positions of the term in the document
+        self._postings: dict[str, dict[int, list[int]]] = dict()
+        self._vocabulary: list[str] = []  # sorted, for prefix queries
+        if games is not None:
+            for game in games:
+                self.add(game)
+
+    @classmethod
+    def from_corpus(cls, corpus: Corpus) -> TextIndex:
+        """Build the full-text index of a corpus.
+
+        Parameters
+        ----------
+        corpus : Corpus
+            The corpus to index. The game indices of the text index match the indices
+            of the corpus.
+
+        Returns
+        -------
+        index : TextIndex
+            The full-text index.
+        """
+        return cls(iter(corpus))
+
+    def add(self, game: dict[str, Any]) -> int:
+        """Add a game to the index.
+
+        Parameters
+        ----------
+        game : dict
+            The game to add, with the keys ``"name"``, ``"intervention_types"`` and
+            ``"engagements"``.
+
+        Returns
+        -------
+        idx : int
+            The index of the game in the text index.
+        """
+        check_type(game, (dict,), "game")
+        check_type(game.get("name"), (str,), "name")
+        validate_game(game.get("intervention_types"), game.get("engagements"))
+        idx = len(self._names)
+        self._names.append(game["name"])
+        for engagement, whats in game["engagements"].items():
+            engagement = engagement.strip()
+            for what, hows in whats.items():
+                self._add_doc(what, (idx, engagement, what, None))
+                for how in hows:
+                    self._add_doc(how, (idx, engagement, what, how))
+        return idx
+
+    def _add_doc(self, text: str, location: tuple[int, str, str, str | None]) -> None:
+        """Add a document to the index."""
+        doc = len(self._docs)
+        self._docs.append(location)
+        for position, term in enumerate(_tokenize(text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = dict()
+                insort(self._vocabulary, term)
+            postings.setdefault(doc, []).append(position)
+
+    def search(self, query: str, limit: int | None = None) -> list[Match]:
+        """Search the features and design principles.
+
+        Parameters
+        ----------
+        query : str
+            The query, made of terms which must all appear in a matching feature or
+            design principle. A term ending with ``*`` is a prefix query, e.g.
+            ``feed*`` matches ``feedback``. Terms between double quotes form a phrase
+            query, matching consecutive words, e.g. ``"immediate feedback"``. The
+            matching is case-insensitive.
+        limit : int | None
+            The maximum number of matches to return. If None, all matches are returned.
+
+        Returns
+        -------
+        matches : list of Match
+            The matching locations, ranked by decreasing frequency of the query terms.
+        """
+        check_type(query, (str,), "query")
+        check_type(limit, ("int-like", None), "limit")
+        scores: dict[int, int] | None = None
+        for phrase, word in _QUERY.findall(query):
+            if phrase:
+                hits = self._search_phrase(_tokenize(phrase))
+            elif word.endswith("*"):
+                hits = self._search_prefix(word[:-1].lower())
+            else:
+                hits = self._search_terms(_tokenize(word))
+            if scores is None:
+                scores = hits
+            else:
+                scores = {
+                    doc: score + hits[doc]
+                    for doc, score in scores.items()
+                    if doc in hits
+                }
+            if len(scores) == 0:
+                break
+        if scores is None:
+            raise ValueError("The query does not contain any term.")
+        ranked = sorted(scores.items(), key=lambda elt: (-elt[1], elt[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [Match(*self._docs[doc], score) for doc, score in ranked]
+
+    def _search_terms(self, terms: list[str]) -> dict[int, int]:
+        """Find the documents containing all the terms, with their frequency."""
+        if len(terms) == 0:
+            return dict()
+        if len(terms) != 1:  # e.g. 'self-esteem' tokenized as 2 terms
+            return self._search_phrase(terms)
+        return {
+            doc: len(positions)
+            for doc, positions in self._postings.get(terms[0], {}).items()
+        }
+
+    def _search_prefix(self, prefix: str) -> dict[int, int]:
+        """Find the documents containing a term starting with the prefix."""
+        hits: dict[int, int] = dict()
+        if len(prefix) == 0:
+            return hits
+        k = bisect_left(self._vocabulary, prefix)
+        while k < len(self._vocabulary) and self._vocabulary[k].startswith(prefix):
+            for doc, positions in self._postings[self._vocabulary[k]].items():
+                hits[doc] = hits.get(doc, 0) + len(positions)
+            k += 1
+        return hits
+
+    def _search_phrase(self, terms: list[str]) -> dict[int, int]:
+        """Find the documents containing the terms as consecutive words."""
+        if len(terms) == 0:
+            return dict()
+        postings = [self._postings.get(term, {}) for term in terms]
+        docs = set(postings[0])
+        for posting in postings[1:]:
+            docs &= posting.keys()
+        hits = dict()
+        for doc in docs:
+            starts = set(postings[0][doc])
+            for offset, posting in enumerate(postings[1:], start=1):
+                starts &= {position - offset for position in posting[doc]}
+            if len(starts) != 0:
+                hits[doc] = len(starts)
+        return hits
+
+    def save(self, fname: str | Path, *, overwrite: bool = False) -> None:
+        """Save the index to disk.
+
+        Parameters
+        ----------
+        fname : str | Path
+            Path to the ``.json`` file.
+        overwrite : bool
+            If True, overwrite an existing file.
+        """
+        fname = ensure_path(fname, must_exist=False)
+        check_type(overwrite, (bool,), "overwrite")
+        if fname.suffix != ".json":
+            raise ValueError(f"The index must be saved as JSON, got '{fname.suffix}'.")
+        if fname.exists() and not overwrite:
+            raise FileExistsError(
+                f"The file '{fname}' already exists. Set 'overwrite' to True to "
+                "replace it."
+            )
+        content = {
+            "version": _FORMAT_VERSION,
+            "names": self._names,
+            "docs": self._docs,
+            "postings": {
+                term: [[doc, positions] for doc, positions in postings.items()]
+                for term, postings in self._postings.items()
+            },
+        }
+        with open(fname, "w", encoding="utf-8") as file:
+            json.dump(content, file, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, fname: str | Path) -> TextIndex:
+        """Load an index saved with :meth:`~TextIndex.save`.
+
+        Parameters
+        ----------
+        fname : str | Path
+            Path to the ``.json`` file.
+
+        Returns
+        -------
+        index : TextIndex
+            The loaded index, to which more games can be added.
+        """
+        fname = ensure_path(fname, must_exist=True)
+        with open(fname, encoding="utf-8") as file:
+            content = json.load(file)
+        if content.get("version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"The index in '{fname.name}' uses an unsupported format version "
+                f"{content.get('version')!r}."
+            )
+        index = cls()
+        index._names = content["names"]
+        index._docs = [tuple(doc) for doc in content["docs"]]
+        index._postings = {
+            term: {doc: positions for doc, positions in postings}
+            for term, postings in content["postings"].items()
+        }
+        index._vocabulary = sorted(index._postings)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed games."""
+        return len(self._names)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """The names of the indexed games."""
+        return tuple(self._names)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split a text in lowercase words."""
+    return _TOKEN.findall(text.lower())
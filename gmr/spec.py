@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import tomllib
+from typing import TYPE_CHECKING
+
+from ._constants import ENGAGEMENT_TYPE_COLORS, INTERVENTION_TYPE_COLORS
+from .utils._checks import ensure_path
+from .utils.tracing import traced
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+@traced("load spec")
+def read_game(fname: str | Path) -> dict[str, Any]:
+    """Read and validate the specification of a game from a JSON or TOML file.
+
+    Parameters
+    ----------
+    fname : str | Path
+        Path to the ``.json`` or ``.toml`` file. The file defines the keys ``"name"``,
+        ``"intervention_types"`` and ``"engagements"``.
+
+    Returns
+    -------
+    game : dict
+        The specification of the game, with the keys ``"name"``,
+        ``"intervention_types"`` and ``"engagements"``.
+    """
+    fname = ensure_path(fname, must_exist=True)
+    if fname.suffix == ".json":
+        with open(fname, encoding="utf-8") as file:
+            content = json.load(file)
+    elif fname.suffix == ".toml":
+        with open(fname, "rb") as file:
+            content = tomllib.load(file)
+    else:
+        raise ValueError(
+            f"The game specification must be a JSON or TOML file, got '{fname.name}'."
+        )
+    if not isinstance(content, dict):
+        raise TypeError(
+            f"The game specification in '{fname.name}' must be a mapping, got "
+            f"{type(content)} instead."
+        )
+    missing = [
+        key
+        for key in ("name", "intervention_types", "engagements")
+        if key not in content
+    ]
+    if len(missing) != 0:
+        raise ValueError(
+            f"The game specification in '{fname.name}' is missing the key(s) "
+            + ", ".join(repr(key) for key in missing)
+            + "."
+        )
+    if not isinstance(content["name"], str) or len(content["name"].strip()) == 0:
+        raise ValueError(
+            f"The name of the game in '{fname.name}' must be a non-empty string."
+        )
+    validate_game(content["intervention_types"], content["engagements"])
+    return {
+        "name": content["name"],
+        "intervention_types": content["intervention_types"],
+        "engagements": content["engagements"],
+    }
+
+
+@traced("validate")
+def validate_game(intervention_types: Any, engagements: Any) -> None:
+    """Validate the full specification of a game.
+
+    The entire structure is validated before any drawing, and all the problems found
+    are reported at once.
+
+    Parameters
+    ----------
+    intervention_types : list of str | tuple of str
+        The primary types of intervention of the game.
+    engagements : dict
+        The engagements of the game, as a dictionary mapping each type of engagement to
+        a dictionary of features ("what") to the design principles ("how") supporting
+        them.
+
+    Raises
+    ------
+    TypeError
+        When all the problems found are invalid types.
+    ValueError
+        When at least one of the problems found is an invalid value.
+    """
+    problems = _check_game(intervention_types, engagements)
+    if len(problems) == 0:
+        return None
+    exc = TypeError if all(exc_ is TypeError for exc_, _ in problems) else ValueError
+    n = len(problems)
+    raise exc(
+        f"Invalid game specification, {n} problem{'s' if n > 1 else ''} found:\n"
+        + "\n".join(f"  - {msg}" for _, msg in problems)
+    )
+
+
+def _check_game(
+    intervention_types: Any, engagements: Any
+) -> list[tuple[type[Exception], str]]:
+    """Collect the problems of a game specification."""
+    problems = list()
+    if not isinstance(intervention_types, list | tuple):
+        problems.append(
+            (
+                TypeError,
+                "'intervention_types' must be a list or tuple, got "
+                f"{type(intervention_types)} instead.",
+            )
+        )
+    else:
+        seen = set()
+        for k, inter in enumerate(intervention_types):
+            problems.extend(
+                _check_category(
+                    inter,
+                    INTERVENTION_TYPE_COLORS,
+                    f"intervention_types[{k}]",
+                    "intervention type",
+                    seen,
+                )
+            )
+    if not isinstance(engagements, dict):
+        problems.append(
+            (
+                TypeError,
+                f"'engagements' must be a dict, got {type(engagements)} instead.",
+            )
+        )
+        return problems
+    if len(engagements) == 0:
+        problems.append(
+            (ValueError, "'engagements' must contain at least one type of engagement.")
+        )
+    seen = set()
+    for name, whats in engagements.items():
+        problems.extend(
+            _check_category(
+                name, ENGAGEMENT_TYPE_COLORS, "engagements", "engagement type", seen
+            )
+        )
+        where = f"engagements[{name!r}]"
+        if not isinstance(whats, dict):
+            problems.append(
+                (TypeError, f"{where} must be a dict, got {type(whats)} instead.")
+            )
+            continue
+        for what, hows in whats.items():
+            problems.extend(_check_text(what, f"{where} key"))
+            if not isinstance(hows, list | tuple):
+                problems.append(
+                    (
+                        TypeError,
+                        f"{where}[{what!r}] must be a list or tuple, got "
+                        f"{type(hows)} instead.",
+                    )
+                )
+                continue
+            for k, how in enumerate(hows):
+                problems.extend(_check_text(how, f"{where}[{what!r}][{k}]"))
+    return problems
+
+
+def _check_category(
+    item: Any, categories: dict[str, str], where: str, kind: str, seen: set[str]
+) -> list[tuple[type[Exception], str]]:
+    """Check that an item is a known category, not yet seen."""
+    problems = _check_text(item, where)
+    if len(problems) != 0:
+        return problems
+    item = item.strip()
+    if item not in categories:
+        problems.append(
+            (
+                ValueError,
+                f"{where} contains an unknown {kind} {item!r}. Allowed values are "
+                + ", ".join(repr(elt) for elt in categories)
+                + ".",
+            )
+        )
+    elif item in seen:
+        problems.append(
+            (ValueError, f"{where} contains the duplicate {kind} {item!r}.")
+        )
+    seen.add(item)
+    return problems
+
+
+def _check_text(item: Any, where: str) -> list[tuple[type[Exception], str]]:
+    """Check that an item is a non-empty string."""
+    if not isinstance(item, str):
+        return [(TypeError, f"{where} must be a str, got {type(item)} instead.")]
+    if len(item.strip()) == 0:
+        return [(ValueError, f"{where} contains an empty string.")]
+    return []
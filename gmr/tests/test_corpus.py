@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+from itertools import product
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from .._constants import ENGAGEMENT_TYPE_ORDER, INTERVENTION_TYPE_ORDER
+from ..corpus import Corpus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+def test_corpus(games: list[dict[str, Any]]):
+    """Test the columnar store of a corpus."""
+    corpus = Corpus(games)
+    assert len(corpus) == 3
+    assert corpus.names == ("Tetris", "Pong", "Chess")
+    for k, game in enumerate(games):
+        assert corpus.game(k) == game
+    assert corpus.game(-1) == games[-1]
+    assert list(corpus) == games
+    # strings are interned
+    assert corpus.labels("how").count("Immediate feedback") == 1
+    assert corpus.labels("what") == (
+        "Falling blocks",
+        "Score",
+        "Music",
+        "Paddle",
+        "Ball",
+        "Opponent",
+    )
+    col = corpus.columns
+    assert col["engagement_code"].dtype == np.int8
+    assert col["what_string"].dtype == np.int32
+    assert col["engagement_offsets"].tolist() == [0, 2, 4, 5]
+    assert not col["how_string"].flags.writeable
+    # adding a game rebuilds the columns
+    assert corpus.add(games[0]) == 3
+    assert corpus.columns["engagement_offsets"].tolist() == [0, 2, 4, 5, 7]
+    with pytest.raises(IndexError, match="out of range"):
+        corpus.game(4)
+    with pytest.raises(ValueError, match="unknown engagement type"):
+        corpus.add(dict(games[0], engagements={"Cognitiv": {}}))
+    assert len(corpus) == 4
+
+
+def test_corpus_count(games: list[dict[str, Any]]):
+    """Test the vectorized group-by counts."""
+    corpus = Corpus(games)
+    # intervention x engagement, compared to a brute-force count
+    counts = corpus.count("intervention", "engagement")
+    assert counts.shape == (len(INTERVENTION_TYPE_ORDER), len(ENGAGEMENT_TYPE_ORDER))
+    for (i, inter), (j, engagement) in product(
+        enumerate(INTERVENTION_TYPE_ORDER), enumerate(ENGAGEMENT_TYPE_ORDER)
+    ):
+        expected = sum(
+            inter in game["intervention_types"] and engagement in game["engagements"]
+            for game in games
+        )
+        assert counts[i, j] == expected
+    # single key
+    assert corpus.count("engagement")[ENGAGEMENT_TYPE_ORDER.index("Cognitive")] == 2
+    # design principles are combined with the engagement they are listed under
+    counts = corpus.count("engagement", "how")
+    how = corpus.labels("how").index("Immediate feedback")
+    assert counts[ENGAGEMENT_TYPE_ORDER.index("Cognitive"), how] == 2
+    assert counts[ENGAGEMENT_TYPE_ORDER.index("Behavioral"), how] == 1
+    assert counts[ENGAGEMENT_TYPE_ORDER.index("Affective"), how] == 0
+    # a game is counted once per combination
+    counts = corpus.count("intervention", "how")
+    assert counts[INTERVENTION_TYPE_ORDER.index("Physical game"), how] == 1
+    assert counts.sum() == 2 * 4 + 2 + 1
+    rows = corpus.rows("intervention", "what")
+    assert rows.shape == (2 * 3 + 3 + 1, 3)
+    with pytest.raises(ValueError, match="At least one grouping key"):
+        corpus.count()
+    with pytest.raises(ValueError, match="Invalid value for the 'key' parameter"):
+        corpus.count("principle")
+    assert Corpus().count("intervention", "engagement").sum() == 0
+
+
+def test_corpus_from_files(tmp_path: Path, games: list[dict[str, Any]]):
+    """Test loading a corpus from game specifications."""
+    fnames = []
+    for k, game in enumerate(games):
+        fname = tmp_path / f"game{k}.json"
+        with open(fname, "w") as file:
+            json.dump(game, file)
+        fnames.append(fname)
+    corpus = Corpus.from_files(fnames)
+    assert list(corpus) == games
+
+
+def test_corpus_save_load(tmp_path: Path, games: list[dict[str, Any]]):
+    """Test packing a corpus in a memory-mapped binary file."""
+    games[1]["name"] = "Pông"  # non-ASCII strings
+    corpus = Corpus(games)
+    fname = tmp_path / "corpus.gmrc"
+    corpus.save(fname)
+    with pytest.raises(FileExistsError, match="already exists"):
+        corpus.save(fname)
+    with pytest.raises(ValueError, match="'.gmrc' file"):
+        corpus.save(tmp_path / "corpus.bin")
+    loaded = Corpus.load(fname)
+    assert isinstance(loaded.columns["how_string"], np.memmap)
+    assert not loaded.columns["how_string"].flags.writeable
+    for key, column in corpus.columns.items():
+        assert np.array_equal(loaded.columns[key], column)
+    assert len(loaded) == 3
+    assert loaded.game(1) == games[1]
+    assert loaded.names == corpus.names
+    assert loaded.labels("how") == corpus.labels("how")
+    assert np.array_equal(
+        loaded.count("intervention", "how"), corpus.count("intervention", "how")
+    )
+    assert np.array_equal(loaded.index.postings("link", ("Score", "Rewards")), [0, 1])
+    # adding a game copies the mapped columns and interns in the loaded tables
+    assert loaded.add(games[0]) == 3
+    assert loaded.labels("how") == corpus.labels("how")
+    assert list(loaded) == [*games, games[0]]
+    # the file mapped by the corpus can not be replaced, on every platform
+    with pytest.raises(ValueError, match="memory-mapped on the file"):
+        loaded.save(fname, overwrite=True)
+    loaded.save(tmp_path / "extended.gmrc")
+    del loaded
+    assert list(Corpus.load(tmp_path / "extended.gmrc")) == [*games, games[0]]
+    # empty corpus and invalid files
+    Corpus().save(tmp_path / "empty.gmrc")
+    assert len(Corpus.load(tmp_path / "empty.gmrc")) == 0
+    with open(tmp_path / "invalid.gmrc", "wb") as file:
+        file.write(b"\x00" * 200)
+    with pytest.raises(ValueError, match="not a packed corpus"):
+        Corpus.load(tmp_path / "invalid.gmrc")
+    with open(fname, "rb") as file:
+        content = file.read()
+    with open(tmp_path / "truncated.gmrc", "wb") as file:
+        file.write(content[:-16])
+    with pytest.raises(ValueError, match="truncated"):
+        Corpus.load(tmp_path / "truncated.gmrc")
@@ -0,0 +1,37 @@
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from ..estimator import TextHeightEstimator, _measure_text_height, get_estimator
+
+
+def test_estimator():
+    """Test the calibrated text height estimator."""
+    estimator = get_estimator("DejaVu Sans", 12)
+    assert get_estimator("DejaVu Sans", 12) is estimator
+    assert estimator.font == "DejaVu Sans"
+    assert estimator.fontsize == 12
+    assert 0 <= estimator.rms_error <= estimator.max_error < 0.25
+    fig = Figure(dpi=72)
+    renderer = FigureCanvasAgg(fig).get_renderer()
+    text = (
+        "Levels unlock progressively as the player improves, and a daily challenge "
+        "encourages regular practice between the therapy sessions."
+    )
+    for width in (80, 150, 300, 600):
+        exact = _measure_text_height(
+            text, width, renderer, fig, dict(font="DejaVu Sans", fontsize=12)
+        )
+        assert estimator.estimate(text, width) == pytest.approx(exact, rel=0.25)
+    # more text or narrower columns yield taller boxes
+    assert estimator.estimate(text, 100) < estimator.estimate(text + " " + text, 100)
+    assert estimator.estimate(text, 300) < estimator.estimate(text, 100)
+    assert estimator.estimate("a\nb", 300) > estimator.estimate("a b", 300)
+
+
+def test_estimator_invalid():
+    """Test invalid arguments to the estimator."""
+    with pytest.raises(TypeError, match="'font' must be an instance of"):
+        TextHeightEstimator(101)
+    with pytest.raises(ValueError, match="must be strictly positive"):
+        TextHeightEstimator(fontsize=0)
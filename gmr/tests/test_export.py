@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from matplotlib import pyplot as plt
+
+from ..export import export_pdf
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+def test_export_pdf(tmp_path: Path, game: dict[str, Any]):
+    """Test exporting a corpus to a multi-page PDF."""
+    fname = tmp_path / "corpus.pdf"
+
+    def _games():
+        for k in range(3):
+            yield dict(game, name=f"{game['name']} {k}")
+            # the previous figures must be closed once their page is written
+            assert len(plt.get_fignums()) == 0
+
+    n_pages = export_pdf(_games(), fname)
+    assert n_pages == 3
+    assert fname.exists()
+    assert len(plt.get_fignums()) == 0
+    with open(fname, "rb") as file:
+        content = file.read()
+    assert content.count(b"/Type /Page\n") + content.count(b"/Type /Page ") >= 3
+    # overwrite protection
+    with pytest.raises(FileExistsError, match="already exists"):
+        export_pdf([game], fname)
+    assert export_pdf([game], fname, overwrite=True) == 1
+
+
+def test_export_pdf_pages(tmp_path: Path, tall_game: dict[str, Any]):
+    """Test exporting a game taller than a page across several pages."""
+    fname = tmp_path / "corpus.pdf"
+    assert 1 < export_pdf([tall_game], fname, max_height=1.0)
+    assert len(plt.get_fignums()) == 0
+
+
+def test_export_pdf_deterministic(tmp_path: Path, game: dict[str, Any]):
+    """Test that an identical corpus is exported to an identical file."""
+    fnames = [tmp_path / "corpus1.pdf", tmp_path / "corpus2.pdf"]
+    for fname in fnames:
+        export_pdf([game], fname, deterministic=True)
+    assert fnames[0].read_bytes() == fnames[1].read_bytes()
+    assert b"CreationDate" not in fnames[0].read_bytes()
+
+
+def test_export_pdf_invalid(tmp_path: Path, game: dict[str, Any]):
+    """Test invalid arguments to the PDF export."""
+    with pytest.raises(ValueError, match="must be a PDF"):
+        export_pdf([game], tmp_path / "corpus.png")
+    with pytest.raises(TypeError, match="'game' must be an instance of"):
+        export_pdf([101], tmp_path / "corpus.pdf")
+    assert len(plt.get_fignums()) == 0
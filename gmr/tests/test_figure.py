@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import gc
+import logging
+import tracemalloc
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from .. import text as text_module
+from .._constants import COLUMN_WIDTHS, VPAD
+from ..figure import FigureGame, _get_scaffold
+from ..text import _STATIC_WRAPPED_TEXTS
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def test_figure_game(game: dict[str, Any]):
+    """Test drawing and closing a game figure."""
+    figure = FigureGame(game["name"])
+    assert figure.name == game["name"]
+    figure.draw(game["intervention_types"], game["engagements"])
+    assert len(plt.get_fignums()) == 1
+    height = figure._y_pos_engagement_init
+    # drawing again starts a new layout
+    figure.close()
+    figure.draw(game["intervention_types"], game["engagements"])
+    assert figure._y_pos_engagement_init == pytest.approx(height)
+    figure.close()
+    figure.close()  # closing twice is a no-op
+    assert len(plt.get_fignums()) == 0
+
+
+def test_figure_game_invalid_spec(game: dict[str, Any]):
+    """Test that an invalid specification fails before creating the figure."""
+    figure = FigureGame(game["name"])
+    engagements = dict(game["engagements"], Cognitiv={"Score": ["Rewards"]})
+    with pytest.raises(ValueError, match="unknown engagement type 'Cognitiv'"):
+        figure.draw(game["intervention_types"], engagements)
+    assert len(plt.get_fignums()) == 0
+
+
+def test_figure_game_to_array(game: dict[str, Any]):
+    """Test the zero-copy RGBA array output."""
+    figure = FigureGame(game["name"], figsize=(8, 6))
+    with pytest.raises(RuntimeError, match="must be drawn first"):
+        figure.to_array()
+    figure.draw(game["intervention_types"], game["engagements"])
+    array = figure.to_array()
+    width, height = figure._fig.canvas.get_width_height()
+    assert array.shape == (height, width, 4)
+    assert array.dtype == np.uint8
+    assert not array.flags.writeable
+    assert np.shares_memory(array, np.asarray(figure._fig.canvas.buffer_rgba()))
+    assert np.all(array[0, 0] == (255, 255, 255, 255))  # white background
+    assert np.any(array[..., :3] != 255)  # something is drawn
+    figure.close()
+
+
+def test_figure_game_to_bytes(game: dict[str, Any]):
+    """Test the in-memory byte outputs."""
+    figure = FigureGame(game["name"], figsize=(8, 6))
+    with pytest.raises(RuntimeError, match="must be drawn first"):
+        figure.to_bytes()
+    figure.draw(game["intervention_types"], game["engagements"])
+    png = figure.to_bytes("png", dpi=50)
+    assert png.startswith(b"\x89PNG")
+    assert figure.to_bytes("png", dpi=50).count(b"IEND") == 1  # buffer is reset
+    assert len(figure.to_bytes("png", dpi=100)) > len(png)
+    assert figure.to_bytes("svg").lstrip().startswith(b"<?xml")
+    assert figure.to_bytes("pdf").startswith(b"%PDF")
+    stream = BytesIO()
+    figure.write_to(stream, "pdf")
+    assert stream.getvalue().startswith(b"%PDF")
+    with pytest.raises(ValueError, match="Invalid value for the 'format' parameter"):
+        figure.to_bytes("jpg")
+    with pytest.raises(ValueError, match="must be strictly positive"):
+        figure.to_bytes("png", dpi=0)
+    figure.close()
+    assert figure._buffer is None
+
+
+def test_figure_game_graph_layout():
+    """Test the graph layout with shared design principles."""
+    engagements = {
+        "Cognitive": {
+            "Falling blocks": ["Immediate feedback", "Progressive difficulty"],
+            "Score": ["Immediate feedback", "Rewards"],
+        },
+        "Affective": {"Music": ["Immediate feedback"], "Colors": []},
+    }
+    n_texts, heights = dict(), dict()
+    for layout in ("tree", "graph"):
+        figure = FigureGame("Tetris", layout=layout)
+        assert figure.layout == layout
+        figure.draw(["Cognitive training"], engagements)
+        texts = [text.get_text() for text in figure._ax.texts]
+        n_texts[layout] = texts.count("Immediate feedback")
+        heights[layout] = figure._y_pos_engagement_init
+        figure.close()
+    assert n_texts == {"tree": 3, "graph": 1}
+    assert heights["graph"] < heights["tree"]
+    with pytest.raises(ValueError, match="Invalid value for the 'layout' parameter"):
+        FigureGame("Tetris", layout="star")
+
+
+def test_figure_game_draft(game: dict[str, Any]):
+    """Test the draft mode with estimated heights."""
+    heights = dict()
+    for draft in (False, True):
+        figure = FigureGame(game["name"], draft=draft)
+        assert figure.draft == draft
+        figure.draw(game["intervention_types"], game["engagements"])
+        heights[draft] = figure._y_pos_engagement_init
+        if draft:
+            assert figure._fig.dpi == 50
+            assert 0 < figure.estimator_calibration_error < 0.25
+            assert not figure._ax.texts[0].get_antialiased()
+        else:
+            assert figure.estimator_calibration_error is None
+        figure.close()
+    assert heights[True] == pytest.approx(heights[False], rel=0.25)
+
+
+def test_figure_game_scaffold(game: dict[str, Any], monkeypatch: pytest.MonkeyPatch):
+    """Test that the headers and intervention boxes are shared by the figures."""
+    figures = [FigureGame(game["name"]), FigureGame("Other")]
+    for figure in figures:
+        figure.draw(game["intervention_types"], game["engagements"])
+        figure.to_array()
+    assert figures[0]._bbox_headers == figures[1]._bbox_headers
+    assert figures[0]._bbox_headers == list(_get_scaffold(COLUMN_WIDTHS).headers)
+    # the static texts are wrapped once per process
+    n_wrapped = len(_STATIC_WRAPPED_TEXTS)
+    assert 0 < n_wrapped
+    figures[0].to_array()
+    assert len(_STATIC_WRAPPED_TEXTS) == n_wrapped
+    # the active and inactive intervention boxes differ on their colors
+    texts = {text.get_text(): text.get_color() for text in figures[0]._ax.texts[1:]}
+    for inter in _get_scaffold(COLUMN_WIDTHS).interventions:
+        active = inter in game["intervention_types"]
+        assert texts[inter] == ("black" if active else "lightgray")
+    # the wrapped static texts are bounded, e.g. across resolutions
+    monkeypatch.setattr(text_module, "_STATIC_WRAPPED_TEXTS_MAXSIZE", n_wrapped)
+    figures[1]._fig.set_dpi(50)
+    figures[1].to_array()
+    assert len(_STATIC_WRAPPED_TEXTS) == n_wrapped
+    assert any(key[-1] == 50 for key in _STATIC_WRAPPED_TEXTS)
+    for figure in figures:
+        figure.close()
+
+
+@pytest.mark.parametrize("layout", ["tree", "graph"])
+def test_figure_game_check_layout(layout: str):
+    """Test that features without design principles or taller than them fit."""
+    figure = FigureGame("Chess", layout=layout)
+    figure.draw(
+        ["Cognitive training"],
+        {
+            "Socio-cultural": {
+                "Opponent": [],
+                "An opponent of a level adapted to the player, with " * 4: [
+                    "Competition"
+                ],
+                "Ranking": [],
+            }
+        },
+    )
+    assert figure.check_layout() == ([], [])
+    figure.close()
+    with pytest.raises(RuntimeError, match="must be drawn first"):
+        figure.check_layout()
+
+
+def test_figure_game_memory_leak(
+    game: dict[str, Any], caplog: pytest.LogCaptureFixture
+):
+    """Test that drawing the same game repeatedly does not grow the memory."""
+    # the records of the missing fonts, logged on each measurement, are retained by
+    # the log capture of pytest
+    caplog.set_level(logging.ERROR, logger="matplotlib.font_manager")
+
+    def draw() -> None:
+        # the exact mode measures each box on the canvas, as in the render workers
+        figure = FigureGame(game["name"], figsize=(8, 6))
+        figure.draw(game["intervention_types"], game["engagements"])
+        figure.to_bytes()
+        figure.close()
+
+    n_draws = 10
+    tracemalloc.start()
+    try:
+        # warm-up the caches of matplotlib, e.g. fonts and text layouts
+        for _ in range(3):
+            draw()
+        sizes = []
+        for _ in range(2):
+            for _ in range(n_draws):
+                draw()
+            gc.collect()
+            sizes.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    # a leaked figure retains several hundreds of KiB, far above this bound per draw
+    assert (sizes[1] - sizes[0]) / n_draws < 4 * 1024
+    assert len(plt.get_fignums()) == 0
+
+
+def test_figure_game_iter_pages(game: dict[str, Any], tall_game: dict[str, Any]):
+    """Test drawing a tall game across pages, one page at a time."""
+    figure = FigureGame(tall_game["name"])
+    pages = figure.iter_pages(tall_game["intervention_types"], tall_game["engagements"])
+    names = []
+    for page in pages:
+        assert len(plt.get_fignums()) == 1
+        names.append(page.name)
+        # the title, headers and intervention column are repeated on each page
+        texts = [text.get_text() for text in page._ax.texts]
+        assert "Type of engagement" in texts
+        assert "CBT" in texts
+        # the page fits in the axes
+        assert page._y_pos_engagement_init + 2 * VPAD <= 1.0
+    assert len(plt.get_fignums()) == 0
+    assert 1 < len(names)
+    assert names == [f"Tall ({k}/{len(names)})" for k in range(1, len(names) + 1)]
+    # a short game is drawn on a single page
+    pages = list(
+        FigureGame(game["name"]).iter_pages(
+            game["intervention_types"], game["engagements"]
+        )
+    )
+    assert len(pages) == 1
+    assert pages[0].name == game["name"]
+    with pytest.raises(ValueError, match="smaller than the title"):
+        next(
+            figure.iter_pages(
+                tall_game["intervention_types"],
+                tall_game["engagements"],
+                max_height=0.1,
+            )
+        )
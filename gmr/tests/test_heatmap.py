@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from .._constants import ENGAGEMENT_TYPE_ORDER, INTERVENTION_TYPE_ORDER
+from ..corpus import Corpus
+from ..heatmap import FigureCooccurrence
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def test_cooccurrence_matrices(games: list[dict[str, Any]]):
+    """Test the co-occurrence matrices of a corpus."""
+    figure = FigureCooccurrence(Corpus(games), n_principles=2)
+    interventions, principles, labels = figure.matrices()
+    assert interventions.shape == (
+        len(INTERVENTION_TYPE_ORDER),
+        len(ENGAGEMENT_TYPE_ORDER),
+    )
+    cognitive = ENGAGEMENT_TYPE_ORDER.index("Cognitive")
+    assert interventions[INTERVENTION_TYPE_ORDER.index("Distraction"), cognitive] == 1
+    assert interventions[INTERVENTION_TYPE_ORDER.index("Physical game"), cognitive] == 1
+    assert interventions.sum() == 7
+    # "Immediate feedback" and "Rewards" are the 2 most frequent principles
+    assert labels == ("Immediate feedback", "Rewards")
+    assert principles.shape == (len(ENGAGEMENT_TYPE_ORDER), 2)
+    assert principles[cognitive].tolist() == [2, 2]
+    assert principles[ENGAGEMENT_TYPE_ORDER.index("Behavioral")].tolist() == [1, 0]
+
+
+def test_figure_cooccurrence(games: list[dict[str, Any]]):
+    """Test drawing the co-occurrence heatmaps."""
+    with pytest.raises(ValueError, match="strictly positive"):
+        FigureCooccurrence(Corpus(games), n_principles=0)
+    with pytest.raises(ValueError, match="does not contain any game"):
+        FigureCooccurrence(Corpus()).draw()
+    figure = FigureCooccurrence(Corpus(games), figsize=(10, 5))
+    figure.draw()
+    assert len(figure._ax) == 2
+    n_hows = len(figure._corpus.labels("how"))
+    assert len(figure._ax[0].texts) == len(INTERVENTION_TYPE_ORDER) * len(
+        ENGAGEMENT_TYPE_ORDER
+    )
+    assert len(figure._ax[1].texts) == len(ENGAGEMENT_TYPE_ORDER) * n_hows
+    array = figure.to_array()
+    assert np.any(array[..., :3] != 255)
+    figure.close()
+    assert len(plt.get_fignums()) == 0
+
+
+def test_figure_cooccurrence_no_principle(game: dict[str, Any]):
+    """Test drawing a corpus in which no game lists a design principle."""
+    games = [
+        dict(game, engagements={"Cognitive": {"Walk": []}}),
+        dict(game, name="Music", engagements={"Affective": {"Music": ()}}),
+    ]
+    figure = FigureCooccurrence(Corpus(games))
+    _, principles, labels = figure.matrices()
+    assert principles.size == 0
+    assert labels == ()
+    figure.draw()
+    assert figure._ax[1].texts[0].get_text() == "No design principle in the corpus."
+    figure.to_array()
+    figure.close()
+    assert len(plt.get_fignums()) == 0
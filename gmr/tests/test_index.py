@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from ..corpus import Corpus
+from ..index import CorpusIndex
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def test_index(game: dict[str, Any]):
+    """Test the posting lists and boolean queries of the inverted index."""
+    pong = {
+        "name": "Pong",
+        "intervention_types": ["Physical game"],
+        "engagements": {
+            "Behavioral": {"Paddle": ["Immediate feedback"]},
+            "Cognitive": {"Score": ["Immediate feedback"]},
+        },
+    }
+    corpus = Corpus([game, pong, dict(game, name="Tetris 2")])
+    index = corpus.index
+    assert isinstance(index, CorpusIndex)
+    assert corpus.index is index
+    assert index.n_games == 3
+    assert index.postings("intervention", "Cognitive training").tolist() == [0, 2]
+    assert index.postings("engagement", "Cognitive").tolist() == [0, 1, 2]
+    assert index.postings("what", "Score").tolist() == [0, 1, 2]
+    assert index.postings("how", "Immediate feedback").tolist() == [0, 1, 2]
+    assert index.postings("link", ("Score", "Rewards")).tolist() == [0, 2]
+    assert index.postings("link", ("Score", "Immediate feedback")).tolist() == [1]
+    for field, value in (
+        ("intervention", "CBT"),
+        ("engagement", "Socio-cultural"),
+        ("what", "Unknown"),
+        ("how", "Unknown"),
+        ("link", ("Paddle", "Rewards")),
+        ("link", ("Unknown", "Rewards")),
+    ):
+        assert index.postings(field, value).size == 0
+    # boolean queries
+    result = index.query(all_of=[("engagement", "Behavioral")])
+    assert result.tolist() == [1]
+    result = index.query(
+        all_of=[("what", "Score")],
+        any_of=[("intervention", "Physical game"), ("how", "Immersion")],
+    )
+    assert result.tolist() == [0, 1, 2]
+    result = index.query(
+        all_of=[("what", "Score"), ("intervention", "Distraction")],
+        any_of=[("link", ("Score", "Immediate feedback"))],
+    )
+    assert result.size == 0
+    assert isinstance(result, np.ndarray)
+    # the index is rebuilt when a game is added
+    corpus.add(pong)
+    assert corpus.index is not index
+    assert corpus.index.postings("engagement", "Behavioral").tolist() == [1, 3]
+
+
+def test_index_invalid(game: dict[str, Any]):
+    """Test invalid queries."""
+    index = Corpus([game]).index
+    with pytest.raises(ValueError, match="At least one term"):
+        index.query()
+    with pytest.raises(ValueError, match="Invalid value for the 'field' parameter"):
+        index.postings("principle", "Rewards")
+    with pytest.raises(ValueError, match="must be a tuple"):
+        index.postings("link", ("Score", "Rewards", "Immersion"))
+    assert Corpus().index.query(all_of=[("how", "Rewards")]).size == 0
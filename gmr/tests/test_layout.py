@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from .._constants import COLUMN_WIDTHS
+from ..estimator import get_estimator, measure_text_height
+from ..figure import FigureGame
+from ..layout import check_layout, optimize_column_widths, paginate
+from ..text import TextBox
+
+if TYPE_CHECKING:
+    from typing import Any
+
+_LONG: str = (
+    "The difficulty of the exercises increases progressively with the performance of "
+    "the patient, so that the challenge remains adapted to the abilities of each "
+    "player."
+)
+
+
+@pytest.fixture
+def long_game() -> dict[str, Any]:
+    """Return a game with long design principles."""
+    return {
+        "name": "Puzzle",
+        "intervention_types": ["CBT"],
+        "engagements": {
+            "Cognitive": {"Puzzle": [_LONG, _LONG + " Again."], "Hints": [_LONG]},
+            "Affective": {"Music": ["Immersion"]},
+        },
+    }
+
+
+def test_measure_text_height():
+    """Test the cached exact measurement of the height of a text."""
+    measure_text_height.cache_clear()
+    height = measure_text_height(_LONG, 100.0)
+    assert measure_text_height(_LONG, 100.0) == height
+    assert measure_text_height.cache_info().hits == 1
+    assert measure_text_height(_LONG, 400.0) < height
+    assert measure_text_height("Short", 100.0) == measure_text_height("Short", 400.0)
+
+
+def test_measure_text_height_threads():
+    """Test the measurement of the height of texts from several threads."""
+    texts = [_LONG[:k] for k in range(20, len(_LONG), 7)]
+    measure_text_height.cache_clear()
+    expected = [measure_text_height(text, 120.0) for text in texts]
+    measure_text_height.cache_clear()
+    with ThreadPoolExecutor(4) as executor:
+        heights = list(executor.map(measure_text_height, texts, [120.0] * len(texts)))
+    assert heights == expected
+
+
+def test_optimize_column_widths(long_game: dict[str, Any]):
+    """Test the search of the column widths."""
+    fig, ax = plt.subplots(1, 1, figsize=(15, 10))
+    total = COLUMN_WIDTHS[2] + COLUMN_WIDTHS[3]
+    for layout in ("tree", "graph"):
+        widths = optimize_column_widths(long_game["engagements"], ax, layout=layout)
+        assert widths[:2] == COLUMN_WIDTHS[:2]
+        assert widths[2] + widths[3] == pytest.approx(total)
+        # the long design principles get the widest column
+        assert widths[2] < widths[3]
+        assert 0.15 <= widths[2] <= widths[3] <= 0.45
+    widths = optimize_column_widths(
+        long_game["engagements"],
+        ax,
+        estimator=get_estimator(),
+        bounds=(0.25, 0.35),
+    )
+    assert 0.25 <= widths[2] < widths[3] <= 0.35
+    # without text to wrap, the default widths are kept
+    widths = optimize_column_widths({"Affective": {"Music": ["Immersion"]}}, ax)
+    assert widths == pytest.approx(COLUMN_WIDTHS)
+    with pytest.raises(ValueError, match="must be a tuple"):
+        optimize_column_widths(long_game["engagements"], ax, bounds=(0.3, 0.2))
+    with pytest.raises(ValueError, match="incompatible with the total width"):
+        optimize_column_widths(long_game["engagements"], ax, bounds=(0.1, 0.2))
+    with pytest.raises(ValueError, match="strictly positive"):
+        optimize_column_widths(long_game["engagements"], ax, step=0)
+    plt.close(fig)
+
+
+@pytest.mark.parametrize("layout", ["tree", "graph"])
+def test_figure_game_optimized_widths(long_game: dict[str, Any], layout: str):
+    """Test that optimizing the column widths reduces the height of the figure."""
+    heights = dict()
+    for widths in ("fixed", "optimize"):
+        figure = FigureGame(long_game["name"], layout=layout, widths=widths)
+        figure.draw(long_game["intervention_types"], long_game["engagements"])
+        heights[widths] = figure._y_pos_engagement_init
+        if widths == "fixed":
+            assert figure.column_widths == COLUMN_WIDTHS
+        else:
+            assert figure.column_widths != COLUMN_WIDTHS
+        figure.close()
+    assert heights["optimize"] < heights["fixed"]
+
+
+def test_paginate(tall_game: dict[str, Any]):
+    """Test splitting the engagements across pages."""
+    fig, ax = plt.subplots(1, 1, figsize=(15, 10))
+    engagements = tall_game["engagements"]
+    # everything fits on a single page
+    assert paginate(engagements, ax, 100) == [engagements]
+    pages = paginate(engagements, ax, 0.6)
+    assert 2 < len(pages)
+    # the features are kept in order, split between the pages
+    features = [
+        (name, what, hows)
+        for page in pages
+        for name, whats in page.items()
+        for what, hows in whats.items()
+    ]
+    assert features == [
+        (name, what, hows)
+        for name, whats in engagements.items()
+        for what, hows in whats.items()
+    ]
+    # a page can contain parts of 2 engagements
+    engagements = {
+        name: dict(list(whats.items())[:3]) for name, whats in engagements.items()
+    }
+    pages = paginate(engagements, ax, 0.8)
+    assert any(len(page) == 2 for page in pages)
+    # a feature taller than a page is kept whole on its own page
+    with pytest.warns(RuntimeWarning, match="taller than a page"):
+        pages = paginate(engagements, ax, 0.05)
+    assert len(pages) == 9
+    with pytest.raises(ValueError, match="strictly positive"):
+        paginate(engagements, ax, 0)
+    plt.close(fig)
+
+
+def test_check_layout():
+    """Test finding the overlapping and out-of-bounds elements."""
+    rng = np.random.default_rng(0)
+    elements = [
+        TextBox("box", x, y, width, height)
+        for x, y, width, height in rng.uniform(0, 1, size=(200, 4)) * (1, 1, 0.1, 0.1)
+    ]
+    overlaps, out_of_bounds = check_layout(elements, (0, 1, 0, 1))
+    # compare to the quadratic check of every pair
+    expected = {
+        frozenset((id(elt1), id(elt2)))
+        for elt1, elt2 in combinations(elements, 2)
+        if min(elt1.x + elt1.width, elt2.x + elt2.width) > max(elt1.x, elt2.x)
+        and min(elt1.y + elt1.height, elt2.y + elt2.height) > max(elt1.y, elt2.y)
+    }
+    assert 0 < len(expected)
+    assert {frozenset((id(elt1), id(elt2))) for elt1, elt2 in overlaps} == expected
+    assert len(overlaps) == len(expected)
+    assert out_of_bounds == [
+        elt for elt in elements if 1 < elt.x + elt.width or 1 < elt.y + elt.height
+    ]
+    # touching elements do not overlap
+    column = [TextBox("box", 0, 0.1 * k, 0.5, 0.1) for k in range(10)]
+    assert check_layout(column, (0, 1, 0, 1)) == ([], [])
+    with pytest.raises(ValueError, match="must be a tuple"):
+        check_layout(column, (0, 1, 0))
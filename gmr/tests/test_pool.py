@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import BrokenExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ..pool import RenderPool
+from ..render import render
+from ..utils.tracing import TraceRecorder
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def test_render_pool(game: dict[str, Any]):
+    """Test rendering on the pool, with workers recycled after a number of tasks."""
+    with RenderPool(1, max_tasks=2) as pool:
+        assert pool.n_workers == 1
+        pids = [pool.submit(os.getpid).result() for _ in range(4)]
+        assert os.getpid() not in pids
+        assert pids[0] == pids[1] != pids[2] == pids[3]
+        assert pool.n_recycled == 2
+        with TraceRecorder() as recorder:
+            data = pool.submit(render, game, draft=True).result()
+        assert data.startswith(b"\x89PNG")
+        # the spans recorded in the worker are added to the recorder of the caller
+        encode = [event for event in recorder.events if event["name"] == "encode"]
+        assert len(encode) == 1
+        assert encode[0]["pid"] != os.getpid()
+        # errors raised by the task, or when sending it, are set on the futures
+        with pytest.raises(ValueError, match="invalid literal"):
+            pool.submit(int, "gmr").result()
+        with pytest.raises(Exception, match="pickle"):
+            pool.submit(lambda: 101).result()
+        # a worker which exits is replaced
+        with pytest.raises(RuntimeError, match="exited unexpectedly with code 3"):
+            pool.submit(os._exit, 3).result()
+        assert pool.submit(int, "101").result() == 101
+    with pytest.raises(RuntimeError, match="after the pool shut down"):
+        pool.submit(os.getpid)
+
+
+class _Error(Exception):
+    """An error which can be pickled but not unpickled."""
+
+    def __init__(self, a: int, b: int) -> None:
+        super().__init__(a + b)
+
+
+def _raise_error() -> None:
+    """Raise an error which can not be unpickled."""
+    raise _Error(1, 2)
+
+
+def test_render_pool_unpicklable_error():
+    """Test a task raising or returning an object which can not be unpickled."""
+    with RenderPool(1) as pool:
+        with pytest.raises(RuntimeError, match="can not be sent to the pool") as exc:
+            pool.submit(_raise_error).result()
+        assert "_Error: 3" in str(exc.value)
+        # a result which can not be unpickled retires its worker
+        with pytest.raises(RuntimeError, match="can not be received"):
+            pool.submit(_Error, 1, 2).result()
+        assert pool.submit(int, "101").result() == 101
+
+
+def test_render_pool_broken():
+    """Test the futures failed when the manager thread raises."""
+
+    def _raise() -> None:
+        raise ValueError("Unexpected.")
+
+    pool = RenderPool(1)
+    pool._check_budgets = _raise
+    future = pool.submit(time.sleep, 1)
+    with pytest.raises(BrokenExecutor, match="Unexpected"):
+        future.result(timeout=60)
+    with pytest.raises(BrokenExecutor, match="broken by an unexpected error"):
+        pool.submit(os.getpid)
+    pool.shutdown()
+
+
+def test_render_pool_max_rss():
+    """Test recycling the workers above a resident memory ceiling."""
+    with RenderPool(2, max_tasks=None, max_rss=1) as pool:
+        pids = list(pool.map(_getpid, range(2)))
+    assert os.getpid() not in pids
+    assert pool.n_recycled == 2
+
+
+def _getpid(k: int) -> int:
+    """Get the process ID of a worker."""
+    return os.getpid()
+
+
+def test_render_pool_budgets():
+    """Test killing the workers running a task which exceeds its budget."""
+    with RenderPool(2, timeout=1, max_memory=100) as pool:
+        slow = pool.submit(time.sleep, 30)
+        hog = pool.submit(_allocate, 500)
+        with pytest.raises(TimeoutError, match="time budget of 1 seconds"):
+            slow.result()
+        with pytest.raises(MemoryError, match="memory budget of 100 MiB"):
+            hog.result()
+        # the killed workers are replaced, and the tasks within budget complete
+        assert pool.submit(int, "101").result() == 101
+        assert pool.submit(_allocate, 10).result() == 10
+
+
+def _allocate(n_mib: int) -> int:
+    """Allocate and hold memory for a while."""
+    data = bytearray(n_mib * 2**20)
+    for k in range(0, len(data), 4096):  # touch the pages to make them resident
+        data[k] = 1
+    time.sleep(0.5)
+    return n_mib
+
+
+def test_render_pool_invalid():
+    """Test invalid arguments to the pool."""
+    with pytest.raises(ValueError, match="number of workers must be strictly"):
+        RenderPool(0)
+    with pytest.raises(ValueError, match="number of tasks per worker must be"):
+        RenderPool(1, max_tasks=0)
+    with pytest.raises(ValueError, match="memory ceiling must be strictly"):
+        RenderPool(1, max_rss=-1)
+    with pytest.raises(ValueError, match="timeout must be strictly positive"):
+        RenderPool(1, timeout=0)
+    with pytest.raises(ValueError, match="memory budget must be strictly"):
+        RenderPool(1, max_memory=0)
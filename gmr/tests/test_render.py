@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from matplotlib import pyplot as plt
+
+from .. import render as render_module
+from ..render import AsyncRenderer, render, render_async
+from ..utils.tracing import TraceRecorder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def test_render(tmp_path: Path, game: dict[str, Any]):
+    """Test rendering a game to bytes."""
+    data = render(game, draft=True)
+    assert data.startswith(_PNG_SIGNATURE)
+    assert len(plt.get_fignums()) == 0
+    fname = tmp_path / "game.json"
+    with open(fname, "w", encoding="utf-8") as file:
+        json.dump(game, file)
+    assert render(fname, "svg", draft=True).lstrip().startswith(b"<?xml")
+    with pytest.raises(ValueError, match="Invalid value for the 'format'"):
+        render(game, "jpg")
+    with pytest.raises(TypeError, match="'game' must be an instance of"):
+        render(101)
+
+
+@pytest.mark.parametrize("format_", ["png", "svg", "pdf"])
+def test_render_deterministic(game: dict[str, Any], format_: str):
+    """Test that identical games are encoded into identical bytes."""
+    data = render(game, format_, draft=True, deterministic=True)
+    assert render(game, format_, draft=True, deterministic=True) == data
+    assert b"CreationDate" not in data
+    assert b"<dc:date>" not in data
+    if format_ == "svg":  # the identifiers are salted at random by default
+        assert render(game, format_, draft=True) != render(game, format_, draft=True)
+
+
+def test_render_async(game: dict[str, Any]):
+    """Test rendering games without blocking the event loop."""
+    ticks = 0
+
+    async def ticker(stop: asyncio.Event) -> None:
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    async def main() -> list[bytes]:
+        stop = asyncio.Event()
+        task = asyncio.create_task(ticker(stop))
+        with TraceRecorder() as recorder:
+            results = await asyncio.gather(
+                *(render_async(game, draft=True) for _ in range(3))
+            )
+        stop.set()
+        await task
+        return results, recorder.events
+
+    results, events = asyncio.run(main())
+    assert all(data.startswith(_PNG_SIGNATURE) for data in results)
+    # the event loop kept running during the renders
+    assert 10 < ticks
+    # the spans of the render threads are recorded by the recorder of the caller
+    assert "encode" in {event["name"] for event in events}
+    assert len(plt.get_fignums()) == 0
+
+
+def test_async_renderer_concurrency(monkeypatch: pytest.MonkeyPatch):
+    """Test that the number of renders in flight is bounded."""
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _render(game, *args, **kwargs) -> bytes:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return game["name"].encode()
+
+    monkeypatch.setattr(render_module, "render", _render)
+
+    async def main(renderer: AsyncRenderer) -> list[bytes]:
+        async with renderer:
+            return await asyncio.gather(
+                *(renderer.render(dict(name=str(k))) for k in range(6))
+            )
+
+    renderer = AsyncRenderer(2, executor="thread")
+    assert asyncio.run(main(renderer)) == [str(k).encode() for k in range(6)]
+    assert peak == 2
+    # the renderer can be reused with another event loop once closed
+    peak = 0
+    assert asyncio.run(main(renderer)) == [str(k).encode() for k in range(6)]
+    assert peak == 2
+
+
+def test_async_renderer_timeout(monkeypatch: pytest.MonkeyPatch):
+    """Test the timeout of a render, which keeps its slot until it completes."""
+    completed = threading.Event()
+
+    def _render(game, *args, **kwargs) -> bytes:
+        time.sleep(0.2)
+        completed.set()
+        return b""
+
+    monkeypatch.setattr(render_module, "render", _render)
+
+    async def main(renderer: AsyncRenderer) -> None:
+        with pytest.raises(TimeoutError, match="did not complete within"):
+            await renderer.render(dict(), timeout=0.01)
+        assert not completed.is_set()
+        # the next render waits for the slot of the render which timed out
+        await renderer.render(dict())
+        assert completed.is_set()
+
+    renderer = AsyncRenderer(1)
+    asyncio.run(main(renderer))
+    renderer.close()
+
+
+def test_async_renderer_process(game: dict[str, Any]):
+    """Test rendering games on a pool of processes."""
+
+    async def main() -> list[bytes]:
+        async with AsyncRenderer(2, executor="process") as renderer:
+            return await asyncio.gather(
+                renderer.render(game, draft=True),
+                renderer.render(dict(game, name="Other"), "pdf", draft=True),
+            )
+
+    png, pdf = asyncio.run(main())
+    assert png.startswith(_PNG_SIGNATURE)
+    assert pdf.startswith(b"%PDF")
+
+
+def test_async_renderer_invalid():
+    """Test invalid arguments to the asynchronous renderer."""
+    with pytest.raises(ValueError, match="strictly positive"):
+        AsyncRenderer(0)
+    with pytest.raises(ValueError, match="Invalid value for the 'executor'"):
+        AsyncRenderer(executor="fork")
+    renderer = AsyncRenderer()
+    with pytest.raises(ValueError, match="timeout must be strictly positive"):
+        asyncio.run(renderer.render(dict(), timeout=0))
@@ -0,0 +1,47 @@
+"""Visual regression tests of the rendered figures against baseline images."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ..corpus import Corpus
+from ..figure import FigureGame
+from ..heatmap import FigureCooccurrence
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+
+@pytest.mark.parametrize("draft", [False, True])
+@pytest.mark.parametrize("layout", ["tree", "graph"])
+@pytest.mark.parametrize("idx", [0, 1, 2])
+def test_render_figure_game(
+    games: list[dict[str, Any]],
+    image_baseline: Callable,
+    idx: int,
+    layout: str,
+    draft: bool,
+):
+    """Test the rendering of the reference games."""
+    game = games[idx]
+    figure = FigureGame(game["name"], figsize=(12, 8), layout=layout, draft=draft)
+    figure.draw(game["intervention_types"], game["engagements"])
+    assert figure.check_layout() == ([], [])
+    name = f"game-{game['name']}-{layout}" + ("-draft" if draft else "")
+    array = figure.to_array().copy()
+    figure.close()
+    image_baseline(name, array)
+
+
+def test_render_figure_cooccurrence(
+    games: list[dict[str, Any]], image_baseline: Callable
+):
+    """Test the rendering of the co-occurrence heatmaps."""
+    figure = FigureCooccurrence(Corpus(games), figsize=(10, 5))
+    figure.draw()
+    array = figure.to_array().copy()
+    figure.close()
+    image_baseline("cooccurrence", array)
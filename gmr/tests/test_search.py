@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ..corpus import Corpus
+from ..search import Match, TextIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+@pytest.fixture
+def pong() -> dict[str, Any]:
+    """Return a second game specification."""
+    return {
+        "name": "Pong",
+        "intervention_types": ["Physical game"],
+        "engagements": {
+            "Behavioral": {
+                "Paddle feedback": ["Immediate feedback, with feedback sounds"],
+            },
+        },
+    }
+
+
+def test_text_index(game: dict[str, Any], pong: dict[str, Any]):
+    """Test term, prefix and phrase queries."""
+    index = TextIndex([game])
+    assert index.add(pong) == 1
+    assert len(index) == 2
+    assert index.names == ("Tetris", "Pong")
+    # term query, ranked by term frequency
+    matches = index.search("FEEDBACK")
+    assert matches[0] == Match(
+        1,
+        "Behavioral",
+        "Paddle feedback",
+        "Immediate feedback, with feedback sounds",
+        2,
+    )
+    assert {(match.game, match.how, match.score) for match in matches[1:]} == {
+        (0, "Immediate feedback", 1),
+        (1, None, 1),
+    }
+    assert len(index.search("feedback", limit=1)) == 1
+    # prefix query
+    matches = index.search("progr*")
+    assert [(match.what, match.how) for match in matches] == [
+        ("Falling blocks", "Progressive difficulty")
+    ]
+    assert len(index.search("imm*")) == 3  # immediate x2, immersion
+    # phrase query
+    matches = index.search('"immediate feedback"')
+    assert {match.game for match in matches} == {0, 1}
+    assert index.search('"feedback immediate"') == []
+    # conjunction of terms
+    matches = index.search('"immediate feedback" sound*')
+    assert [match.game for match in matches] == [1]
+    assert matches[0].score == 2
+    assert index.search("feedback unknown") == []
+    with pytest.raises(ValueError, match="does not contain any term"):
+        index.search("  ")
+
+
+def test_text_index_persistence(
+    tmp_path: Path, game: dict[str, Any], pong: dict[str, Any]
+):
+    """Test saving, loading and updating the index."""
+    index = TextIndex.from_corpus(Corpus([game]))
+    fname = tmp_path / "index.json"
+    index.save(fname)
+    with pytest.raises(FileExistsError, match="already exists"):
+        index.save(fname)
+    with pytest.raises(ValueError, match="must be saved as JSON"):
+        index.save(tmp_path / "index.txt")
+    loaded = TextIndex.load(fname)
+    assert loaded.search("imm*") == index.search("imm*")
+    # incremental update of a loaded index
+    loaded.add(pong)
+    assert {match.game for match in loaded.search("sounds")} == {1}
+    assert len(loaded.search("imm*")) == 3
+    loaded.save(fname, overwrite=True)
+    assert len(TextIndex.load(fname)) == 2
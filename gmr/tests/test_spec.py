@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ..spec import read_game, validate_game
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+def test_validate_game(game: dict[str, Any]):
+    """Test the validation of a valid game specification."""
+    validate_game(game["intervention_types"], game["engagements"])
+    validate_game(("CBT ",), {" Behavioral": {"Walking": ()}})
+
+
+def test_validate_game_aggregated():
+    """Test that all the problems of a specification are reported at once."""
+    engagements = {
+        "Cognitive": {"Falling blocks": ["Immediate feedback", ""]},
+        "Affective": {"": ["Immersion"], "Music": "Immersion"},
+        "Cognitiv": {"Score": ["Rewards", 101]},
+        " Cognitive": {"Score": ["Rewards"]},
+    }
+    with pytest.raises(ValueError, match="8 problems found") as exc:
+        validate_game(["CBT", "Therapy", 101], engagements)
+    msg = str(exc.value)
+    assert "unknown intervention type 'Therapy'" in msg
+    assert "intervention_types[2] must be a str" in msg
+    assert "engagements['Cognitive']['Falling blocks'][1] contains an empty" in msg
+    assert "engagements['Affective'] key contains an empty string" in msg
+    assert "engagements['Affective']['Music'] must be a list or tuple" in msg
+    assert "unknown engagement type 'Cognitiv'" in msg
+    assert "engagements['Cognitiv']['Score'][1] must be a str" in msg
+    assert "duplicate engagement type 'Cognitive'" in msg
+    # a game without engagement has nothing to draw
+    with pytest.raises(ValueError, match="at least one type of engagement"):
+        validate_game(["CBT", "Therapy"], {})
+
+
+def test_validate_game_types():
+    """Test that invalid types only raise a TypeError."""
+    with pytest.raises(TypeError, match="2 problems found"):
+        validate_game("CBT", ["Cognitive"])
+    with pytest.raises(TypeError, match="1 problem found"):
+        validate_game(["CBT"], {"Cognitive": ["Score"]})
+
+
+def test_read_game(tmp_path: Path, game: dict[str, Any]):
+    """Test reading a game specification from JSON and TOML files."""
+    fname = tmp_path / "game.json"
+    with open(fname, "w") as file:
+        json.dump(game, file)
+    assert read_game(fname) == game
+    fname = tmp_path / "game.toml"
+    with open(fname, "w") as file:
+        file.write(
+            'name = "Tetris"\n'
+            'intervention_types = ["Cognitive training", "Distraction"]\n'
+            "[engagements.Cognitive]\n"
+            '"Falling blocks" = ["Immediate feedback", "Progressive difficulty"]\n'
+            'Score = ["Rewards"]\n'
+            "[engagements.Affective]\n"
+            'Music = ["Immersion"]\n'
+        )
+    assert read_game(fname) == game
+
+
+def test_read_game_invalid(tmp_path: Path, game: dict[str, Any]):
+    """Test reading invalid game specifications."""
+    fname = tmp_path / "game.yaml"
+    fname.touch()
+    with pytest.raises(ValueError, match="must be a JSON or TOML file"):
+        read_game(fname)
+    fname = tmp_path / "game.json"
+    with open(fname, "w") as file:
+        json.dump([game], file)
+    with pytest.raises(TypeError, match="must be a mapping"):
+        read_game(fname)
+    with open(fname, "w") as file:
+        json.dump({"name": "Tetris"}, file)
+    with pytest.raises(ValueError, match="'intervention_types', 'engagements'"):
+        read_game(fname)
+    with open(fname, "w") as file:
+        json.dump(dict(game, intervention_types=["Therapy"]), file)
+    with pytest.raises(ValueError, match="unknown intervention type 'Therapy'"):
+        read_game(fname)
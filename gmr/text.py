@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import FancyBboxPatch
@@ -7,6 +12,17 @@ from matplotlib.text import Text
 
 from ._base import BaseElement
 from .utils._checks import check_type, check_value
+from .utils.tracing import traced
+
+if TYPE_CHECKING:
+    from .estimator import TextHeightEstimator
+
+# wrapped lines of the static texts, per text, wrap width, font, renderer and DPI,
+# bounded as the wrap widths vary with the figure sizes and the column widths; the
+# Text measured on a miss is not part of the key, which rules out lru_cache
+_STATIC_WRAPPED_TEXTS: OrderedDict[tuple, str] = OrderedDict()
+_STATIC_WRAPPED_TEXTS_MAXSIZE: int = 256
+_STATIC_WRAPPED_TEXTS_LOCK = threading.Lock()
 
 
 class TextBox(BaseElement):
@@ -38,6 +54,10 @@ class TextBox(BaseElement):
         Additional keyword arguments to pass to the FancyBboxPatch constructor.
     text_kwargs : dict
         Additional keyword arguments to pass to the Text constructor.
+    static : bool
+        If True, the text is identical across figures, e.g. a header. Its wrapped lines
+        are cached per process for each wrap width, font and renderer, instead of being
+        wrapped again at each rendering.
     """
 
     def __init__(
@@ -51,6 +71,7 @@ class TextBox(BaseElement):
         text_alignment: str = "center",
         bbox_kwargs: dict | None = None,
         text_kwargs: dict | None = None,
+        static: bool = False,
     ) -> None:
         """Initialize a TextBox instance."""
         super().__init__(x, y)
@@ -68,6 +89,7 @@ class TextBox(BaseElement):
         check_value(text_alignment, ("center", "left"), "text_alignment")
         check_type(bbox_kwargs, (dict, None), "bbox_kwargs")
         check_type(text_kwargs, (dict, None), "text_kwargs")
+        check_type(static, (bool,), "static")
         self._text = text
         self._width = width
         self._height = height
@@ -75,7 +97,9 @@ class TextBox(BaseElement):
         self._text_alignment = text_alignment
         self._bbox_kwargs = bbox_kwargs if bbox_kwargs is not None else {}
         self._text_kwargs = text_kwargs if text_kwargs is not None else {}
+        self._static = static
 
+    @traced("measure box")
     def _compute_auto_height(self, ax: plt.Axes) -> float:
         """Estimate the textbox height based on the text."""
         fig = ax.figure
@@ -105,17 +129,40 @@ class TextBox(BaseElement):
         temp_text.remove()
         return auto_height
 
-    def draw(self, ax: plt.Axes) -> None:
+    @traced("measure box")
+    def _estimate_auto_height(
+        self, ax: plt.Axes, estimator: TextHeightEstimator
+    ) -> float:
+        """Estimate the textbox height without measuring the text with the renderer."""
+        dpi = ax.figure.dpi
+        width = _get_width_in_pixels(self.x, self._width, self._hpad, ax) * 72 / dpi
+        height = estimator.estimate(self._text, width) * dpi / 72
+        # transform the height from display to data coordinates
+        inverted = ax.transData.inverted()
+        _, y0 = inverted.transform((0, 0))
+        _, y1 = inverted.transform((0, height))
+        return np.abs(y1 - y0)
+
+    def draw(
+        self, ax: plt.Axes, *, estimator: TextHeightEstimator | None = None
+    ) -> None:
         """Draw the textbox on the provided matplotlib axes.
 
         Parameters
         ----------
         ax : Axes
             The matplotlib axes on which to draw the textbox.
+        estimator : TextHeightEstimator | None
+            If provided and if the height is ``'auto'``, the height is estimated with
+            this estimator instead of being measured with the renderer. The font and
+            size of the estimator should match the text properties.
         """
-        self._height = (
-            self._compute_auto_height(ax) if self._height == "auto" else self._height
-        )
+        if self._height == "auto":
+            self._height = (
+                self._compute_auto_height(ax)
+                if estimator is None
+                else self._estimate_auto_height(ax, estimator)
+            )
         # draw the FancyBboxPatch, with round or square corners
         textbox_patch = FancyBboxPatch(
             (self.x, self.y),  # bottom-left corner
@@ -148,6 +195,8 @@ class TextBox(BaseElement):
             return _get_width_in_pixels(self.x, self._width, self._hpad, ax)
 
         text._get_wrap_line_width = _wrap_width
+        if self._static:
+            text._get_wrapped_text = partial(_get_static_wrapped_text, text)
 
     @property
     def height(self) -> float:
@@ -169,3 +218,29 @@ def _get_width_in_pixels(x: float, width: float, hpad: float, ax: plt.Axes) -> f
     x0_disp, _ = ax.transData.transform((x0_data, 0))
     x1_disp, _ = ax.transData.transform((x1_data, 0))
     return x1_disp - x0_disp
+
+
+def _get_static_wrapped_text(text: Text) -> str:
+    """Get the wrapped lines of a static text, computed once per process.
+
+    The cache is shared by the threads of the process and its accesses are serialized
+    by a lock. The lines are wrapped outside of the lock.
+    """
+    key = (
+        text.get_text(),
+        text._get_wrap_line_width(),
+        text.get_fontproperties().copy(),  # the hash of the mutable font is unstable
+        type(text._renderer),
+        text.figure.dpi,
+    )
+    with _STATIC_WRAPPED_TEXTS_LOCK:
+        wrapped = _STATIC_WRAPPED_TEXTS.get(key)
+        if wrapped is not None:
+            _STATIC_WRAPPED_TEXTS.move_to_end(key)
+            return wrapped
+    wrapped = Text._get_wrapped_text(text)
+    with _STATIC_WRAPPED_TEXTS_LOCK:
+        _STATIC_WRAPPED_TEXTS[key] = wrapped
+        if _STATIC_WRAPPED_TEXTS_MAXSIZE < len(_STATIC_WRAPPED_TEXTS):
+            _STATIC_WRAPPED_TEXTS.popitem(last=False)
+    return wrapped
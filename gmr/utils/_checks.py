@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 import operator
 import os
+from contextvars import ContextVar
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,6 +18,41 @@ if TYPE_CHECKING:
     from typing import Any
 
 
+# inputs validated in bulk, e.g. by a loader, can skip the per-element validation
+_TRUSTED_INPUT: ContextVar[bool] = ContextVar(
+    "_TRUSTED_INPUT",
+    default=os.environ.get("GMR_TRUSTED_INPUT", "false").lower() in ("true", "1"),
+)
+
+
+class trusted_input:
+    """Context manager to skip the validation of trusted inputs.
+
+    Within this context, :func:`check_type` and :func:`check_value` return
+    immediately. It should only wrap calls on inputs which were already validated as a
+    whole, e.g. by a bulk loader, as invalid inputs will then fail with obscure errors.
+    The validation can also be disabled for the entire process by setting the
+    environment variable ``GMR_TRUSTED_INPUT`` to ``"true"`` before importing
+    ``gmr``.
+
+    Parameters
+    ----------
+    trusted : bool
+        If True, the validation is skipped. If False, the validation is enforced, even
+        within an enclosing trusted context.
+    """
+
+    def __init__(self, trusted: bool = True) -> None:
+        self._trusted = trusted
+        self._token = None
+
+    def __enter__(self) -> None:
+        self._token = _TRUSTED_INPUT.set(self._trusted)
+
+    def __exit__(self, *args) -> None:
+        _TRUSTED_INPUT.reset(self._token)
+
+
 def ensure_int(item: Any, item_name: str | None = None) -> int:
     """Ensure a variable is an integer.
 
@@ -54,12 +91,9 @@ def ensure_int(item: Any, item_name: str | None = None) -> int:
 class _IntLike:
     @classmethod
     def __instancecheck__(cls, other: Any) -> bool:
-        try:
-            ensure_int(other)
-        except TypeError:
-            return False
-        else:
-            return True
+        # equivalent to ensure_int without the cost of raising and catching an error:
+        # operator.index() succeeds if and only if the type defines __index__.
+        return not isinstance(other, bool) and hasattr(type(other), "__index__")
 
 
 class _Callable:
@@ -96,6 +130,21 @@ def check_type(item: Any, types: tuple, item_name: str | None = None) -> None:
     TypeError
         When the type of the item is not one of the valid options.
     """
+    if _TRUSTED_INPUT.get():
+        return None
+    if not isinstance(types, tuple):
+        types = tuple(types)
+    check_types, type_name = _resolve_types(types)
+    if not isinstance(item, check_types):
+        item_name = "Item" if item_name is None else f"'{item_name}'"
+        raise TypeError(
+            f"{item_name} must be an instance of {type_name}, got {type(item)} instead."
+        )
+
+
+@cache
+def _resolve_types(types: tuple) -> tuple[tuple[type, ...], str]:
+    """Resolve the types accepted by check_type, once per distinct tuple of types."""
     check_types = sum(
         (
             (type(None),)
@@ -107,27 +156,18 @@ def check_type(item: Any, types: tuple, item_name: str | None = None) -> None:
         ),
         (),
     )
-
-    if not isinstance(item, check_types):
-        type_name = [
-            "None"
-            if cls_ is None
-            else cls_.__name__
-            if not isinstance(cls_, str)
-            else cls_
-            for cls_ in types
-        ]
-        if len(type_name) == 1:
-            type_name = type_name[0]
-        elif len(type_name) == 2:
-            type_name = " or ".join(type_name)
-        else:
-            type_name[-1] = "or " + type_name[-1]
-            type_name = ", ".join(type_name)
-        item_name = "Item" if item_name is None else f"'{item_name}'"
-        raise TypeError(
-            f"{item_name} must be an instance of {type_name}, got {type(item)} instead."
-        )
+    type_name = [
+        "None" if cls_ is None else cls_.__name__ if not isinstance(cls_, str) else cls_
+        for cls_ in types
+    ]
+    if len(type_name) == 1:
+        type_name = type_name[0]
+    elif len(type_name) == 2:
+        type_name = " or ".join(type_name)
+    else:
+        type_name[-1] = "or " + type_name[-1]
+        type_name = ", ".join(type_name)
+    return check_types, type_name
 
 
 def check_value(
@@ -154,6 +194,8 @@ def check_value(
     ValueError
         When the value of the item is not one of the valid options.
     """
+    if _TRUSTED_INPUT.get():
+        return None
     if item not in allowed_values:
         item_name = "" if item_name is None else f" '{item_name}'"
         extra = "" if extra is None else " " + extra
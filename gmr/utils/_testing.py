@@ -0,0 +1,117 @@
+"""Utilities to compare rendered figures against baseline images."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from matplotlib import image as mpimg
+
+from ._checks import check_type
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+
+class ImageDiff(NamedTuple):
+    """The difference between a rendered image and its baseline.
+
+    The differences are expressed on the 0-255 scale of 8-bit channels.
+    """
+
+    rms: float
+    channel_rms: tuple[float, float, float, float]
+    channel_max: tuple[int, int, int, int]
+    n_pixels: int  # number of pixels which differ on at least one channel
+
+
+def compare_images(actual: NDArray[np.uint8], expected: NDArray[np.uint8]) -> ImageDiff:
+    """Compare 2 RGBA images.
+
+    Parameters
+    ----------
+    actual : array of shape (height, width, 4)
+        The rendered image, in ``uint8``.
+    expected : array of shape (height, width, 4)
+        The baseline image, in ``uint8``.
+
+    Returns
+    -------
+    diff : ImageDiff
+        The RMS difference over all channels, and the RMS and maximum absolute
+        difference of each channel.
+    """
+    check_type(actual, (np.ndarray,), "actual")
+    check_type(expected, (np.ndarray,), "expected")
+    if actual.shape != expected.shape:
+        raise ValueError(
+            f"The images must have the same shape, got {actual.shape} and "
+            f"{expected.shape}."
+        )
+    if actual.ndim != 3 or actual.shape[2] != 4:
+        raise ValueError(
+            f"The images must be RGBA of shape (height, width, 4), got {actual.shape}."
+        )
+    diff = np.abs(actual.astype(np.int16) - expected.astype(np.int16))
+    squared = diff.reshape(-1, 4).astype(np.float64) ** 2
+    channel_rms = np.sqrt(squared.mean(axis=0)) if squared.size != 0 else np.zeros(4)
+    return ImageDiff(
+        rms=float(np.sqrt(np.mean(channel_rms**2))),
+        channel_rms=tuple(float(elt) for elt in channel_rms),
+        channel_max=tuple(
+            int(elt) for elt in diff.reshape(-1, 4).max(axis=0, initial=0)
+        ),
+        n_pixels=int(np.count_nonzero(diff.any(axis=2))),
+    )
+
+
+def read_image(fname: str | Path) -> NDArray[np.uint8]:
+    """Read a PNG image as an RGBA array in ``uint8``."""
+    array = mpimg.imread(fname)  # float in [0, 1] for PNG files
+    if array.shape[2] == 3:
+        array = np.concatenate([array, np.ones_like(array[..., :1])], axis=2)
+    return np.round(array * 255).astype(np.uint8)
+
+
+def write_image(fname: str | Path, array: NDArray[np.uint8]) -> None:
+    """Write an RGBA array in ``uint8`` as a PNG image."""
+    mpimg.imsave(fname, np.ascontiguousarray(array))
+
+
+def write_diff_images(
+    directory: Path, name: str, actual: NDArray[np.uint8], expected: NDArray[np.uint8]
+) -> Path:
+    """Write the rendered image, the baseline and their difference.
+
+    The difference image shows in black the pixels identical to the baseline, and the
+    differing pixels in their absolute difference, amplified to remain visible.
+
+    Parameters
+    ----------
+    directory : Path
+        The directory in which the images are written.
+    name : str
+        The name of the compared figure, used as prefix of the file names.
+    actual : array of shape (height, width, 4)
+        The rendered image, in ``uint8``.
+    expected : array of shape (height, width, 4)
+        The baseline image, in ``uint8``.
+
+    Returns
+    -------
+    fname : Path
+        The path to the difference image.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    write_image(directory / f"{name}-actual.png", actual)
+    write_image(directory / f"{name}-expected.png", expected)
+    if actual.shape != expected.shape:
+        return directory / f"{name}-actual.png"
+    diff = np.abs(actual[..., :3].astype(np.int16) - expected[..., :3].astype(np.int16))
+    diff = np.clip(diff * 10, 0, 255).astype(np.uint8)
+    alpha = np.full(diff.shape[:2] + (1,), 255, dtype=np.uint8)
+    fname = directory / f"{name}-diff.png"
+    write_image(fname, np.concatenate([diff, alpha], axis=2))
+    return fname
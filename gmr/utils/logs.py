@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-import inspect
 import logging
-from functools import wraps
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from contextvars import ContextVar
+from functools import cache, wraps
 from importlib import import_module
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import TYPE_CHECKING
 from warnings import warn_explicit
@@ -14,6 +19,7 @@ from ._fixes import WrapStdOut
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from queue import Queue
 
 
 _PACKAGE: str = __package__.split(".")[0]
@@ -42,10 +48,16 @@ def _init_logger(*, verbose: bool | str | int | None = None) -> logging.Logger:
     # add the main handler
     handler = logging.StreamHandler(WrapStdOut())
     handler.setFormatter(_LoggerFormatter())
+    handler.addFilter(_skip_stdout_filter)
     logger.addHandler(handler)
     return logger
 
 
+def _skip_stdout_filter(record: logging.LogRecord) -> bool:
+    """Filter out records already emitted on stdout, e.g. by warnings.warn."""
+    return not getattr(record, "skip_stdout", False)
+
+
 def add_file_handler(
     fname: str | Path,
     mode: str = "a",
@@ -73,13 +85,102 @@ def add_file_handler(
     -----
     Don't forget to close added file handlers by iterating on ``logger.handlers`` and
     calling ``handler.close()``.
+
+    If a log listener is running, see :func:`start_log_listener`, the file handler is
+    owned by the listener instead of the logger.
     """
     handler = logging.FileHandler(fname, mode, encoding)
     handler.setFormatter(_LoggerFormatter())
     if verbose is not None:
         verbose = ensure_verbose(verbose)
         handler.setLevel(verbose)
-    logger.addHandler(handler)
+    if _LISTENER is None:
+        logger.addHandler(handler)
+    else:
+        _LISTENER.handlers = (*_LISTENER.handlers, handler)
+
+
+# listener owning the handlers of the logger when logging through a queue
+_LISTENER: QueueListener | None = None
+
+
+def start_log_listener(queue: Queue | None = None) -> Queue:
+    """Route the logging of the parent and of its worker processes through a queue.
+
+    The handlers of the logger, i.e. the stdout handler and the file handlers, are
+    moved to a :class:`~logging.handlers.QueueListener` running in a thread of the
+    parent process. The logger of the parent and of each worker process, see
+    :func:`use_log_queue`, only put records on the queue. The records are thus written
+    by a single owner, without interleaving between processes, and logging never blocks
+    the workers on file I/O.
+
+    Parameters
+    ----------
+    queue : Queue | None
+        The queue to use. It must be shareable with the worker processes, e.g. created
+        from the same :mod:`multiprocessing` context as the workers. If None, a
+        :class:`multiprocessing.Queue` is created from the default context.
+
+    Returns
+    -------
+    queue : Queue
+        The queue consumed by the listener, to provide to :func:`use_log_queue` in the
+        initializer of the worker processes.
+    """
+    global _LISTENER
+
+    if _LISTENER is not None:
+        raise RuntimeError("The log listener is already running.")
+    queue = multiprocessing.Queue(-1) if queue is None else queue
+    handlers = list(logger.handlers)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    _LISTENER = QueueListener(queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    logger.addHandler(QueueHandler(queue))
+    return queue
+
+
+def stop_log_listener() -> None:
+    """Stop the log listener and give back its handlers to the logger.
+
+    The records already put on the queue are handled before the listener stops.
+    """
+    global _LISTENER
+
+    if _LISTENER is None:
+        raise RuntimeError("The log listener is not running.")
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        logger.addHandler(handler)
+    _LISTENER = None
+
+
+@fill_doc
+def use_log_queue(queue: Queue, *, verbose: bool | str | int | None = None) -> None:
+    """Send the logging of a worker process to the listener of the parent process.
+
+    The handlers of the logger of the worker are replaced by a single
+    :class:`~logging.handlers.QueueHandler`. This function is meant to be used as, or
+    called from, the initializer of the worker processes.
+
+    Parameters
+    ----------
+    queue : Queue
+        The queue returned by :func:`start_log_listener` in the parent process.
+    verbose : int | str | bool | None
+        The log level of the worker. The worker processes do not inherit the log
+        level of the parent process, thus provide the effective level of the parent,
+        e.g. ``logger.getEffectiveLevel()``, to keep it in the workers. If None, the
+        default log level is used.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(queue))
+    set_log_level(verbose)
 
 
 @fill_doc
@@ -178,6 +279,63 @@ class _use_log_level:  # noqa: N801
         set_log_level(self._old_level)
 
 
+class deduplicate_warnings:
+    """Context manager to emit each distinct warning once.
+
+    Within this context, :func:`warn` emits each distinct pair of message and
+    category only once, and counts the following occurrences. A summary of the
+    suppressed warnings is logged when exiting the context. This is useful for batch
+    workloads where the same warning would otherwise fire thousands of times.
+
+    Parameters
+    ----------
+    summary : bool
+        If True, log a summary of the suppressed warnings when exiting the context.
+
+    Attributes
+    ----------
+    suppressed : Counter
+        The number of suppressed occurrences per pair of message and category.
+    """
+
+    def __init__(self, summary: bool = True) -> None:
+        self._summary = summary
+        self._token = None
+        self.suppressed: Counter[tuple[str, type[Warning]]] = Counter()
+
+    def __enter__(self) -> deduplicate_warnings:
+        """Start the deduplication of warnings."""
+        self._token = _DEDUPLICATE_WARNINGS.set((set(), self.suppressed))
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop the deduplication of warnings and log the summary."""
+        _DEDUPLICATE_WARNINGS.reset(self._token)
+        if not self._summary or len(self.suppressed) == 0:
+            return None
+        n = sum(self.suppressed.values())
+        lines = [
+            f"  {count} x {category.__name__}: {message}"
+            for (message, category), count in self.suppressed.most_common()
+        ]
+        logger.warning("%i duplicate warning(s) suppressed:\n%s", n, "\n".join(lines))
+
+
+# (emitted, suppressed) when the deduplication of warnings is active in the context
+_DEDUPLICATE_WARNINGS: ContextVar[
+    tuple[set[tuple[str, type[Warning]]], Counter[tuple[str, type[Warning]]]] | None
+] = ContextVar("_DEDUPLICATE_WARNINGS", default=None)
+
+
+@cache
+def _root_dirs(ignore_namespaces: tuple[str, ...]) -> tuple[str, ...]:
+    """Get the root directories of the namespaces ignored in the stack."""
+    return tuple(
+        str(Path(import_module(namespace).__file__).parent)
+        for namespace in ignore_namespaces
+    )
+
+
 def warn(
     message: str,
     category: type[Warning] = RuntimeWarning,
@@ -205,20 +363,29 @@ def warn(
         The name of the module emitting the warning.
     ignore_namespaces : list of str | tuple of str
         Namespaces to ignore when traversing the stack.
+
+    Notes
+    -----
+    Within a :class:`deduplicate_warnings` context, each distinct pair of message and
+    category is emitted only once.
     """
     if logging.WARNING < logger.level:
         return None
-    root_dirs = [
-        Path(import_module(namespace).__file__).parent
-        for namespace in ignore_namespaces
-    ]
-    frame = inspect.currentframe()
+    deduplicated = _DEDUPLICATE_WARNINGS.get()
+    if deduplicated is not None:
+        emitted, suppressed = deduplicated
+        if (message, category) in emitted:
+            suppressed[(message, category)] += 1
+            return None
+        emitted.add((message, category))
+    root_dirs = _root_dirs(tuple(ignore_namespaces))
+    frame = sys._getframe()
     while frame:  # at some point it will be None and exit the loop
-        fname = Path(frame.f_code.co_filename)
-        if fname.parent.name == "tests":
+        fname = frame.f_code.co_filename
+        if os.path.basename(os.path.dirname(fname)) == "tests":
             break  # treat tests as outside of the namespace
         lineno = frame.f_lineno
-        if not (any(str(fname).startswith(str(rd)) for rd in root_dirs)):
+        if not fname.startswith(root_dirs):
             break
         frame = frame.f_back
     del frame
@@ -228,16 +395,14 @@ def warn(
     warn_explicit(
         message,
         category,
-        str(fname),
+        fname,
         lineno,
         module,
         globals().get("__warningregistry__", {}),
     )
     # now we emit the warning to the logger, except to the default StreamHandler on
-    # stdout registered as the first handler.
-    logger.handlers[0].setLevel(logging.WARNING + 1)
-    logger.warning(message)
-    logger.handlers[0].setLevel(0)
+    # stdout on which warnings.warn already printed the message.
+    logger.warning(message, extra=dict(skip_stdout=True))
 
 
 logger = _init_logger()
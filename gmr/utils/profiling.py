@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, NamedTuple
+
+from ._checks import check_type
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from matplotlib.figure import Figure
+
+
+class PhaseMemory(NamedTuple):
+    """The memory allocated during a render phase of a figure."""
+
+    figure: str
+    phase: str
+    size: int  # net size allocated during the phase, in bytes
+    peak: int  # peak of the size allocated during the phase, in bytes
+    top_sites: tuple[tuple[str, int, int], ...]  # (site, size, number of blocks)
+    n_artists: int  # number of artists on the axes of the figure after the phase
+    n_patches: int  # number of patches on the axes of the figure after the phase
+
+
+# profiler recording the render phases, None if the memory is not profiled
+_PROFILER: ContextVar[MemoryProfiler | None] = ContextVar("_PROFILER", default=None)
+
+
+class MemoryProfiler:
+    """Context manager profiling the memory of the render phases of the figures.
+
+    Within this context, a :mod:`tracemalloc` snapshot is taken around each render
+    phase of a figure: the title, the headers, the intervention column and each
+    engagement of a :class:`~gmr.figure.FigureGame`, and the rendering to an output
+    (``save``) of any figure. The phases are recorded in :attr:`phases`.
+
+    Parameters
+    ----------
+    n_sites : int
+        The number of top allocation sites recorded for each phase.
+
+    Notes
+    -----
+    The snapshots trace every allocation of the process, which slows down the rendering
+    significantly. The profiler should not be used in production.
+    """
+
+    def __init__(self, n_sites: int = 10) -> None:
+        check_type(n_sites, ("int-like",), "n_sites")
+        if n_sites <= 0:
+            raise ValueError(
+                f"The number of allocation sites must be strictly positive, got "
+                f"{n_sites}."
+            )
+        self._n_sites = n_sites
+        self._filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+        self.phases: list[PhaseMemory] = []
+
+    def __enter__(self) -> MemoryProfiler:
+        """Start tracing the memory allocations."""
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self._token = _PROFILER.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop tracing the memory allocations."""
+        _PROFILER.reset(self._token)
+        if self._started:
+            tracemalloc.stop()
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Take a snapshot, without the allocations of the profiler itself."""
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def report(self) -> str:
+        """Format the recorded phases.
+
+        Returns
+        -------
+        report : str
+            The size allocated, the peak, the artist and patch counts and the top
+            allocation sites of each recorded phase.
+        """
+        lines = []
+        for phase in self.phases:
+            lines.append(
+                f"{phase.figure} / {phase.phase}: {_format_size(phase.size)} allocated "
+                f"(peak {_format_size(phase.peak)}), {phase.n_artists} artists, "
+                f"{phase.n_patches} patches"
+            )
+            lines.extend(
+                f"    {_format_size(size):>10} in {count} block(s): {site}"
+                for site, size, count in phase.top_sites
+            )
+        return "\n".join(lines)
+
+
+@contextmanager
+def memory_phase(fig: Figure, figure: str, phase: str) -> Generator[None, None, None]:
+    """Record the memory of a render phase if the memory is profiled.
+
+    Parameters
+    ----------
+    fig : Figure
+        The matplotlib figure, of which the artists and patches are counted.
+    figure : str
+        The name of the figure.
+    phase : str
+        The name of the phase.
+    """
+    profiler = _PROFILER.get()
+    if profiler is None:
+        yield
+        return
+    before = profiler._snapshot()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    yield
+    peak = tracemalloc.get_traced_memory()[1]
+    stats = profiler._snapshot().compare_to(before, "lineno")
+    profiler.phases.append(
+        PhaseMemory(
+            figure=figure,
+            phase=phase,
+            size=sum(stat.size_diff for stat in stats),
+            peak=max(0, peak - current),
+            top_sites=tuple(
+                (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                for stat in stats[: profiler._n_sites]
+                if stat.size_diff != 0
+            ),
+            n_artists=sum(len(ax.get_children()) for ax in fig.axes),
+            n_patches=sum(len(ax.patches) for ax in fig.axes),
+        )
+    )
+
+
+def _format_size(size: int) -> str:
+    """Format a size in bytes."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -4,7 +4,15 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from .._checks import check_type, check_value, ensure_int, ensure_path, ensure_verbose
+from .._checks import (
+    _resolve_types,
+    check_type,
+    check_value,
+    ensure_int,
+    ensure_path,
+    ensure_verbose,
+    trusted_input,
+)
 
 
 def test_ensure_int():
@@ -38,6 +46,9 @@ def test_check_type():
     check_type((1, 0, 1), ("array-like",))
     check_type([1, 0, 1], ("array-like",))
     check_type(np.array([1, 0, 1]), ("array-like",))
+    check_type(np.int64(101), ("int-like",))
+    check_type(None, (None, "int-like"))
+    check_type(101, ["int-like", str])
 
     # invalids
     with pytest.raises(TypeError, match="Item must be an instance of"):
@@ -46,6 +57,23 @@ def test_check_type():
         check_type(101, ("array-like",))
     with pytest.raises(TypeError, match="'number' must be an instance of"):
         check_type(101, (float,), "number")
+    with pytest.raises(TypeError, match="must be an instance of int-like"):
+        check_type(True, ("int-like",))
+    with pytest.raises(TypeError, match="must be an instance of int-like"):
+        check_type(np.bool_(True), ("int-like",))
+    with pytest.raises(TypeError, match="int-like, str, or None"):
+        check_type(101.0, ("int-like", str, None))
+
+
+def test_check_type_cache():
+    """Test that the accepted types are resolved once per tuple of types."""
+    _resolve_types.cache_clear()
+    for _ in range(5):
+        check_type(101, ("numeric",))
+        check_type("101", (str, None))
+    info = _resolve_types.cache_info()
+    assert info.misses == 2
+    assert info.hits == 8
 
 
 def test_check_value():
@@ -63,6 +91,21 @@ def test_check_value():
         check_value(5, [1, 2, 3, 4], "number")
 
 
+def test_trusted_input():
+    """Test skipping the validation of trusted inputs."""
+    with trusted_input():
+        check_type(101, (str,))
+        check_value(5, [1, 2, 3, 4])
+        with trusted_input(False):
+            with pytest.raises(TypeError, match="must be an instance of"):
+                check_type(101, (str,))
+        check_type(101, (str,))
+    with pytest.raises(TypeError, match="must be an instance of"):
+        check_type(101, (str,))
+    with pytest.raises(ValueError, match="Invalid value"):
+        check_value(5, [1, 2, 3, 4])
+
+
 def test_ensure_verbose():
     """Test ensure_verbose checker."""
     # valids
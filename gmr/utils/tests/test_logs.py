@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import Context
+from functools import partial
+from logging.handlers import QueueHandler
 from typing import TYPE_CHECKING
 
 import pytest
 
-from ..logs import _use_log_level, add_file_handler, logger, verbose, warn
+from ..logs import (
+    _root_dirs,
+    _use_log_level,
+    add_file_handler,
+    deduplicate_warnings,
+    logger,
+    start_log_listener,
+    stop_log_listener,
+    use_log_queue,
+    verbose,
+    warn,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -160,3 +177,101 @@ def test_warn(tmp_path: Path):
         lines = file.readlines()
     assert len(lines) == 1
     assert "Grrrrr" in lines[0]
+
+
+def test_warn_root_dirs_cache():
+    """Test that the ignored namespaces are resolved once."""
+    _root_dirs.cache_clear()
+    for _ in range(3):
+        with pytest.warns(RuntimeWarning, match="Grrrrr"):
+            warn("Grrrrr", RuntimeWarning)
+    assert _root_dirs.cache_info().misses == 1
+    assert _root_dirs.cache_info().hits == 2
+    assert logger.handlers[0].level == 0
+
+
+def test_deduplicate_warnings(caplog: pytest.LogCaptureFixture):
+    """Test the deduplication of warnings."""
+    caplog.clear()
+    with (
+        _use_log_level("WARNING"),
+        warnings.catch_warnings(record=True) as record,
+        deduplicate_warnings() as dedup,
+    ):
+        warnings.simplefilter("always")
+        for _ in range(5):
+            warn("Grrrrr", RuntimeWarning)
+            warn("WoooW", RuntimeWarning)
+        warn("Grrrrr", UserWarning)
+    assert len(record) == 3
+    assert dedup.suppressed[("Grrrrr", RuntimeWarning)] == 4
+    assert dedup.suppressed[("WoooW", RuntimeWarning)] == 4
+    assert ("Grrrrr", UserWarning) not in dedup.suppressed
+    assert "8 duplicate warning(s) suppressed" in caplog.text
+    assert "4 x RuntimeWarning: Grrrrr" in caplog.text
+    # outside of the context, warnings are emitted again
+    with pytest.warns(RuntimeWarning, match="Grrrrr"):
+        warn("Grrrrr", RuntimeWarning)
+    # the deduplication is bound to the context, e.g. of a thread or a task
+    with (
+        _use_log_level("WARNING"),
+        warnings.catch_warnings(record=True) as record,
+        deduplicate_warnings(summary=False) as dedup,
+    ):
+        warnings.simplefilter("always")
+        for _ in range(2):
+            Context().run(warn, "Grrrrr", RuntimeWarning)
+    assert len(record) == 2
+    assert len(dedup.suppressed) == 0
+
+
+def _log_from_worker(k: int) -> None:
+    """Log a record from a worker process."""
+    logger.warning("worker %i", k)
+
+
+def _get_log_level() -> int:
+    """Get the log level of a worker process."""
+    return logger.level
+
+
+def test_log_listener(tmp_path: Path):
+    """Test logging from worker processes through a queue."""
+    fname = tmp_path / "logs.txt"
+    n_handlers = len(logger.handlers)
+    ctx = multiprocessing.get_context("spawn")
+    queue = start_log_listener(ctx.Queue())
+    try:
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], QueueHandler)
+        with pytest.raises(RuntimeError, match="already running"):
+            start_log_listener()
+        add_file_handler(fname)  # owned by the listener
+        assert len(logger.handlers) == 1
+        with ProcessPoolExecutor(
+            2, mp_context=ctx, initializer=use_log_queue, initargs=(queue,)
+        ) as executor:
+            list(executor.map(_log_from_worker, range(4)))
+        logger.warning("parent")
+        # the workers use the log level provided to the initializer
+        with _use_log_level("DEBUG"):
+            initializer = partial(use_log_queue, verbose=logger.getEffectiveLevel())
+            with ProcessPoolExecutor(
+                1, mp_context=ctx, initializer=initializer, initargs=(queue,)
+            ) as executor:
+                assert executor.submit(_get_log_level).result() == logging.DEBUG
+    finally:
+        stop_log_listener()
+    with pytest.raises(RuntimeError, match="not running"):
+        stop_log_listener()
+    assert len(logger.handlers) == n_handlers + 1
+    assert not any(isinstance(handler, QueueHandler) for handler in logger.handlers)
+    logger.handlers[-1].close()
+    logger.removeHandler(logger.handlers[-1])
+    with open(fname) as file:
+        lines = file.readlines()
+    assert len(lines) == 5
+    assert sorted(line.split("WARNING: ")[1].strip() for line in lines[:4]) == [
+        f"worker {k}" for k in range(4)
+    ]
+    assert "parent" in lines[4]
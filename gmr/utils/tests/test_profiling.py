@@ -0,0 +1,44 @@
+import tracemalloc
+
+import pytest
+
+from ...figure import FigureGame
+from ..profiling import MemoryProfiler
+
+
+@pytest.mark.parametrize("layout", ["tree", "graph"])
+def test_memory_profiler(game, layout):
+    """Test the memory profiling of the render phases."""
+    with pytest.raises(ValueError, match="strictly positive"):
+        MemoryProfiler(n_sites=0)
+    figure = FigureGame(game["name"], figsize=(8, 6), layout=layout)
+    with MemoryProfiler(n_sites=3) as profiler:
+        assert tracemalloc.is_tracing()
+        figure.draw(game["intervention_types"], game["engagements"])
+        figure.to_bytes()
+    assert not tracemalloc.is_tracing()
+    phases = [phase.phase for phase in profiler.phases]
+    assert phases == [
+        "title",
+        "headers",
+        "intervention",
+        "engagement 'Cognitive'",
+        "engagement 'Affective'",
+        *(["design principles"] if layout == "graph" else []),
+        "save",
+    ]
+    for phase in profiler.phases:
+        assert phase.figure == game["name"]
+        assert 0 <= phase.peak
+        assert len(phase.top_sites) <= 3
+    # the artists accumulate on the axes
+    n_patches = [phase.n_patches for phase in profiler.phases]
+    assert n_patches == sorted(n_patches)
+    assert 0 < n_patches[0]
+    report = profiler.report()
+    assert "Tetris / engagement 'Cognitive'" in report
+    assert "patches" in report
+    # outside of the context, nothing is recorded
+    figure.to_bytes()
+    assert len(profiler.phases) == len(phases)
+    figure.close()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from .._testing import compare_images, read_image, write_diff_images, write_image
+
+
+def test_compare_images(tmp_path):
+    """Test the comparison of rendered images."""
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(20, 30, 4), dtype=np.uint8)
+    diff = compare_images(image, image.copy())
+    assert diff.rms == 0
+    assert diff.channel_max == (0, 0, 0, 0)
+    assert diff.n_pixels == 0
+    other = image.copy()
+    other[0, 0, 0] = 255 - image[0, 0, 0] if image[0, 0, 0] != 127 else 0
+    other[5, :, 2] ^= 0x01
+    diff = compare_images(other, image)
+    assert diff.channel_max[0] == abs(int(other[0, 0, 0]) - int(image[0, 0, 0]))
+    assert diff.channel_max[1] == diff.channel_max[3] == 0
+    assert diff.channel_max[2] == 1
+    assert diff.n_pixels == 30 + (1 if other[0, 0, 2] == image[0, 0, 2] else 0)
+    expected = np.sqrt(
+        np.mean((other.astype(float) - image.astype(float)) ** 2, axis=(0, 1))
+    )
+    assert np.allclose(diff.channel_rms, expected)
+    assert diff.rms == pytest.approx(np.sqrt(np.mean(expected**2)))
+    with pytest.raises(ValueError, match="same shape"):
+        compare_images(image, image[:10])
+    with pytest.raises(ValueError, match="must be RGBA"):
+        compare_images(image[..., :3], image[..., :3])
+    # round-trip through PNG is lossless
+    write_image(tmp_path / "image.png", image)
+    assert np.array_equal(read_image(tmp_path / "image.png"), image)
+    fname = write_diff_images(tmp_path / "failed", "image", other, image)
+    assert fname.name == "image-diff.png"
+    assert read_image(fname)[5, 0, 2] == 10
+    assert (tmp_path / "failed" / "image-expected.png").exists()
@@ -0,0 +1,90 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ...figure import FigureGame
+from ..tracing import TraceRecorder, merge_traces, span
+
+
+def _render(game):
+    """Render a game in a worker process and return its trace events."""
+    with TraceRecorder() as recorder:
+        figure = FigureGame(game["name"], figsize=(6, 4), draft=True)
+        figure.draw(game["intervention_types"], game["engagements"])
+        figure.to_bytes()
+        figure.close()
+    return recorder.events
+
+
+def test_trace_recorder(tmp_path, game):
+    """Test recording the spans of the render pipeline."""
+    with pytest.raises(ValueError, match="saved as JSON"):
+        TraceRecorder(tmp_path / "trace.txt")
+    fname = tmp_path / "trace.json"
+    with TraceRecorder(fname) as recorder:
+        events = _render(game)
+        with span("custom", key="value"):
+            pass
+    # the inner recorder does not leak its events to the outer one
+    names = [event["name"] for event in recorder.events if event["ph"] == "X"]
+    assert names == ["custom"]
+    assert recorder.events[-1]["args"] == {"key": "value"}
+    names = [event["name"] for event in events if event["ph"] == "X"]
+    for name in ("validate", "measure box", "draw engagement", "link", "save"):
+        assert name in names
+    assert names[-1] == "encode"  # the encoding ends last, after the nested save
+    engagements = [
+        event["args"]["engagement"]
+        for event in events
+        if event["name"] == "draw engagement"
+    ]
+    assert engagements == ["Cognitive", "Affective"]
+    for event in events:
+        assert event["pid"] == os.getpid()
+        if event["ph"] == "X":
+            assert 0 <= event["dur"]
+    assert [event["name"] for event in events if event["ph"] == "M"] == [
+        "process_name",
+        "thread_name",
+    ]
+    # the trace is written when exiting the context
+    with open(fname) as file:
+        content = json.load(file)
+    assert content["traceEvents"] == recorder.events
+    with pytest.raises(FileExistsError, match="already exists"):
+        recorder.save(fname)
+    # nothing is recorded outside of the context
+    with span("outside"):
+        pass
+    assert recorder.events == content["traceEvents"]
+
+
+def test_trace_worker_processes(tmp_path, games):
+    """Test merging the spans recorded by worker processes in a single timeline."""
+    with TraceRecorder() as recorder:
+        with span("batch"):
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                for events in executor.map(_render, games):
+                    recorder.add_events(events)
+    events = recorder.events
+    pids = {event["pid"] for event in events}
+    assert os.getpid() in pids
+    assert 2 <= len(pids)
+    # one process name per process
+    process_names = [event for event in events if event["name"] == "process_name"]
+    assert len(process_names) == len(pids)
+    assert sum(event["name"] == "validate" for event in events) == len(games)
+    # merge traces written by each process
+    fnames = []
+    for k, game in enumerate(games):
+        worker = TraceRecorder()
+        worker.add_events(_render(game))
+        fnames.append(tmp_path / f"worker{k}.json")
+        worker.save(fnames[-1])
+    merge_traces(fnames, tmp_path / "merged.json")
+    with open(tmp_path / "merged.json") as file:
+        merged = json.load(file)["traceEvents"]
+    assert sum(event["name"] == "encode" for event in merged) == len(games)
+    assert sum(event["name"] == "thread_name" for event in merged) == 1
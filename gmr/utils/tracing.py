@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING
+
+from ._checks import check_type, ensure_path
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+    from pathlib import Path
+    from typing import Any
+
+
+# recorder of the spans, None if the render pipeline is not traced
+_TRACER: ContextVar[TraceRecorder | None] = ContextVar("_TRACER", default=None)
+
+
+class TraceRecorder:
+    """Context manager recording the spans of the render pipeline as trace events.
+
+    Within this context, the steps of the render pipeline (``load spec``,
+    ``validate``, ``measure box``, ``draw engagement``, ``link``, ``render``, ``save``
+    and ``encode``) are recorded as complete events in the Chrome trace-event format,
+    with the identifiers of the process and thread which ran them. The trace can be
+    written to a JSON file viewable in Perfetto or ``chrome://tracing``.
+
+    Parameters
+    ----------
+    fname : str | Path | None
+        If provided, path to the ``.json`` file to which the trace is written when
+        exiting the context.
+
+    Notes
+    -----
+    The timestamps are taken from the wall clock, shared by all the processes of the
+    machine. To merge the timelines of worker processes, each worker records its spans
+    in its own recorder and sends its :attr:`events` back to the parent, which adds
+    them with :meth:`add_events`. Alternatively, the traces written by each process
+    can be merged with :func:`merge_traces`.
+    """
+
+    def __init__(self, fname: str | Path | None = None) -> None:
+        if fname is not None:
+            fname = ensure_path(fname, must_exist=False)
+            if fname.suffix != ".json":
+                raise ValueError(
+                    f"The trace must be saved as JSON, got '{fname.suffix}'."
+                )
+        self._fname = fname
+        self._events: list[dict[str, Any]] = []
+        # (name, pid, tid) of the metadata events naming the processes and threads
+        self._metadata: set[tuple[str, int, int]] = set()
+
+    def __enter__(self) -> TraceRecorder:
+        """Start recording the spans."""
+        self._token = _TRACER.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop recording the spans and write the trace if a file was provided."""
+        _TRACER.reset(self._token)
+        if self._fname is not None:
+            self.save(self._fname, overwrite=True)
+
+    def _record(
+        self, name: str, start: int, stop: int, args: dict[str, Any] | None
+    ) -> None:
+        """Record a complete event, with timestamps in nanoseconds."""
+        pid = os.getpid()
+        tid = threading.get_native_id()
+        if ("thread_name", pid, tid) not in self._metadata:
+            self.add_events(
+                (
+                    _metadata(
+                        "process_name", pid, tid, multiprocessing.current_process()
+                    ),
+                    _metadata("thread_name", pid, tid, threading.current_thread()),
+                )
+            )
+        event = {
+            "name": name,
+            "cat": "gmr",
+            "ph": "X",
+            "ts": start / 1e3,
+            "dur": (stop - start) / 1e3,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    def add_events(self, events: Iterable[dict[str, Any]]) -> None:
+        """Add the events recorded by another recorder, e.g. in a worker process.
+
+        Parameters
+        ----------
+        events : iterable of dict
+            The trace events, see :attr:`events`.
+        """
+        for event in events:
+            check_type(event, (dict,), "event")
+            if event["ph"] == "M":
+                key = (event["name"], event["pid"], event["tid"])
+                if key in self._metadata:
+                    continue
+                self._metadata.add(key)
+            self._events.append(event)
+
+    def save(self, fname: str | Path, *, overwrite: bool = False) -> None:
+        """Write the trace in the Chrome trace-event JSON format.
+
+        Parameters
+        ----------
+        fname : str | Path
+            Path to the ``.json`` file.
+        overwrite : bool
+            If True, overwrite an existing file.
+        """
+        fname = ensure_path(fname, must_exist=False)
+        check_type(overwrite, (bool,), "overwrite")
+        if fname.suffix != ".json":
+            raise ValueError(f"The trace must be saved as JSON, got '{fname.suffix}'.")
+        if fname.exists() and not overwrite:
+            raise FileExistsError(
+                f"The file '{fname}' already exists. Set 'overwrite' to True to "
+                "replace it."
+            )
+        with open(fname, "w", encoding="utf-8") as file:
+            json.dump(
+                {"traceEvents": self._events, "displayTimeUnit": "ms"},
+                file,
+                separators=(",", ":"),
+            )
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        """The recorded trace events."""
+        return list(self._events)
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Generator[None, None, None]:
+    """Record a span of the render pipeline if it is traced.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span.
+    **args : Any
+        Additional JSON-serializable information displayed with the span.
+    """
+    recorder = _TRACER.get()
+    if recorder is None:
+        yield
+        return
+    start = time.time_ns()
+    try:
+        yield
+    finally:
+        recorder._record(name, start, time.time_ns(), args)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Decorate a function to record each call as a span if the pipeline is traced.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span.
+
+    Returns
+    -------
+    decorator : callable
+        The decorator.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            recorder = _TRACER.get()
+            if recorder is None:
+                return f(*args, **kwargs)
+            start = time.time_ns()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                recorder._record(name, start, time.time_ns(), None)
+
+        return wrapper
+
+    return decorator
+
+
+def merge_traces(
+    fnames: Iterable[str | Path], fname: str | Path, *, overwrite: bool = False
+) -> None:
+    """Merge the traces written by several processes into a single timeline.
+
+    Parameters
+    ----------
+    fnames : iterable of str | Path
+        Paths to the ``.json`` traces to merge.
+    fname : str | Path
+        Path to the merged ``.json`` trace.
+    overwrite : bool
+        If True, overwrite an existing file.
+    """
+    recorder = TraceRecorder()
+    for elt in fnames:
+        elt = ensure_path(elt, must_exist=True)
+        with open(elt, encoding="utf-8") as file:
+            recorder.add_events(json.load(file)["traceEvents"])
+    recorder.save(fname, overwrite=overwrite)
+
+
+def _metadata(name: str, pid: int, tid: int, owner: Any) -> dict[str, Any]:
+    """Create the metadata event naming a process or a thread."""
+    return {
+        "name": name,
+        "ph": "M",
+        "pid": pid,
+        "tid": tid,
+        "args": {"name": f"{owner.name} ({pid if name == 'process_name' else tid})"},
+    }